@@ -0,0 +1,161 @@
+"""
+DB 커넥션 풀 설정과 지표 (Prometheus).
+
+p99 가 오를 때 풀 대기인지 MySQL 자체 지연인지 구분할 수 있도록 체크아웃 대기 시간,
+체크아웃 중인 연결 수, overflow 사용량, 무효화(invalidate) 횟수를 풀 이름별로 기록합니다.
+
+pre-ping 전략 (DB_POOL_PRE_PING):
+- always: 체크아웃마다 ping (SQLAlchemy pool_pre_ping, 매번 왕복 1회 추가)
+- idle:   DB_POOL_PRE_PING_IDLE_SECONDS 이상 반납 상태였던 연결만 ping
+- off:    ping 하지 않음 (끊긴 연결은 첫 쿼리 오류 후 무효화)
+"""
+import time
+
+from prometheus_client import Counter, Gauge, Histogram
+from sqlalchemy import event, exc
+from sqlalchemy.engine import Engine
+from sqlalchemy.pool import AsyncAdaptedQueuePool, QueuePool
+
+from moodping.config.settings import Settings
+
+PRE_PING_ALWAYS = "always"
+PRE_PING_IDLE = "idle"
+PRE_PING_OFF = "off"
+
+_WAIT_BUCKETS = (0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+_HOLD_BUCKETS = (0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0)
+
+DB_POOL_CHECKOUT_WAIT = Histogram(
+    "moodping_db_pool_checkout_wait_seconds",
+    "풀에서 연결을 받기까지 기다린 시간 (새 연결 생성 포함)",
+    ["pool"],
+    buckets=_WAIT_BUCKETS,
+)
+DB_POOL_HOLD = Histogram(
+    "moodping_db_pool_connection_hold_seconds",
+    "체크아웃부터 반납까지 연결을 점유한 시간",
+    ["pool"],
+    buckets=_HOLD_BUCKETS,
+)
+DB_POOL_CHECKOUT_TIMEOUTS = Counter(
+    "moodping_db_pool_checkout_timeouts_total",
+    "DB_POOL_TIMEOUT_SECONDS 안에 연결을 받지 못한 횟수",
+    ["pool"],
+)
+DB_POOL_CONNECTS = Counter(
+    "moodping_db_pool_connects_total",
+    "새로 맺은 DB 연결 수",
+    ["pool"],
+)
+DB_POOL_INVALIDATIONS = Counter(
+    "moodping_db_pool_invalidations_total",
+    "무효화된 연결 수 (kind: hard | soft)",
+    ["pool", "kind"],
+)
+DB_POOL_PRE_PING_FAILURES = Counter(
+    "moodping_db_pool_pre_ping_failures_total",
+    "idle pre-ping 에 실패해 교체된 연결 수",
+    ["pool"],
+)
+DB_POOL_CHECKED_OUT = Gauge(
+    "moodping_db_pool_checked_out",
+    "현재 체크아웃 중인 연결 수",
+    ["pool"],
+)
+DB_POOL_OVERFLOW = Gauge(
+    "moodping_db_pool_overflow_in_use",
+    "pool_size 를 넘어 사용 중인 overflow 연결 수",
+    ["pool"],
+)
+DB_POOL_SIZE = Gauge(
+    "moodping_db_pool_size",
+    "설정된 pool_size",
+    ["pool"],
+)
+
+_CHECKED_OUT_AT = "moodping_checked_out_at"
+_CHECKED_IN_AT = "moodping_checked_in_at"
+
+
+class _TimedCheckoutMixin:
+    """체크아웃 대기 시간과 타임아웃을 기록합니다. 풀 이름은 pool_logging_name 을 사용합니다."""
+
+    def _do_get(self):
+        pool_name = getattr(self, "logging_name", None) or "default"
+        started = time.perf_counter()
+        try:
+            return super()._do_get()
+        except exc.TimeoutError:
+            DB_POOL_CHECKOUT_TIMEOUTS.labels(pool_name).inc()
+            raise
+        finally:
+            DB_POOL_CHECKOUT_WAIT.labels(pool_name).observe(time.perf_counter() - started)
+
+
+class InstrumentedQueuePool(_TimedCheckoutMixin, QueuePool):
+    pass
+
+
+class InstrumentedAsyncAdaptedQueuePool(_TimedCheckoutMixin, AsyncAdaptedQueuePool):
+    pass
+
+
+def pool_options(settings: Settings, pool_name: str, is_async: bool = False) -> dict:
+    """create_engine / create_async_engine 에 넘길 풀 관련 인자."""
+    if settings.db_pool_pre_ping not in (PRE_PING_ALWAYS, PRE_PING_IDLE, PRE_PING_OFF):
+        raise ValueError(f"지원하지 않는 DB_POOL_PRE_PING 값입니다: {settings.db_pool_pre_ping}")
+    return {
+        "poolclass": InstrumentedAsyncAdaptedQueuePool if is_async else InstrumentedQueuePool,
+        "pool_size": settings.db_pool_size,
+        "max_overflow": settings.db_pool_max_overflow,
+        "pool_timeout": settings.db_pool_timeout_seconds,
+        "pool_recycle": settings.db_pool_recycle_seconds,
+        "pool_pre_ping": settings.db_pool_pre_ping == PRE_PING_ALWAYS,
+        "pool_logging_name": pool_name,
+    }
+
+
+def instrument_pool(engine: Engine, settings: Settings, pool_name: str) -> None:
+    """
+    풀 이벤트로 연결 점유·무효화를 기록하고 idle pre-ping 을 적용합니다.
+    async 엔진은 AsyncEngine.sync_engine 을 넘깁니다. 이벤트는 dispose() 로 재생성된 풀에도 유지됩니다.
+    """
+    pre_ping_idle = settings.db_pool_pre_ping == PRE_PING_IDLE
+    idle_seconds = settings.db_pool_pre_ping_idle_seconds
+
+    DB_POOL_SIZE.labels(pool_name).set(settings.db_pool_size)
+    DB_POOL_CHECKED_OUT.labels(pool_name).set_function(lambda: engine.pool.checkedout())
+    DB_POOL_OVERFLOW.labels(pool_name).set_function(lambda: max(engine.pool.overflow(), 0))
+
+    @event.listens_for(engine, "connect")
+    def _on_connect(dbapi_connection, connection_record):
+        DB_POOL_CONNECTS.labels(pool_name).inc()
+
+    @event.listens_for(engine, "checkout")
+    def _on_checkout(dbapi_connection, connection_record, connection_proxy):
+        now = time.monotonic()
+        checked_in_at = connection_record.info.get(_CHECKED_IN_AT)
+        if pre_ping_idle and checked_in_at is not None and now - checked_in_at >= idle_seconds:
+            try:
+                engine.dialect.do_ping(dbapi_connection)
+            except Exception:
+                DB_POOL_PRE_PING_FAILURES.labels(pool_name).inc()
+                # 풀이 이 연결을 무효화하고 새 연결로 체크아웃을 재시도합니다.
+                raise exc.DisconnectionError()
+        connection_record.info[_CHECKED_OUT_AT] = now
+
+    @event.listens_for(engine, "checkin")
+    def _on_checkin(dbapi_connection, connection_record):
+        now = time.monotonic()
+        checked_out_at = connection_record.info.pop(_CHECKED_OUT_AT, None)
+        if checked_out_at is not None:
+            DB_POOL_HOLD.labels(pool_name).observe(now - checked_out_at)
+        connection_record.info[_CHECKED_IN_AT] = now
+
+    @event.listens_for(engine, "invalidate")
+    def _on_invalidate(dbapi_connection, connection_record, exception):
+        DB_POOL_INVALIDATIONS.labels(pool_name, "hard").inc()
+
+    @event.listens_for(engine, "soft_invalidate")
+    def _on_soft_invalidate(dbapi_connection, connection_record, exception):
+        DB_POOL_INVALIDATIONS.labels(pool_name, "soft").inc()
@@ -1,17 +1,75 @@
 from sqlalchemy import create_engine
-from sqlalchemy.orm import sessionmaker, DeclarativeBase
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy.orm import Session, sessionmaker, DeclarativeBase
+from .db_pool import instrument_pool, pool_options
+from .read_replica import use_replica
 from .settings import get_settings
 
 settings = get_settings()
 
+# 풀 크기·overflow·대기 상한·pre-ping 전략·재생성 주기는 Settings(DB_POOL_*)로 조정합니다.
 engine = create_engine(
     settings.database_url,
-    pool_pre_ping=True,       # 연결 유효성 자동 확인
-    pool_recycle=3600,        # 1시간마다 연결 재생성 (MySQL 8h timeout 대비)
     echo=False,
+    **pool_options(settings, "sync"),
 )
+instrument_pool(engine, settings, "sync")
 
-SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+# async 라우트·분석 워커용 엔진. 이벤트 루프 안에서 동기 드라이버로 DB 를 기다리면
+# 같은 워커의 다른 요청(LLM 대기 포함)이 모두 멈추므로 aiomysql 로 await 합니다.
+async_engine = create_async_engine(
+    settings.async_database_url,
+    echo=False,
+    **pool_options(settings, "async", is_async=True),
+)
+instrument_pool(async_engine.sync_engine, settings, "async")
+
+# 읽기 전용 복제본 (DB_REPLICA_HOST 가 비어 있으면 None). 분석용 스캔이 기록 INSERT 와 primary 를 다투지 않게 합니다.
+replica_engine = None
+replica_async_engine = None
+if settings.replica_database_url:
+    replica_engine = create_engine(
+        settings.replica_database_url,
+        echo=False,
+        **pool_options(settings, "replica_sync"),
+    )
+    instrument_pool(replica_engine, settings, "replica_sync")
+    replica_async_engine = create_async_engine(
+        settings.replica_async_database_url,
+        echo=False,
+        **pool_options(settings, "replica_async", is_async=True),
+    )
+    instrument_pool(replica_async_engine.sync_engine, settings, "replica_async")
+
+
+class RoutingSession(Session):
+    """@replica_read 메서드 안의 조회만 복제본으로 보내고, flush(쓰기)는 항상 primary 로 보냅니다."""
+
+    def get_bind(self, mapper=None, clause=None, **kw):
+        if replica_engine is not None and not self._flushing and use_replica():
+            return replica_engine
+        return engine
+
+
+class AsyncRoutingSession(Session):
+    """AsyncSession 의 sync_session_class. 라우팅 규칙은 RoutingSession 과 같습니다."""
+
+    def get_bind(self, mapper=None, clause=None, **kw):
+        if replica_async_engine is not None and not self._flushing and use_replica():
+            return replica_async_engine.sync_engine
+        return async_engine.sync_engine
+
+
+# commit 후 refresh 왕복 없이 엔터티 속성을 읽을 수 있도록 만료시키지 않습니다.
+SessionLocal = sessionmaker(class_=RoutingSession, autocommit=False, autoflush=False, expire_on_commit=False)
+
+# async 에서는 지연 로딩이 불가하므로 마찬가지로 commit 후 만료시키지 않습니다.
+AsyncSessionLocal = async_sessionmaker(
+    class_=AsyncSession,
+    sync_session_class=AsyncRoutingSession,
+    autoflush=False,
+    expire_on_commit=False,
+)
 
 
 class Base(DeclarativeBase):
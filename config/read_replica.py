@@ -0,0 +1,217 @@
+"""
+읽기 전용 복제본 라우팅.
+
+@replica_read 로 표시한 서비스 메서드 안의 SELECT 만 복제본 풀로 보내고(라우팅 세션의 get_bind),
+아래 경우에는 primary 에서 읽습니다.
+- 복제본이 설정되지 않았거나, 지연 검사에 실패했거나, 지연이 DB_REPLICA_MAX_LAG_SECONDS 를 넘은 경우
+- read-your-writes: 이번 요청에서 쓰기를 했거나, 최근 쓰기 후 DB_READ_YOUR_WRITES_SECONDS 가 지나지 않은 경우
+  (쓰기가 있었던 요청의 응답에 쿠키로 만료 시각을 실어 보내므로 다른 워커 프로세스로 가도 유지됩니다)
+"""
+import asyncio
+import functools
+import inspect
+import logging
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+
+from prometheus_client import Counter, Gauge
+from sqlalchemy import exc
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+from moodping.config.settings import get_settings
+
+logger = logging.getLogger(__name__)
+
+READ_YOUR_WRITES_COOKIE = "mp_rw_until"
+
+DB_READ_ROUTING = Counter(
+    "moodping_db_read_routing_total",
+    "읽기 전용 쿼리 라우팅 결과 (reason: replica | read_your_writes | replica_unavailable | replica_lagging)",
+    ["target", "reason"],
+)
+DB_REPLICA_LAG = Gauge(
+    "moodping_db_replica_lag_seconds",
+    "마지막으로 측정한 복제 지연 (측정 실패 시 -1)",
+)
+DB_REPLICA_USABLE = Gauge(
+    "moodping_db_replica_usable",
+    "복제본으로 읽기를 보낼 수 있는지 (1 | 0)",
+)
+
+_read_only: ContextVar[bool] = ContextVar("moodping_read_only", default=False)
+_request_state: ContextVar["ReadYourWritesState | None"] = ContextVar("moodping_read_your_writes", default=None)
+
+
+class ReadYourWritesState:
+    """요청 하나의 read-your-writes 상태. 미들웨어가 만들고 서비스가 쓰기 시 wrote 를 표시합니다."""
+
+    def __init__(self, primary_until: float = 0.0):
+        self.primary_until = primary_until
+        self.wrote = False
+
+    @classmethod
+    def from_cookie(cls, value: str | None) -> "ReadYourWritesState":
+        try:
+            return cls(primary_until=float(value)) if value else cls()
+        except ValueError:
+            return cls()
+
+    def must_read_primary(self) -> bool:
+        return self.wrote or time.time() < self.primary_until
+
+
+@contextmanager
+def read_your_writes_scope(cookie_value: str | None):
+    state = ReadYourWritesState.from_cookie(cookie_value)
+    token = _request_state.set(state)
+    try:
+        yield state
+    finally:
+        _request_state.reset(token)
+
+
+def mark_write() -> None:
+    """사용자 본인의 쓰기를 쌓았음을 표시합니다. 이후 읽기는 복제 지연과 무관하게 primary 로 갑니다."""
+    state = _request_state.get()
+    if state is not None:
+        state.wrote = True
+
+
+def replica_read(func):
+    """이 메서드 안의 조회는 복제본으로 보내도 됨을 표시합니다 (동기·async 모두 지원)."""
+    if inspect.iscoroutinefunction(func):
+        @functools.wraps(func)
+        async def async_wrapper(*args, **kwargs):
+            token = _read_only.set(True)
+            try:
+                return await func(*args, **kwargs)
+            except exc.DBAPIError:
+                ReplicaLagMonitor.get_instance().mark_failed_if_routed()
+                raise
+            finally:
+                _read_only.reset(token)
+        return async_wrapper
+
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        token = _read_only.set(True)
+        try:
+            return func(*args, **kwargs)
+        except exc.DBAPIError:
+            ReplicaLagMonitor.get_instance().mark_failed_if_routed()
+            raise
+        finally:
+            _read_only.reset(token)
+    return wrapper
+
+
+def use_replica() -> bool:
+    """라우팅 세션의 get_bind 에서 호출합니다. 복제본이 설정된 경우에만 호출됩니다."""
+    if not _read_only.get():
+        return False
+    state = _request_state.get()
+    if state is not None and state.must_read_primary():
+        DB_READ_ROUTING.labels("primary", "read_your_writes").inc()
+        return False
+    reason = ReplicaLagMonitor.get_instance().unusable_reason()
+    if reason is not None:
+        DB_READ_ROUTING.labels("primary", reason).inc()
+        return False
+    DB_READ_ROUTING.labels("replica", "replica").inc()
+    return True
+
+
+class ReplicaLagMonitor:
+    """
+    주기적으로 복제 지연(Seconds_Behind_Source)을 측정해 복제본 사용 가능 여부를 갱신합니다.
+    첫 측정 전이나 측정 실패 시에는 primary 로 폴백합니다.
+    """
+    __instance = None
+
+    def __new__(cls):
+        if cls.__instance is None:
+            cls.__instance = super().__new__(cls)
+        return cls.__instance
+
+    @classmethod
+    def get_instance(cls) -> "ReplicaLagMonitor":
+        if cls.__instance is None:
+            cls.__instance = cls()
+        return cls.__instance
+
+    def __init__(self) -> None:
+        if hasattr(self, "_initialized"):
+            return
+        self._initialized = True
+        self._task: asyncio.Task | None = None
+        self._available = False
+        self._lag_seconds: float | None = None
+        DB_REPLICA_USABLE.set(0)
+
+    def start(self, replica_engine: AsyncEngine | None) -> None:
+        if replica_engine is None or self._task is not None:
+            return
+        self._task = asyncio.create_task(self._run(replica_engine), name="replica-lag-monitor")
+        logger.info("복제본 지연 감시 시작")
+
+    async def stop(self) -> None:
+        if self._task is None:
+            return
+        self._task.cancel()
+        await asyncio.gather(self._task, return_exceptions=True)
+        self._task = None
+
+    def unusable_reason(self) -> str | None:
+        if not self._available:
+            return "replica_unavailable"
+        if self._lag_seconds is None or self._lag_seconds > get_settings().db_replica_max_lag_seconds:
+            return "replica_lagging"
+        return None
+
+    def mark_failed_if_routed(self) -> None:
+        """복제본으로 보낸 조회가 DB 오류로 실패하면 다음 측정까지 primary 로 폴백합니다."""
+        state = _request_state.get()
+        routed = _read_only.get() and not (state is not None and state.must_read_primary())
+        if routed and self.unusable_reason() is None:
+            logger.warning("복제본 조회 실패 → 다음 지연 측정까지 primary 로 폴백")
+            self._set(available=False, lag_seconds=None)
+
+    async def _run(self, replica_engine: AsyncEngine) -> None:
+        interval = get_settings().db_replica_check_interval_seconds
+        while True:
+            try:
+                lag = await self._measure_lag(replica_engine)
+                self._set(available=lag is not None, lag_seconds=lag)
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                if self._available:
+                    logger.warning("복제본 지연 측정 실패 → primary 로 폴백: %s", e)
+                self._set(available=False, lag_seconds=None)
+            await asyncio.sleep(interval)
+
+    @staticmethod
+    async def _measure_lag(replica_engine: AsyncEngine) -> float | None:
+        """
+        복제 지연(초)을 반환합니다. 복제 스레드가 멈춰 값이 NULL 이면 None.
+        복제 상태 행이 없으면(프록시 뒤 엔드포인트 등) 지연 0 으로 봅니다.
+        """
+        async with replica_engine.connect() as conn:
+            try:
+                row = (await conn.exec_driver_sql("SHOW REPLICA STATUS")).mappings().first()
+                column = "Seconds_Behind_Source"
+            except exc.ProgrammingError:
+                # MySQL 8.0.22 이전
+                row = (await conn.exec_driver_sql("SHOW SLAVE STATUS")).mappings().first()
+                column = "Seconds_Behind_Master"
+        if row is None:
+            return 0.0
+        lag = row.get(column)
+        return float(lag) if lag is not None else None
+
+    def _set(self, available: bool, lag_seconds: float | None) -> None:
+        self._available = available
+        self._lag_seconds = lag_seconds
+        DB_REPLICA_LAG.set(lag_seconds if lag_seconds is not None else -1)
+        DB_REPLICA_USABLE.set(1 if self.unusable_reason() is None else 0)
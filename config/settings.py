@@ -6,6 +6,10 @@ class Settings(BaseSettings):
     # LLM 제공자
     llm_provider: str = "openai"
 
+    # 헤지/페일오버용 제공자 우선순위 목록 (예: "openai,gemini,claude").
+    # 비어 있거나 하나뿐이면 llm_provider 단일 클라이언트를 사용합니다.
+    llm_providers: str = ""
+
     # 모델명 (환경변수로 재정의 가능)
     openai_model: str = "gpt-4.1-mini"
     gemini_model: str = "gemini-3-flash-preview"
@@ -21,6 +25,77 @@ class Settings(BaseSettings):
     llm_max_tokens: int = 600
     llm_temperature: float = 0.7
 
+    # 부하 테스트용 가짜 LLM (LLM_PROVIDER=fake)
+    fake_llm_model: str = "fake-analysis-1"
+    fake_llm_latency_distribution: str = "lognormal"  # fixed | lognormal | replay
+    fake_llm_latency_seconds: float = 2.5             # fixed: 고정값 / lognormal: 중앙값
+    fake_llm_latency_sigma: float = 0.4               # lognormal 분산 정도
+    fake_llm_latency_replay_file: str = ""            # replay: 한 줄에 지연(초) 하나
+    fake_llm_error_rate: float = 0.0
+    fake_llm_timeout_rate: float = 0.0
+    fake_llm_malformed_rate: float = 0.1
+    fake_llm_stream_chunk_chars: int = 8
+    fake_llm_first_chunk_ratio: float = 0.15
+    fake_llm_seed: int | None = None
+
+    # 헤지 요청: 주 제공자 응답 지연이 최근 지연의 백분위수를 넘으면 다음 제공자에 동시 요청
+    llm_hedge_percentile: float = 95.0
+    llm_hedge_initial_delay_seconds: float = 2.0  # 표본이 부족할 때 사용할 지연
+    llm_hedge_min_delay_seconds: float = 0.3
+    llm_hedge_latency_window: int = 200
+
+    # 제공자별 적응형 동시성 제한(AIMD) + 서킷 브레이커
+    llm_limiter_enabled: bool = True
+    llm_limiter_initial_limit: int = 20
+    llm_limiter_min_limit: int = 2
+    llm_limiter_max_limit: int = 200
+    llm_limiter_max_queue: int = 100
+    llm_limiter_queue_timeout_seconds: float = 2.0
+    llm_limiter_backoff_ratio: float = 0.7
+    llm_breaker_failure_threshold: int = 5
+    llm_breaker_recovery_seconds: float = 30.0
+
+    # LLM 분석 결과 캐시 (동일 입력 재사용)
+    analysis_cache_enabled: bool = True
+    analysis_cache_max_entries: int = 1024
+    analysis_cache_ttl_seconds: float = 3600.0
+
+    # 백그라운드 분석 작업 큐
+    analysis_worker_concurrency: int = 4
+    analysis_job_max_attempts: int = 3
+    analysis_job_retry_base_seconds: float = 5.0
+    analysis_job_poll_interval_seconds: float = 1.0
+    analysis_job_stale_seconds: int = 120  # running 상태로 이 시간이 지나면 재시작으로 간주하고 재시도
+    analysis_stream_job_delay_seconds: float = 60.0  # SSE 생성 경로의 작업은 이 시간 뒤에야 워커가 가져감 (스트림이 먼저 저장하면 success)
+
+    # 이벤트 로그 write-behind 스풀: 로컬 append-only 세그먼트에 fsync 후 즉시 응답하고 백그라운드에서 일괄 적재
+    event_spool_enabled: bool = True
+    event_spool_dir: str = ".event_spool"
+    event_spool_segment_max_bytes: int = 4 * 1024 * 1024
+    event_spool_segment_max_age_seconds: float = 2.0  # 이 시간이 지난 세그먼트는 닫고 적재 대상으로 넘김
+    event_spool_flush_interval_seconds: float = 1.0
+    event_spool_insert_chunk_size: int = 1000         # multi-row INSERT 한 번에 넣을 행 수
+    event_metrics_source: str = "summary"  # summary: session_summary·identifier_activity 집계 | events: event_log 원본 스캔 (요약 백필 전)
+
+    # event_log 월 단위 파티션 유지보수: 미래 파티션 생성, 보존 기간 지난 파티션 보관(gzip) 후 DROP
+    event_partition_maintenance_enabled: bool = True
+    event_partition_maintenance_interval_seconds: float = 3600.0
+    event_partition_months_ahead: int = 3
+    event_log_retention_months: int = 13          # 이번 달 포함 보존 개월 수
+    event_log_archive_dir: str = ".event_archive"
+    event_dedup_retention_days: int = 7           # 이 기간 안의 재전송/재적재만 event_id 로 중복 제거
+
+    # 대시보드(/api/debug/metrics, /api/debug/recent-records) 결과 캐시 (stale-while-revalidate)
+    debug_cache_enabled: bool = True
+    debug_cache_fresh_seconds: float = 10.0        # 이 시간 안의 결과는 그대로 제공
+    debug_cache_max_stale_seconds: float = 300.0   # 그 뒤 이 시간까지는 오래된 결과를 주면서 백그라운드 재계산
+
+    # 대시보드 실시간 피드 (/api/debug/live-feed, 프로세스 내 브로드캐스트)
+    live_feed_buffer_size: int = 100               # 새 뷰어·재접속 뷰어에게 다시 보내는 최근 항목 수
+    live_feed_subscriber_queue_size: int = 256     # 이만큼 밀린 뷰어는 연결을 끊고 재접속 시 버퍼에서 따라잡게 함
+    live_feed_heartbeat_seconds: float = 15.0      # 항목이 없을 때 프록시 유휴 타임아웃을 막는 주석 줄 간격
+    live_feed_seed_on_start: bool = True           # 시작 시 최근 기록을 한 번 읽어 버퍼를 채움
+
     # 카카오 OAuth
     kakao_client_id: str = ""
     kakao_client_secret: str = ""  # 앱 키 > REST API 키 > Client Secret (필수)
@@ -38,11 +113,53 @@ class Settings(BaseSettings):
     db_port: int = 3306
     db_name: str = "moodping"
 
+    # DB 커넥션 풀 (동기·async 엔진에 각각 적용되므로 프로세스당 최대 연결 수는 2 × (size + overflow))
+    db_pool_size: int = 10
+    db_pool_max_overflow: int = 10
+    db_pool_timeout_seconds: float = 5.0        # 풀이 가득 찼을 때 체크아웃 대기 상한
+    db_pool_recycle_seconds: int = 3600         # MySQL wait_timeout(8h) 전에 연결 재생성
+    db_pool_pre_ping: str = "idle"              # always | idle | off
+    db_pool_pre_ping_idle_seconds: float = 30.0  # idle: 이 시간 이상 놀던 연결만 체크아웃 시 ping
+
+    # 읽기 전용 복제본 (비워 두면 모든 읽기가 primary 로 갑니다). 계정·DB 이름은 primary 와 같습니다.
+    db_replica_host: str = ""
+    db_replica_port: int = 3306
+    db_replica_max_lag_seconds: float = 5.0        # 이보다 뒤처지면 primary 로 폴백
+    db_replica_check_interval_seconds: float = 5.0
+    db_read_your_writes_seconds: float = 10.0      # 자기 쓰기 직후 이 시간 동안은 primary 에서 읽기
+
     @property
     def database_url(self) -> str:
+        return self._mysql_url("mysqlconnector", self.db_host, self.db_port)
+
+    @property
+    def async_database_url(self) -> str:
+        """async 라우트·워커용 (aiomysql). 이벤트 루프를 막지 않고 MySQL 왕복을 await 합니다."""
+        return self._mysql_url("aiomysql", self.db_host, self.db_port)
+
+    @property
+    def replica_database_url(self) -> str | None:
+        if not self.db_replica_host:
+            return None
+        return self._mysql_url("mysqlconnector", self.db_replica_host, self.db_replica_port)
+
+    @property
+    def replica_async_database_url(self) -> str | None:
+        if not self.db_replica_host:
+            return None
+        return self._mysql_url("aiomysql", self.db_replica_host, self.db_replica_port)
+
+    @property
+    def streaming_database_url(self) -> str:
+        """대용량 스트리밍 조회용 (pymysql 서버 사이드 커서). 복제본이 있으면 복제본을 읽습니다."""
+        if self.db_replica_host:
+            return self._mysql_url("pymysql", self.db_replica_host, self.db_replica_port)
+        return self._mysql_url("pymysql", self.db_host, self.db_port)
+
+    def _mysql_url(self, driver: str, host: str, port: int) -> str:
         return (
-            f"mysql+mysqlconnector://{self.db_user}:{self.db_password}"
-            f"@{self.db_host}:{self.db_port}/{self.db_name}"
+            f"mysql+{driver}://{self.db_user}:{self.db_password}"
+            f"@{host}:{port}/{self.db_name}"
             f"?charset=utf8mb4"
         )
 
@@ -0,0 +1,97 @@
+"""
+요청 스코프 Unit of Work.
+
+요청(또는 워커 작업) 하나가 세션·커넥션 하나를 공유하고, 서비스는 변경을 세션에 쌓기만(flush) 합니다.
+commit 은 작업 단위를 소유한 쪽(컨트롤러·워커)이 의미상 묶을 수 있는 쓰기를 모은 뒤 한 번 호출합니다.
+- 세션은 처음 사용할 때 만들어지므로 DB 를 쓰지 않는 요청은 커넥션을 빌리지 않습니다.
+- 예외로 빠져나가면 롤백 후 닫습니다.
+"""
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
+from moodping.config.mysql_config import AsyncSessionLocal, SessionLocal
+
+
+class AsyncUnitOfWork:
+    def __init__(self, session_factory=AsyncSessionLocal):
+        self._session_factory = session_factory
+        self._session: AsyncSession | None = None
+
+    @property
+    def session(self) -> AsyncSession:
+        if self._session is None:
+            self._session = self._session_factory()
+        return self._session
+
+    async def commit(self) -> None:
+        if self._session is not None:
+            await self._session.commit()
+
+    async def rollback(self) -> None:
+        if self._session is not None:
+            await self._session.rollback()
+
+    async def release(self) -> None:
+        """
+        읽기 트랜잭션을 끝내 커넥션을 풀에 돌려둡니다 (LLM 호출처럼 오래 기다리기 전에 사용).
+        쌓인 변경이 있으면 함께 커밋되며, expire_on_commit=False 라 로드한 엔터티는 계속 읽을 수 있습니다.
+        """
+        await self.commit()
+
+    async def close(self) -> None:
+        if self._session is not None:
+            await self._session.close()
+            self._session = None
+
+    async def __aenter__(self) -> "AsyncUnitOfWork":
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb) -> None:
+        try:
+            if exc_type is not None:
+                await self.rollback()
+        finally:
+            await self.close()
+
+
+class UnitOfWork:
+    """동기(def) 라우트·CLI 용 Unit of Work. AsyncUnitOfWork 와 같은 규칙을 따릅니다."""
+
+    def __init__(self, session_factory=SessionLocal):
+        self._session_factory = session_factory
+        self._session: Session | None = None
+
+    @property
+    def session(self) -> Session:
+        if self._session is None:
+            self._session = self._session_factory()
+        return self._session
+
+    def commit(self) -> None:
+        if self._session is not None:
+            self._session.commit()
+
+    def rollback(self) -> None:
+        if self._session is not None:
+            self._session.rollback()
+
+    def close(self) -> None:
+        if self._session is not None:
+            self._session.close()
+            self._session = None
+
+    def __enter__(self) -> "UnitOfWork":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        try:
+            if exc_type is not None:
+                self.rollback()
+        finally:
+            self.close()
+
+
+async def get_unit_of_work():
+    """FastAPI 의존성: 요청 하나에 AsyncUnitOfWork 하나."""
+    async with AsyncUnitOfWork() as uow:
+        yield uow
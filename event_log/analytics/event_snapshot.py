@@ -0,0 +1,186 @@
+"""
+event_log 열 지향 스냅샷.
+
+운영 MySQL 에 임의 분석 쿼리를 보내지 않도록 event_log 를 한 번 스트리밍해 로컬 디렉터리에 열 단위 바이너리로 저장하고,
+분석(FunnelEngine)은 np.memmap 으로 필요한 열만 읽습니다.
+
+디렉터리 구성:
+- meta.json            행 수, 열 dtype, event_name 사전, 생성 정보
+- event_code.bin       event_name 사전 코드 (uint16)
+- session_code.bin     session_id 정수 코드 (int32, 처음 나온 순서)
+- identifier_code.bin  COALESCE(user_id, anon_id) 정수 코드 (int32, 없으면 -1)
+- ts.bin               occurred_at 의 UTC epoch 초 (int64)
+- session_ids.txt / identifiers.txt  코드 → 원래 문자열 (줄 번호 = 코드)
+행은 (session_code, ts) 순으로 정렬되어 있어 세션별 계산을 다시 정렬하지 않고 합니다.
+"""
+import json
+import os
+import shutil
+from collections.abc import Iterable, Sequence
+from datetime import datetime, timezone
+from pathlib import Path
+
+import numpy as np
+
+FORMAT_VERSION = 1
+COLUMN_DTYPES = {
+    "event_code": np.dtype(np.uint16),
+    "session_code": np.dtype(np.int32),
+    "identifier_code": np.dtype(np.int32),
+    "ts": np.dtype(np.int64),
+}
+NO_IDENTIFIER = -1
+META_FILE = "meta.json"
+SESSION_IDS_FILE = "session_ids.txt"
+IDENTIFIERS_FILE = "identifiers.txt"
+# 정렬 결과를 이만큼씩 나눠 쓰므로 정렬 순열 외에 열 전체를 메모리에 복사하지 않습니다.
+_WRITE_CHUNK_ROWS = 1 << 22
+
+
+def _column_path(directory: Path, name: str, suffix: str = ".bin") -> Path:
+    return directory / f"{name}{suffix}"
+
+
+def _load_column(path: Path, dtype: np.dtype, rows: int) -> np.ndarray:
+    # 빈 파일은 mmap 할 수 없습니다.
+    if rows == 0:
+        return np.empty(0, dtype=dtype)
+    return np.memmap(path, dtype=dtype, mode="r", shape=(rows,))
+
+
+def _write_lines(path: Path, values: Iterable[str]) -> None:
+    with open(path, "w", encoding="utf-8") as f:
+        for value in values:
+            f.write(value.replace("\n", " ") + "\n")
+
+
+class EventSnapshot:
+    """읽기 전용 스냅샷. 열은 memmap 이라 여는 비용이 없고 실제로 읽은 부분만 메모리에 올라옵니다."""
+
+    def __init__(self, directory: Path, meta: dict):
+        self.directory = directory
+        self.meta = meta
+        self.rows: int = meta["rows"]
+        self.event_names: list[str] = meta["event_names"]
+        self.session_count: int = meta["session_count"]
+        self.identifier_count: int = meta["identifier_count"]
+        self._event_codes = {name: code for code, name in enumerate(self.event_names)}
+        self._columns: dict[str, np.ndarray] = {}
+
+    @classmethod
+    def open(cls, directory: str | Path) -> "EventSnapshot":
+        directory = Path(directory)
+        meta = json.loads((directory / META_FILE).read_text(encoding="utf-8"))
+        if meta.get("format_version") != FORMAT_VERSION:
+            raise ValueError(f"unsupported snapshot format: {meta.get('format_version')}")
+        return cls(directory, meta)
+
+    def column(self, name: str) -> np.ndarray:
+        if name not in self._columns:
+            self._columns[name] = _load_column(_column_path(self.directory, name), COLUMN_DTYPES[name], self.rows)
+        return self._columns[name]
+
+    @property
+    def event_code(self) -> np.ndarray:
+        return self.column("event_code")
+
+    @property
+    def session_code(self) -> np.ndarray:
+        return self.column("session_code")
+
+    @property
+    def identifier_code(self) -> np.ndarray:
+        return self.column("identifier_code")
+
+    @property
+    def ts(self) -> np.ndarray:
+        return self.column("ts")
+
+    def event_code_of(self, event_name: str) -> int | None:
+        """스냅샷에 없는 이벤트면 None."""
+        return self._event_codes.get(event_name)
+
+
+class EventSnapshotWriter:
+    """
+    행 묶음을 받아 코드화한 뒤 정렬 전 열 파일에 덧붙이고, close() 에서 (session_code, ts) 순으로 정렬해 완성합니다.
+    작업은 <directory>.tmp 에서 하고 마지막에 이름을 바꾸므로 중간에 실패해도 이전 스냅샷이 그대로 남습니다.
+    """
+
+    def __init__(self, directory: str | Path):
+        self._directory = Path(directory)
+        self._work_dir = self._directory.with_name(self._directory.name + ".tmp")
+        shutil.rmtree(self._work_dir, ignore_errors=True)
+        self._work_dir.mkdir(parents=True)
+        self._files = {
+            name: open(_column_path(self._work_dir, name, ".unsorted.bin"), "wb")
+            for name in COLUMN_DTYPES
+        }
+        self._event_names: dict[str, int] = {}
+        self._session_ids: dict[str, int] = {}
+        self._identifiers: dict[str, int] = {}
+        self._rows = 0
+
+    def append(self, rows: Sequence[tuple]) -> None:
+        """rows: (session_id, identifier | None, event_name, epoch 초) 튜플 목록."""
+        if not rows:
+            return
+        session_ids, identifiers, event_names, timestamps = zip(*rows)
+        event_codes = [self._event_names.setdefault(name, len(self._event_names)) for name in event_names]
+        if len(self._event_names) > np.iinfo(COLUMN_DTYPES["event_code"]).max + 1:
+            raise ValueError("too many distinct event names for the snapshot format")
+        columns = {
+            "event_code": event_codes,
+            "session_code": [self._session_ids.setdefault(value, len(self._session_ids)) for value in session_ids],
+            "identifier_code": [
+                NO_IDENTIFIER if value is None else self._identifiers.setdefault(value, len(self._identifiers))
+                for value in identifiers
+            ],
+            "ts": timestamps,
+        }
+        for name, values in columns.items():
+            self._files[name].write(np.asarray(values, dtype=COLUMN_DTYPES[name]).tobytes())
+        self._rows += len(rows)
+
+    def close(self, source: dict | None = None) -> EventSnapshot:
+        for f in self._files.values():
+            f.close()
+        unsorted = {
+            name: _load_column(_column_path(self._work_dir, name, ".unsorted.bin"), dtype, self._rows)
+            for name, dtype in COLUMN_DTYPES.items()
+        }
+        order = np.lexsort((unsorted["ts"], unsorted["session_code"]))
+        for name, values in unsorted.items():
+            with open(_column_path(self._work_dir, name), "wb") as f:
+                for start in range(0, self._rows, _WRITE_CHUNK_ROWS):
+                    f.write(values[order[start:start + _WRITE_CHUNK_ROWS]].tobytes())
+                f.flush()
+                os.fsync(f.fileno())
+        del unsorted, order
+        for name in COLUMN_DTYPES:
+            _column_path(self._work_dir, name, ".unsorted.bin").unlink()
+
+        _write_lines(self._work_dir / SESSION_IDS_FILE, self._session_ids)
+        _write_lines(self._work_dir / IDENTIFIERS_FILE, self._identifiers)
+        meta = {
+            "format_version": FORMAT_VERSION,
+            "created_at": datetime.now(timezone.utc).isoformat(),
+            "rows": self._rows,
+            "session_count": len(self._session_ids),
+            "identifier_count": len(self._identifiers),
+            "event_names": list(self._event_names),
+            "columns": {name: dtype.str for name, dtype in COLUMN_DTYPES.items()},
+            "sorted_by": ["session_code", "ts"],
+            "source": source or {},
+        }
+        (self._work_dir / META_FILE).write_text(json.dumps(meta, ensure_ascii=False, indent=2), encoding="utf-8")
+
+        if self._directory.exists():
+            shutil.rmtree(self._directory)
+        os.replace(self._work_dir, self._directory)
+        return EventSnapshot.open(self._directory)
+
+    def abort(self) -> None:
+        for f in self._files.values():
+            f.close()
+        shutil.rmtree(self._work_dir, ignore_errors=True)
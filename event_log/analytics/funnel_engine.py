@@ -0,0 +1,253 @@
+"""
+EventSnapshot 위의 NumPy 벡터화 퍼널·소요 시간·리텐션 계산.
+
+행마다 파이썬 루프를 돌지 않고, 단계(이벤트 이름)마다 배열 연산 몇 번으로 끝납니다.
+스냅샷 행이 (session_code, ts) 순이므로 "세션별 가장 이른 행" 은 정렬 없이 경계 비교로 구합니다.
+결과 모양은 대시보드 API(step_funnel, /api/debug/retention)와 같게 맞춰 두 결과를 바로 비교할 수 있습니다.
+"""
+from datetime import date, datetime, timedelta, timezone
+
+import numpy as np
+
+from moodping.event_log.analytics.event_snapshot import EventSnapshot
+from moodping.event_log.domain.entity.identifier_activity import ACTIVITY_EVENT_NAME
+from moodping.event_log.repository.event_log_repository_impl import STEP_LABELS, build_step_funnel
+from moodping.event_log.repository.identifier_activity_repository_impl import DAYS_PER_WEEK, retention_rate
+
+SECONDS_PER_DAY = 86400
+NOT_REACHED = np.iinfo(np.int64).max
+PERCENTILES = (50, 75, 90, 99)
+EPOCH = date(1970, 1, 1)
+# 1970-01-01 은 목요일이므로 (day + 3) // 7 이 월요일 시작 주 번호입니다.
+_EPOCH_WEEKDAY = EPOCH.weekday()
+
+
+def _epoch_seconds(value: datetime) -> int:
+    return int(value.replace(tzinfo=timezone.utc).timestamp())
+
+
+def _first_per_group(groups: np.ndarray, values: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    """groups 가 정렬되어 있을 때 그룹마다 첫 행의 (그룹, 값)."""
+    if groups.size == 0:
+        return groups, values
+    first = np.empty(groups.size, dtype=bool)
+    first[0] = True
+    np.not_equal(groups[1:], groups[:-1], out=first[1:])
+    return groups[first], values[first]
+
+
+def _distribution(seconds: np.ndarray) -> dict:
+    if seconds.size == 0:
+        return {"count": 0, "mean_seconds": 0.0, **{f"p{p}_seconds": 0.0 for p in PERCENTILES}}
+    percentiles = np.percentile(seconds, PERCENTILES)
+    return {
+        "count": int(seconds.size),
+        "mean_seconds": round(float(seconds.mean()), 1),
+        **{f"p{p}_seconds": round(float(value), 1) for p, value in zip(PERCENTILES, percentiles)},
+    }
+
+
+class FunnelEngine:
+    def __init__(self, snapshot: EventSnapshot):
+        self.snapshot = snapshot
+        self._session_started_at: np.ndarray | None = None
+
+    def step_funnel(
+        self,
+        step_names: list[str],
+        since: datetime | None = None,
+        until: datetime | None = None,
+    ) -> list[dict]:
+        """단계별 도달 세션 수 (순서 무관, 대시보드 step_funnel 과 같은 정의)."""
+        in_period = self._sessions_in_period(since, until)
+        session_code = self.snapshot.session_code
+        event_code = self.snapshot.event_code
+        counts = {}
+        for step in step_names:
+            reached = np.zeros(self.snapshot.session_count, dtype=bool)
+            code = self.snapshot.event_code_of(step)
+            if code is not None:
+                reached[session_code[event_code == code]] = True
+            counts[step] = int(np.count_nonzero(reached & in_period))
+        return build_step_funnel(step_names, counts)
+
+    def ordered_funnel(
+        self,
+        step_names: list[str],
+        window_seconds: int | None = None,
+        since: datetime | None = None,
+        until: datetime | None = None,
+    ) -> dict:
+        """
+        단계를 순서대로 밟은 세션 수와 이전 단계로부터의 소요 시간 분포.
+        각 단계는 이전 단계 도달 시각 이후 가장 이른 발생으로 잡고, window_seconds 를 주면
+        첫 단계(세션 내 최초 발생)로부터 그 안에 도달한 경우만 셉니다.
+        """
+        reached_at = self._reach_times(step_names, window_seconds, self._sessions_in_period(since, until))
+        first_count = int(np.count_nonzero(reached_at[0] != NOT_REACHED)) if step_names else 0
+        steps = []
+        previous_count = first_count
+        for i, step in enumerate(step_names):
+            done = reached_at[i] != NOT_REACHED
+            count = int(np.count_nonzero(done))
+            entry = {
+                "step": step,
+                "label": STEP_LABELS.get(step, step),
+                "sessions": count,
+                "conversion_rate": round(count / first_count, 4) if first_count > 0 else 0.0,
+                "drop_rate": round(1.0 - count / previous_count, 4) if previous_count > 0 else 0.0,
+            }
+            if i > 0:
+                entry["time_from_previous"] = _distribution(reached_at[i][done] - reached_at[i - 1][done])
+            steps.append(entry)
+            previous_count = count
+        return {"window_seconds": window_seconds, "steps": steps}
+
+    def time_to_step(
+        self,
+        from_step: str,
+        to_step: str,
+        window_seconds: int | None = None,
+        since: datetime | None = None,
+        until: datetime | None = None,
+    ) -> dict:
+        """from_step 최초 발생부터 그 뒤 첫 to_step 까지 걸린 시간(초) 분포."""
+        start_at, end_at = self._reach_times(
+            [from_step, to_step], window_seconds, self._sessions_in_period(since, until),
+        )
+        done = end_at != NOT_REACHED
+        return {"from_step": from_step, "to_step": to_step, **_distribution(end_at[done] - start_at[done])}
+
+    def retention(
+        self,
+        curve_days: int,
+        cohort_weeks: int,
+        activity_event: str = ACTIVITY_EVENT_NAME,
+        as_of: date | None = None,
+    ) -> dict:
+        """
+        식별자별 최초 활동일 기준 d일째 리텐션 곡선과 최초 활동 주(월요일 시작)별 w주째 코호트.
+        정의는 identifier_activity 집계와 같습니다 (d일째 구간이 as_of 까지 시작된 식별자만 분모).
+        as_of 를 주지 않으면 스냅샷의 마지막 활동일입니다.
+        """
+        identifier_code = self.snapshot.identifier_code
+        event_code = self.snapshot.event_code
+        code = self.snapshot.event_code_of(activity_event)
+        if code is None:
+            mask = np.zeros(self.snapshot.rows, dtype=bool)
+        else:
+            mask = (event_code == code) & (identifier_code >= 0)
+        ids = identifier_code[mask].astype(np.int64)
+        days = self.snapshot.ts[mask] // SECONDS_PER_DAY
+        if as_of is not None:
+            as_of_day = (as_of - EPOCH).days
+        else:
+            as_of_day = int(days.max()) if days.size else (datetime.now(timezone.utc).date() - EPOCH).days
+
+        first_day = np.full(self.snapshot.identifier_count, NOT_REACHED, dtype=np.int64)
+        np.minimum.at(first_day, ids, days)
+        offsets = days - first_day[ids]
+        seen = first_day != NOT_REACHED
+        first_seen = first_day[seen]
+
+        # 곡선: (식별자, d) 중복을 없앤 뒤 d 별로 셉니다.
+        in_curve = (offsets >= 1) & (offsets <= curve_days)
+        day_pairs = np.unique(ids[in_curve] * (curve_days + 1) + offsets[in_curve])
+        day_retained = np.bincount(day_pairs % (curve_days + 1), minlength=curve_days + 1)
+        day_range = np.arange(1, curve_days + 1)
+        day_eligible = np.searchsorted(np.sort(first_seen), as_of_day - day_range, side="right")
+
+        # 주간 코호트
+        cohort_weeks_of_id = (first_day + _EPOCH_WEEKDAY) // DAYS_PER_WEEK
+        cohorts, cohort_of_seen = np.unique(cohort_weeks_of_id[seen], return_inverse=True)
+        cohort_of_id = np.full(self.snapshot.identifier_count, -1, dtype=np.int64)
+        cohort_of_id[seen] = cohort_of_seen
+        users = np.bincount(cohort_of_seen, minlength=cohorts.size)
+        week_offsets = offsets // DAYS_PER_WEEK
+        in_weeks = (week_offsets >= 1) & (week_offsets <= cohort_weeks)
+        week_pairs = np.unique(ids[in_weeks] * (cohort_weeks + 1) + week_offsets[in_weeks])
+        week_retained = np.zeros((cohorts.size, cohort_weeks + 1), dtype=np.int64)
+        np.add.at(week_retained, (cohort_of_id[week_pairs // (cohort_weeks + 1)], week_pairs % (cohort_weeks + 1)), 1)
+        week_eligible = np.zeros((cohorts.size, cohort_weeks + 1), dtype=np.int64)
+        for w in range(1, cohort_weeks + 1):
+            eligible = first_seen <= as_of_day - DAYS_PER_WEEK * w
+            week_eligible[:, w] = np.bincount(cohort_of_seen[eligible], minlength=cohorts.size)
+
+        return {
+            "as_of": (EPOCH + timedelta(days=as_of_day)).isoformat(),
+            "activity_event": activity_event,
+            "total_users": int(first_seen.size),
+            "curve": [
+                {
+                    "day": int(d),
+                    "eligible_users": int(day_eligible[d - 1]),
+                    "retained_users": int(day_retained[d]),
+                    "retention_rate_percent": retention_rate(int(day_retained[d]), int(day_eligible[d - 1])),
+                }
+                for d in day_range
+            ],
+            "weekly_cohorts": [
+                {
+                    "cohort_week": (EPOCH + timedelta(days=int(cohort) * DAYS_PER_WEEK - _EPOCH_WEEKDAY)).isoformat(),
+                    "users": int(users[i]),
+                    "weeks": [
+                        {
+                            "week": w,
+                            "eligible_users": int(week_eligible[i, w]),
+                            "retained_users": int(week_retained[i, w]),
+                            "retention_rate_percent": retention_rate(int(week_retained[i, w]), int(week_eligible[i, w])),
+                        }
+                        for w in range(1, cohort_weeks + 1)
+                    ],
+                }
+                for i, cohort in enumerate(cohorts)
+            ],
+        }
+
+    def _session_started(self) -> np.ndarray:
+        """세션별 첫 이벤트 시각 (epoch 초)."""
+        if self._session_started_at is None:
+            started_at = np.full(self.snapshot.session_count, NOT_REACHED, dtype=np.int64)
+            sessions, first_ts = _first_per_group(self.snapshot.session_code, self.snapshot.ts)
+            started_at[sessions] = first_ts
+            self._session_started_at = started_at
+        return self._session_started_at
+
+    def _sessions_in_period(self, since: datetime | None, until: datetime | None) -> np.ndarray:
+        """세션 시작 시각이 [since, until) 인 세션 (session_summary 의 first_event_at 기간 조건과 같음)."""
+        in_period = np.ones(self.snapshot.session_count, dtype=bool)
+        if since is not None:
+            in_period &= self._session_started() >= _epoch_seconds(since)
+        if until is not None:
+            in_period &= self._session_started() < _epoch_seconds(until)
+        return in_period
+
+    def _reach_times(
+        self,
+        step_names: list[str],
+        window_seconds: int | None,
+        in_period: np.ndarray,
+    ) -> list[np.ndarray]:
+        """단계마다 세션별 도달 시각 배열 (도달 못 하면 NOT_REACHED)."""
+        session_code = self.snapshot.session_code
+        event_code = self.snapshot.event_code
+        ts = self.snapshot.ts
+        reached_at: list[np.ndarray] = []
+        for i, step in enumerate(step_names):
+            reached = np.full(self.snapshot.session_count, NOT_REACHED, dtype=np.int64)
+            code = self.snapshot.event_code_of(step)
+            if code is not None:
+                rows = np.flatnonzero(event_code == code)
+                sessions = session_code[rows]
+                times = ts[rows]
+                if i == 0:
+                    keep = in_period[sessions]
+                else:
+                    # 이전 단계에 도달하지 못한 세션은 NOT_REACHED 라 자연히 빠집니다.
+                    keep = times >= reached_at[-1][sessions]
+                    if window_seconds is not None:
+                        keep &= times - reached_at[0][sessions] <= window_seconds
+                sessions, first_times = _first_per_group(sessions[keep], times[keep])
+                reached[sessions] = first_times
+            reached_at.append(reached)
+        return reached_at
@@ -0,0 +1,124 @@
+"""
+stale-while-revalidate 결과 캐시 (대시보드 지표처럼 비싼 집계 조회용).
+
+- fresh_seconds 안의 결과는 그대로 반환합니다.
+- 그 뒤 max_stale_seconds 동안은 오래된 결과를 바로 반환하고, 키마다 하나의 백그라운드 스레드가 다시 계산합니다.
+- 결과가 없거나 너무 오래되면 호출자가 직접 계산합니다. 같은 키에 동시에 들어온 요청은 그 계산 하나를 기다립니다.
+즉 열린 탭 수와 무관하게 프로세스당 키 하나에 동시 쿼리는 최대 한 개입니다.
+"""
+import logging
+import threading
+import time
+from collections.abc import Callable
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from typing import Any
+
+from prometheus_client import Counter
+
+logger = logging.getLogger(__name__)
+
+RESULT_CACHE_REQUESTS = Counter(
+    "moodping_result_cache_requests_total",
+    "결과 캐시 조회 (result: fresh | stale | miss | coalesced)",
+    ["cache", "result"],
+)
+RESULT_CACHE_REFRESH_ERRORS = Counter(
+    "moodping_result_cache_refresh_errors_total",
+    "재계산 실패 횟수 (백그라운드 재계산이면 오래된 결과를 계속 제공)",
+    ["cache"],
+)
+
+
+@dataclass(frozen=True)
+class CachedResult:
+    value: Any
+    computed_at: datetime
+    age_seconds: float
+
+
+@dataclass
+class _Entry:
+    value: Any
+    computed_at: datetime
+    computed_mono: float
+
+
+class _Flight:
+    def __init__(self) -> None:
+        self.done = threading.Event()
+        self.entry: _Entry | None = None
+        self.error: BaseException | None = None
+
+
+class StaleWhileRevalidateCache:
+    def __init__(
+        self,
+        name: str,
+        fresh_seconds: float,
+        max_stale_seconds: float,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self._name = name
+        self._fresh_seconds = fresh_seconds
+        self._max_stale_seconds = max_stale_seconds
+        self._clock = clock
+        self._entries: dict[str, _Entry] = {}
+        self._flights: dict[str, _Flight] = {}
+        self._lock = threading.Lock()
+
+    def get(self, key: str, compute: Callable[[], Any]) -> CachedResult:
+        with self._lock:
+            entry = self._entries.get(key)
+            age = self._clock() - entry.computed_mono if entry is not None else None
+            if entry is not None and age < self._fresh_seconds:
+                RESULT_CACHE_REQUESTS.labels(self._name, "fresh").inc()
+                return self._result(entry)
+            if entry is not None and age < self._fresh_seconds + self._max_stale_seconds:
+                RESULT_CACHE_REQUESTS.labels(self._name, "stale").inc()
+                if key not in self._flights:
+                    flight = self._flights[key] = _Flight()
+                    threading.Thread(
+                        target=self._refresh, args=(key, compute, flight),
+                        name=f"result-cache-{self._name}", daemon=True,
+                    ).start()
+                return self._result(entry)
+            flight = self._flights.get(key)
+            leader = flight is None
+            if leader:
+                flight = self._flights[key] = _Flight()
+            RESULT_CACHE_REQUESTS.labels(self._name, "miss" if leader else "coalesced").inc()
+
+        if leader:
+            self._refresh(key, compute, flight)
+        else:
+            flight.done.wait()
+        if flight.error is not None:
+            raise flight.error
+        return self._result(flight.entry)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def _refresh(self, key: str, compute: Callable[[], Any], flight: _Flight) -> None:
+        try:
+            value = compute()
+            flight.entry = _Entry(value, datetime.now(timezone.utc), self._clock())
+        except Exception as e:
+            flight.error = e
+            RESULT_CACHE_REFRESH_ERRORS.labels(self._name).inc()
+            logger.warning("결과 캐시 재계산 실패 (%s/%s): %s", self._name, key, e)
+        finally:
+            with self._lock:
+                if flight.entry is not None:
+                    self._entries[key] = flight.entry
+                self._flights.pop(key, None)
+            flight.done.set()
+
+    def _result(self, entry: _Entry) -> CachedResult:
+        return CachedResult(
+            value=entry.value,
+            computed_at=entry.computed_at,
+            age_seconds=round(max(self._clock() - entry.computed_mono, 0.0), 3),
+        )
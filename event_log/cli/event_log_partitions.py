@@ -0,0 +1,41 @@
+"""
+event_log 파티션 관리 CLI.
+
+- convert:  기존 event_log 를 월 단위 파티션 테이블로 전환 (테이블 복사, 한가한 시간에 실행)
+- maintain: 미래 파티션 생성 / 만료 파티션 보관 후 삭제 / 오래된 dedup·요약 행 정리를 한 번 실행
+            (앱이 실행 중이면 EVENT_PARTITION_MAINTENANCE_INTERVAL_SECONDS 마다 자동으로 수행됨)
+
+사용 예:
+    python -m moodping.event_log.cli.event_log_partitions convert
+    python -m moodping.event_log.cli.event_log_partitions maintain
+"""
+import argparse
+import logging
+
+from moodping.event_log.maintenance.event_log_partition_maintenance import EventLogPartitionMaintenance
+
+logger = logging.getLogger("moodping.event_log_partitions")
+
+COMMAND_CONVERT = "convert"
+COMMAND_MAINTAIN = "maintain"
+
+
+def _parse_args(argv: list[str] | None = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="event_log 월 단위 파티션을 관리합니다.")
+    parser.add_argument("command", choices=[COMMAND_CONVERT, COMMAND_MAINTAIN])
+    return parser.parse_args(argv)
+
+
+def main(argv: list[str] | None = None) -> None:
+    logging.basicConfig(level=logging.INFO)
+    args = _parse_args(argv)
+    maintenance = EventLogPartitionMaintenance.get_instance()
+    if args.command == COMMAND_CONVERT:
+        maintenance.convert()
+        maintenance.run_once()
+    elif not maintenance.run_once():
+        logger.warning("다른 프로세스가 유지보수를 실행 중입니다.")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,141 @@
+"""
+event_log 열 지향 스냅샷 CLI (오프라인 분석용).
+
+- export:  event_log 를 서버 사이드 커서로 스트리밍해 스냅샷 디렉터리를 만듭니다 (복제본이 있으면 복제본에서 읽음).
+           ORDER BY 없이 읽고 정렬은 로컬에서 하므로 MySQL 에는 범위 스캔 한 번만 일어납니다.
+- analyze: 스냅샷으로 퍼널(순서 무관 / 순서대로), 단계 간 소요 시간 분포, 리텐션 곡선·주간 코호트를 계산해 JSON 으로 출력합니다.
+           DB 에 접속하지 않습니다.
+
+사용 예:
+    python -m moodping.event_log.cli.event_snapshot export --out .event_snapshot --since 2026-01-01
+    python -m moodping.event_log.cli.event_snapshot analyze --snapshot .event_snapshot --window-minutes 30
+    python -m moodping.event_log.cli.event_snapshot analyze --steps record_screen_view,record_complete,analysis_view
+"""
+import argparse
+import json
+import logging
+import sys
+import time
+from datetime import date, datetime, timedelta
+
+from sqlalchemy import create_engine, text
+from sqlalchemy.orm import Session
+from sqlalchemy.pool import NullPool
+
+from moodping.config.settings import get_settings
+from moodping.event_log.analytics.event_snapshot import EventSnapshot, EventSnapshotWriter
+from moodping.event_log.analytics.funnel_engine import FunnelEngine
+from moodping.event_log.domain.entity.session_summary import FUNNEL_STEPS
+from moodping.event_log.repository.event_log_repository_impl import EventLogRepositoryImpl
+
+logger = logging.getLogger("moodping.event_snapshot")
+
+COMMAND_EXPORT = "export"
+COMMAND_ANALYZE = "analyze"
+DEFAULT_SNAPSHOT_DIR = ".event_snapshot"
+# 로컬 코드화가 느려 서버가 결과 전송을 기다리는 동안 연결이 끊기지 않도록 늘립니다.
+_NET_WRITE_TIMEOUT_SECONDS = 600
+
+
+def _day_start(value: date | None) -> datetime | None:
+    return datetime.combine(value, datetime.min.time()) if value is not None else None
+
+
+def export(directory: str, since: date | None, until: date | None, batch_size: int) -> EventSnapshot:
+    since_at = _day_start(since)
+    until_at = _day_start(until + timedelta(days=1)) if until is not None else None
+    engine = create_engine(get_settings().streaming_database_url, poolclass=NullPool)
+    writer = EventSnapshotWriter(directory)
+    started = time.monotonic()
+    try:
+        with Session(engine) as session:
+            session.execute(text(f"SET SESSION net_write_timeout = {_NET_WRITE_TIMEOUT_SECONDS}"))
+            for rows in EventLogRepositoryImpl.get_instance().stream_snapshot_rows(session, since_at, until_at, batch_size):
+                writer.append(rows)
+        snapshot = writer.close({
+            "since": since.isoformat() if since else None,
+            "until": until.isoformat() if until else None,
+        })
+    except BaseException:
+        writer.abort()
+        raise
+    finally:
+        engine.dispose()
+    logger.info("스냅샷 생성 완료: %d행, 세션 %d개, %.1f초", snapshot.rows, snapshot.session_count, time.monotonic() - started)
+    return snapshot
+
+
+def analyze(
+    directory: str,
+    step_names: list[str],
+    window_minutes: int | None,
+    curve_days: int,
+    cohort_weeks: int,
+    since: date | None,
+    until: date | None,
+) -> dict:
+    snapshot = EventSnapshot.open(directory)
+    engine = FunnelEngine(snapshot)
+    since_at = _day_start(since)
+    until_at = _day_start(until + timedelta(days=1)) if until is not None else None
+    window_seconds = window_minutes * 60 if window_minutes is not None else None
+    started = time.monotonic()
+    report = {
+        "snapshot": {
+            "rows": snapshot.rows,
+            "sessions": snapshot.session_count,
+            "identifiers": snapshot.identifier_count,
+            "created_at": snapshot.meta["created_at"],
+            "source": snapshot.meta["source"],
+        },
+        "period": {"since": since.isoformat() if since else None, "until": until.isoformat() if until else None},
+        "step_funnel": engine.step_funnel(step_names, since_at, until_at),
+        "ordered_funnel": engine.ordered_funnel(step_names, window_seconds, since_at, until_at),
+        "retention": engine.retention(curve_days, cohort_weeks),
+    }
+    report["elapsed_seconds"] = round(time.monotonic() - started, 3)
+    return report
+
+
+def _parse_args(argv: list[str] | None = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="event_log 열 지향 스냅샷을 만들고 분석합니다.")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    export_parser = subparsers.add_parser(COMMAND_EXPORT, help="event_log → 스냅샷")
+    export_parser.add_argument("--out", default=DEFAULT_SNAPSHOT_DIR, help="스냅샷 디렉터리 (있으면 교체)")
+    export_parser.add_argument("--since", type=date.fromisoformat, default=None, help="occurred_at 시작일 (포함)")
+    export_parser.add_argument("--until", type=date.fromisoformat, default=None, help="occurred_at 종료일 (포함)")
+    export_parser.add_argument("--batch-size", type=int, default=50000, help="한 번에 받아 코드화할 행 수")
+
+    analyze_parser = subparsers.add_parser(COMMAND_ANALYZE, help="스냅샷 → 퍼널·리텐션 JSON")
+    analyze_parser.add_argument("--snapshot", default=DEFAULT_SNAPSHOT_DIR, help="스냅샷 디렉터리")
+    analyze_parser.add_argument("--steps", default=",".join(FUNNEL_STEPS), help="쉼표로 구분한 퍼널 단계 (순서대로)")
+    analyze_parser.add_argument("--window-minutes", type=int, default=None, help="순서 퍼널: 첫 단계부터 이 시간 안에 도달한 경우만")
+    analyze_parser.add_argument("--since", type=date.fromisoformat, default=None, help="세션 시작일 (포함)")
+    analyze_parser.add_argument("--until", type=date.fromisoformat, default=None, help="세션 시작일 (포함)")
+    analyze_parser.add_argument("--retention-days", type=int, default=30, help="리텐션 곡선 일수")
+    analyze_parser.add_argument("--cohort-weeks", type=int, default=4, help="주간 코호트 주 수")
+    return parser.parse_args(argv)
+
+
+def main(argv: list[str] | None = None) -> None:
+    logging.basicConfig(level=logging.INFO)
+    args = _parse_args(argv)
+    if args.command == COMMAND_EXPORT:
+        export(args.out, args.since, args.until, args.batch_size)
+        return
+    report = analyze(
+        args.snapshot,
+        [step.strip() for step in args.steps.split(",") if step.strip()],
+        args.window_minutes,
+        args.retention_days,
+        args.cohort_weeks,
+        args.since,
+        args.until,
+    )
+    json.dump(report, sys.stdout, ensure_ascii=False, indent=2)
+    sys.stdout.write("\n")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,63 @@
+"""
+identifier_activity 백필/재구성 CLI.
+
+identifier_activity 도입 이전의 event_log(또는 활동 기록이 어긋난 기간)를 하루 단위로 다시 반영합니다.
+- occurred_at 하루치씩 처리하고 날마다 커밋 (해당 월 파티션만 읽음)
+- 적재 시점 갱신과 같은 병합 규칙(최초 활동일 LEAST, 비트 OR, 최초 활동일 시각 MIN/MAX)이라 서비스 중에 실행해도 되고, 중단 후 --since 로 이어서 실행
+
+사용 예:
+    python -m moodping.event_log.cli.rebuild_identifier_activity
+    python -m moodping.event_log.cli.rebuild_identifier_activity --since 2026-01-01 --until 2026-03-31
+"""
+import argparse
+import logging
+from datetime import date, datetime, timedelta
+
+from sqlalchemy import text
+
+from moodping.config.unit_of_work import UnitOfWork
+from moodping.event_log.repository.identifier_activity_repository_impl import IdentifierActivityRepositoryImpl
+
+logger = logging.getLogger("moodping.rebuild_identifier_activity")
+
+
+def _first_event_date() -> date | None:
+    with UnitOfWork() as uow:
+        first_event_at = uow.session.execute(text("SELECT MIN(occurred_at) FROM event_log")).scalar()
+    return first_event_at.date() if first_event_at is not None else None
+
+
+def rebuild(since: date, until: date) -> int:
+    repository = IdentifierActivityRepositoryImpl.get_instance()
+    days = 0
+    day = since
+    while day <= until:
+        with UnitOfWork() as uow:
+            affected = repository.rebuild_from_event_log(uow.session, day)
+            uow.commit()
+        days += 1
+        logger.info("%s 반영 완료 (영향 행 %d)", day.isoformat(), affected)
+        day += timedelta(days=1)
+    return days
+
+
+def _parse_args(argv: list[str] | None = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="event_log 로부터 identifier_activity 를 다시 만듭니다.")
+    parser.add_argument("--since", type=date.fromisoformat, default=None, help="시작일 (기본: event_log 의 가장 이른 날)")
+    parser.add_argument("--until", type=date.fromisoformat, default=None, help="종료일, 포함 (기본: 오늘, UTC)")
+    return parser.parse_args(argv)
+
+
+def main(argv: list[str] | None = None) -> None:
+    logging.basicConfig(level=logging.INFO)
+    args = _parse_args(argv)
+    since = args.since or _first_event_date()
+    if since is None:
+        logger.info("event_log 가 비어 있습니다.")
+        return
+    days = rebuild(since, args.until or datetime.utcnow().date())
+    logger.info("identifier_activity 재구성 완료 (%d일)", days)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,52 @@
+"""
+session_summary 백필/재구성 CLI.
+
+session_summary 도입 이전의 event_log(또는 요약이 어긋난 기간)를 세션 단위로 다시 요약합니다.
+- session_id keyset 으로 --batch-size 개 세션씩 처리하고 배치마다 커밋
+- 적재 시점 갱신과 같은 병합 규칙(MIN / MAX / 비트 OR)이라 서비스 중에 실행해도 되고, 중단 후 --after 로 이어서 실행
+
+사용 예:
+    python -m moodping.event_log.cli.rebuild_session_summary
+    python -m moodping.event_log.cli.rebuild_session_summary --after 3f2a... --batch-size 2000
+"""
+import argparse
+import logging
+
+from moodping.config.unit_of_work import UnitOfWork
+from moodping.event_log.repository.session_summary_repository_impl import SessionSummaryRepositoryImpl
+
+logger = logging.getLogger("moodping.rebuild_session_summary")
+
+
+def rebuild(after_session_id: str, batch_size: int) -> int:
+    repository = SessionSummaryRepositoryImpl.get_instance()
+    batches = 0
+    last_session_id = after_session_id
+    while True:
+        with UnitOfWork() as uow:
+            processed_until = repository.rebuild_from_event_log(uow.session, last_session_id, batch_size)
+            uow.commit()
+        if processed_until is None:
+            break
+        last_session_id = processed_until
+        batches += 1
+        logger.info("배치 %d 완료 (마지막 session_id=%s)", batches, last_session_id)
+    return batches
+
+
+def _parse_args(argv: list[str] | None = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="event_log 로부터 session_summary 를 다시 만듭니다.")
+    parser.add_argument("--after", default="", help="이 session_id 다음부터 처리 (중단 후 이어서 실행)")
+    parser.add_argument("--batch-size", type=int, default=1000, help="한 트랜잭션에서 처리할 세션 수")
+    return parser.parse_args(argv)
+
+
+def main(argv: list[str] | None = None) -> None:
+    logging.basicConfig(level=logging.INFO)
+    args = _parse_args(argv)
+    batches = rebuild(args.after, args.batch_size)
+    logger.info("session_summary 재구성 완료 (배치 %d개)", batches)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,5 +1,13 @@
-from fastapi import APIRouter, Depends, HTTPException
+import json
+from datetime import date
+from fastapi import APIRouter, Depends, Header, HTTPException, Query, Request, Response
+from fastapi.concurrency import run_in_threadpool
+from fastapi.responses import StreamingResponse
+from pydantic import ValidationError
 from moodping.event_log.controller.request.create_event_log_request import CreateEventLogRequest
+from moodping.event_log.controller.request.create_event_log_batch_request import CreateEventLogBatchRequest
+from moodping.config.settings import get_settings
+from moodping.event_log.live.live_feed_hub import LiveFeedHub, LiveFeedItem, LiveFeedOverflow
 from moodping.event_log.service.event_log_service_impl import EventLogServiceImpl
 
 event_log_router = APIRouter(tags=["events"])
@@ -9,6 +17,10 @@ def inject_event_log_service() -> EventLogServiceImpl:
     return EventLogServiceImpl.get_instance()
 
 
+def inject_live_feed_hub() -> LiveFeedHub:
+    return LiveFeedHub.get_instance()
+
+
 @event_log_router.post("/api/events")
 def log_event(
     request: CreateEventLogRequest,
@@ -21,15 +33,97 @@ def log_event(
         raise HTTPException(status_code=400, detail=str(e))
 
 
+@event_log_router.post("/api/events/batch")
+async def log_event_batch(
+    request: Request,
+    event_log_service: EventLogServiceImpl = Depends(inject_event_log_service),
+):
+    """
+    여러 이벤트를 한 번에 저장합니다 (common.js 의 버퍼 전송).
+    sendBeacon 은 text/plain 으로 보내므로 Content-Type 과 무관하게 본문을 JSON 으로 검증합니다.
+    """
+    try:
+        batch = CreateEventLogBatchRequest.model_validate_json(await request.body())
+    except ValidationError as e:
+        raise HTTPException(status_code=422, detail=e.errors(include_url=False, include_context=False, include_input=False))
+    result = await run_in_threadpool(event_log_service.create_batch, batch)
+    return {"status": "ok", **result}
+
+
 @event_log_router.get("/api/debug/recent-records", tags=["debug"])
 def get_recent_records(
+    response: Response,
     event_log_service: EventLogServiceImpl = Depends(inject_event_log_service),
 ):
-    return event_log_service.get_recent_records()
+    result = event_log_service.get_recent_records()
+    response.headers["Age"] = str(int(result["cache_age_seconds"]))
+    return result
 
 
 @event_log_router.get("/api/debug/metrics", tags=["debug"])
 def get_metrics(
+    response: Response,
+    since: date | None = Query(None, description="집계 시작일 (포함, YYYY-MM-DD)"),
+    until: date | None = Query(None, description="집계 종료일 (포함, YYYY-MM-DD)"),
+    event_log_service: EventLogServiceImpl = Depends(inject_event_log_service),
+):
+    try:
+        result = event_log_service.get_metrics(since, until)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    response.headers["Age"] = str(int(result["cache_age_seconds"]))
+    return result
+
+
+@event_log_router.get("/api/debug/retention", tags=["debug"])
+def get_retention(
+    response: Response,
+    since: date | None = Query(None, description="최초 활동일 시작 (포함, YYYY-MM-DD)"),
+    until: date | None = Query(None, description="최초 활동일 종료 (포함, YYYY-MM-DD)"),
     event_log_service: EventLogServiceImpl = Depends(inject_event_log_service),
 ):
-    return event_log_service.get_metrics()
+    try:
+        result = event_log_service.get_retention(since, until)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    response.headers["Age"] = str(int(result["cache_age_seconds"]))
+    return result
+
+
+def _sse_item(item: LiveFeedItem) -> str:
+    return f"id: {item.event_id}\nevent: {item.kind}\ndata: {json.dumps(item.data, ensure_ascii=False)}\n\n"
+
+
+@event_log_router.get("/api/debug/live-feed", tags=["debug"])
+async def get_live_feed(
+    last_event_id: str | None = Header(None, alias="Last-Event-ID"),
+    live_feed_hub: LiveFeedHub = Depends(inject_live_feed_hub),
+):
+    """
+    새 감정 기록(record)과 분석 결과(analysis)를 SSE(text/event-stream)로 실시간 전송합니다.
+    접속하면 최근 항목 버퍼를 먼저 보내고(재접속이면 Last-Event-ID 이후만), 이어서 새 항목을 발행 즉시 보냅니다.
+    뷰어당 DB 조회는 없습니다.
+    """
+    subscription = live_feed_hub.subscribe(last_event_id)
+    heartbeat_seconds = get_settings().live_feed_heartbeat_seconds
+
+    async def event_stream():
+        try:
+            yield "retry: 3000\n\n"
+            for item in subscription.backlog:
+                yield _sse_item(item)
+            while True:
+                try:
+                    item = await subscription.next(timeout=heartbeat_seconds)
+                except LiveFeedOverflow:
+                    # 밀린 뷰어는 끊고, 브라우저가 Last-Event-ID 로 재접속해 버퍼에서 따라잡게 합니다.
+                    return
+                yield _sse_item(item) if item is not None else ": ping\n\n"
+        finally:
+            live_feed_hub.unsubscribe(subscription)
+
+    return StreamingResponse(
+        event_stream(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
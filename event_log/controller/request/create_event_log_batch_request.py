@@ -0,0 +1,11 @@
+from pydantic import BaseModel, Field
+from moodping.event_log.controller.request.create_event_log_request import CreateEventLogRequest
+
+MAX_BATCH_EVENTS = 200
+
+class BatchEventLogItem(CreateEventLogRequest):
+    client_ts: int | None = Field(None, description="클라이언트에서 이벤트가 발생한 시각 (epoch ms)")
+
+class CreateEventLogBatchRequest(BaseModel):
+    sent_at: int | None = Field(None, description="클라이언트가 배치를 보낸 시각 (epoch ms)")
+    events: list[BatchEventLogItem] = Field(..., min_length=1, max_length=MAX_BATCH_EVENTS)
@@ -1,19 +1,29 @@
 from datetime import datetime
-from sqlalchemy import BigInteger, Column, String, DateTime, JSON
+from sqlalchemy import BigInteger, Column, String, DateTime, JSON, Index
 from sqlalchemy.sql import func
 from moodping.config.mysql_config import Base
 
 class EventLog(Base):
+    """
+    occurred_at 기준 월 단위 RANGE 파티션 테이블 (EventLogPartitionMaintenance 가 관리).
+    파티션 테이블의 PK/유니크 키는 파티션 컬럼을 포함해야 하므로 PK 는 (id, occurred_at) 이고,
+    event_id 중복 제거는 event_log_dedup 이 맡습니다.
+    """
     __tablename__ = "event_log"
-    __table_args__ = {"extend_existing": True}
+    __table_args__ = (
+        # 퍼널 계산용 커버링 인덱스 (session_id, event_name 단일 인덱스를 대체)
+        Index("idx_event_log_name_session_time", "event_name", "session_id", "occurred_at"),
+        Index("idx_event_log_session_time_name", "session_id", "occurred_at", "event_name"),
+        {"extend_existing": True},
+    )
 
     id = Column(BigInteger, primary_key=True, autoincrement=True)
-    event_id = Column(String(100), nullable=False, unique=True)
-    session_id = Column(String(100), nullable=False, index=True)
+    event_id = Column(String(100), nullable=False)
+    session_id = Column(String(100), nullable=False)
     user_id = Column(String(100), nullable=True, index=True)
     anon_id = Column(String(100), nullable=True, index=True)
-    event_name = Column(String(50), nullable=False, index=True)
-    occurred_at = Column(DateTime, nullable=False, index=True)
+    event_name = Column(String(50), nullable=False)
+    occurred_at = Column(DateTime, primary_key=True, nullable=False, index=True)
     extra_data = Column(JSON, nullable=True)
 
     @classmethod
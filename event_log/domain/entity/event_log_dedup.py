@@ -0,0 +1,21 @@
+"""
+EventLogDedup 도메인 엔터티.
+최근 들어온 event_id 기록 (재전송·스풀 재적재 중복 제거용).
+
+event_log 는 파티션 테이블이라 event_id 유니크 키를 둘 수 없으므로 이 테이블의 PK 로 중복을 거릅니다.
+EVENT_DEDUP_RETENTION_DAYS 가 지난 행은 파티션 유지보수 작업이 지웁니다.
+"""
+from sqlalchemy import Column, String, DateTime, Index
+from sqlalchemy.sql import func
+from moodping.config.mysql_config import Base
+
+class EventLogDedup(Base):
+    __tablename__ = "event_log_dedup"
+    __table_args__ = (
+        Index("idx_event_log_dedup_created_at", "created_at"),
+        {"extend_existing": True},
+    )
+
+    event_id    = Column(String(100), primary_key=True)
+    write_token = Column(String(32), nullable=False)  # 이 행을 처음 넣은 쓰기 묶음 (새로 들어온 이벤트 판별용)
+    created_at  = Column(DateTime, nullable=False, server_default=func.now())
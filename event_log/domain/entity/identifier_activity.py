@@ -0,0 +1,48 @@
+"""
+IdentifierActivity 도메인 엔터티.
+식별자(COALESCE(user_id, anon_id))별 최초 활동일과 그 뒤 날짜별 활동 비트맵 (적재 시점에 갱신, 리텐션 지표용).
+
+activity_bitmap 의 d 번째 비트는 first_seen_date + d 일에 ACTIVITY_EVENT_NAME 이벤트가 있었다는 뜻입니다.
+최초 활동일보다 이른 이벤트가 늦게 들어오면 비트맵을 그 차이만큼 왼쪽으로 밀어 기준일을 앞당깁니다.
+first_seen_at / first_day_last_seen_at 은 최초 활동일의 첫·마지막 이벤트 시각으로, 둘이 다르면 최초 활동일 당일에
+다시 활동한 것입니다 (event_log 원본 리텐션 집계처럼 당일 재방문도 유지로 세기 위해 둡니다).
+최초 활동일·비트 OR·시각 MIN/MAX 로만 갱신되므로 같은 이벤트를 여러 번 반영해도 결과가 같고,
+event_log 파티션이 만료되어도 최초 활동일은 남습니다.
+"""
+from datetime import date
+from sqlalchemy import BigInteger, Column, String, Date, DateTime, Index
+from sqlalchemy.sql import func
+from moodping.config.mysql_config import Base
+
+# 기존 리텐션 지표와 같은 기준 (분석 결과를 다시 보러 온 사용자)
+ACTIVITY_EVENT_NAME = "analysis_view"
+# 부호 있는 BIGINT 에 담기 위해 63일(비트 0~62)까지만 기록합니다.
+ACTIVITY_WINDOW_DAYS = 63
+ACTIVITY_BITMAP_MASK = (1 << ACTIVITY_WINDOW_DAYS) - 1
+
+
+def activity_bitmap(first_seen_date: date, active_dates: set[date]) -> int:
+    """first_seen_date 기준 활동일 비트맵. 기록 범위를 벗어난 날짜는 버립니다."""
+    bitmap = 0
+    for active_date in active_dates:
+        offset = (active_date - first_seen_date).days
+        if 0 <= offset < ACTIVITY_WINDOW_DAYS:
+            bitmap |= 1 << offset
+    return bitmap
+
+
+class IdentifierActivity(Base):
+    __tablename__ = "identifier_activity"
+    __table_args__ = (
+        Index("idx_identifier_activity_first_seen_date", "first_seen_date"),
+        {"extend_existing": True},
+    )
+
+    identifier      = Column(String(100), primary_key=True)
+    first_seen_date = Column(Date, nullable=False)
+    last_seen_date  = Column(Date, nullable=False)
+    activity_bitmap = Column(BigInteger, nullable=False, default=0)
+    # 컬럼 추가 전 행은 NULL (rebuild_identifier_activity 로 다시 채움)
+    first_seen_at         = Column(DateTime, nullable=True)
+    first_day_last_seen_at = Column(DateTime, nullable=True)
+    updated_at      = Column(DateTime, nullable=False, server_default=func.now(), onupdate=func.now())
@@ -0,0 +1,61 @@
+"""
+SessionSummary 도메인 엔터티.
+세션 하나의 이벤트 요약 (적재 시점에 갱신, 퍼널 지표는 event_log 대신 이 테이블을 집계).
+
+모든 컬럼이 MIN / MAX / 비트 OR 로 갱신되거나(*_pairs, *_pair_seconds) 그 세션의 event_log 에서 다시 계산해 덮어쓰므로
+같은 이벤트를 여러 번 반영해도 결과가 같습니다 (스풀 재적재·클라이언트 재전송에 안전).
+"""
+from sqlalchemy import BigInteger, Column, String, DateTime, Integer, Index
+from sqlalchemy.sql import func
+from moodping.config.mysql_config import Base
+
+# 비트 위치가 저장되므로 순서를 바꾸지 말고 뒤에만 추가합니다.
+FUNNEL_STEPS = [
+    "record_screen_view",
+    "emoji_selected",
+    "intensity_selected",
+    "text_input_start",
+    "record_complete",
+    "analysis_view",
+    "feedback_confirmed",
+]
+
+# 퍼널 소요 시간 계산에 쓰는 단계 → 세션 내 최초 발생 시각 컬럼
+KEY_STEP_COLUMNS = {
+    "record_screen_view": "record_screen_view_at",
+    "record_complete": "record_complete_at",
+    "analysis_view": "analysis_view_at",
+}
+
+# *_pairs 를 계산할 때 쓰는 이탈 임계값(분). 바꾸면 rebuild_session_summary 로 다시 만들어야 합니다.
+FUNNEL_PAIR_THRESHOLD_MINUTES = 10
+
+
+def step_bit(event_name: str) -> int:
+    """FUNNEL_STEPS 에 없는 이벤트는 0."""
+    try:
+        return 1 << FUNNEL_STEPS.index(event_name)
+    except ValueError:
+        return 0
+
+
+class SessionSummary(Base):
+    __tablename__ = "session_summary"
+    __table_args__ = (
+        Index("idx_session_summary_last_event_at", "last_event_at"),  # 보존 기간 정리용
+        {"extend_existing": True},
+    )
+
+    session_id            = Column(String(100), primary_key=True)
+    first_event_at        = Column(DateTime, nullable=False)
+    last_event_at         = Column(DateTime, nullable=False)
+    steps_mask            = Column(Integer, nullable=False, default=0)
+    record_screen_view_at = Column(DateTime, nullable=True)
+    record_complete_at    = Column(DateTime, nullable=True)
+    analysis_view_at      = Column(DateTime, nullable=True)
+    # 원본 self-join 과 같은 정의: 시작 단계 s, 도착 단계 c 에 대해 TIMESTAMPDIFF(MINUTE, s, c) BETWEEN 0 AND 임계값 인 (s, c) 짝
+    record_pairs          = Column(Integer, nullable=False, default=0)     # (record_screen_view, record_complete) 짝 수
+    record_pair_seconds   = Column(BigInteger, nullable=False, default=0)  # 그 짝들의 소요 초 합
+    analysis_pairs        = Column(Integer, nullable=False, default=0)     # (record_complete, analysis_view) 짝 수
+    analysis_pair_seconds = Column(BigInteger, nullable=False, default=0)
+    updated_at            = Column(DateTime, nullable=False, server_default=func.now(), onupdate=func.now())
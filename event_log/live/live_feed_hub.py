@@ -0,0 +1,192 @@
+"""
+LiveFeedHub — 디버그 대시보드 실시간 피드용 프로세스 내 브로드캐스트 허브.
+
+기록 저장·분석 저장이 커밋된 직후 호출자가 항목을 발행하면, 구독 중인 모든 SSE 연결에 그대로 전달합니다.
+- 최근 항목은 크기 제한 링 버퍼(LIVE_FEED_BUFFER_SIZE)에 남겨, 새로 접속한 뷰어는 버퍼를 먼저 받고 이어서 실시간 항목을 받습니다.
+- 재접속 시 Last-Event-ID 이후 항목만 다시 보냅니다. ID 에 프로세스 epoch 를 넣어 재시작·다른 워커로의 재접속은 버퍼 전체를 다시 보냅니다.
+- 구독자마다 크기 제한 큐를 두고, 큐가 차면(느린 뷰어) 그 연결만 끊습니다. 브라우저가 Last-Event-ID 로 재접속해 버퍼에서 따라잡습니다.
+- 시작 시 최근 기록을 한 번 읽어 버퍼를 채우며, 그 뒤로 뷰어 수와 무관하게 DB 를 조회하지 않습니다.
+
+허브는 워커 프로세스마다 하나이므로, 여러 워커로 띄우면 각 뷰어는 접속한 프로세스가 처리한 기록·분석만 실시간으로 받습니다.
+"""
+import asyncio
+import logging
+import threading
+import time
+from collections import deque
+from dataclasses import dataclass
+
+from prometheus_client import Counter, Gauge
+
+from moodping.config.settings import get_settings
+from moodping.config.unit_of_work import UnitOfWork
+from moodping.event_log.repository.event_log_repository_impl import EventLogRepositoryImpl
+from moodping.mood_record.domain.entity.mood_record import MoodRecord
+
+logger = logging.getLogger(__name__)
+
+LIVE_FEED_KIND_RECORD = "record"
+LIVE_FEED_KIND_ANALYSIS = "analysis"
+
+LIVE_FEED_PUBLISHED = Counter("moodping_live_feed_published_total", "실시간 피드에 발행한 항목 수", ["kind"])
+LIVE_FEED_SUBSCRIBERS = Gauge("moodping_live_feed_subscribers", "실시간 피드 구독 중인 연결 수")
+LIVE_FEED_DROPPED_SUBSCRIBERS = Counter(
+    "moodping_live_feed_dropped_subscribers_total",
+    "큐가 가득 차 끊은 구독자 수 (재접속 후 버퍼에서 따라잡음)",
+)
+
+
+class LiveFeedOverflow(Exception):
+    """구독자 큐가 가득 차 연결을 끊어야 할 때 발생합니다."""
+
+
+@dataclass(frozen=True)
+class LiveFeedItem:
+    event_id: str
+    seq: int
+    kind: str
+    data: dict
+
+
+class LiveFeedSubscription:
+    def __init__(self, backlog: list[LiveFeedItem], queue_size: int):
+        self.backlog = backlog
+        self._queue: asyncio.Queue[LiveFeedItem] = asyncio.Queue(maxsize=queue_size)
+        self._overflowed = False
+
+    def _offer(self, item: LiveFeedItem) -> bool:
+        try:
+            self._queue.put_nowait(item)
+            return True
+        except asyncio.QueueFull:
+            self._overflowed = True
+            return False
+
+    def close(self) -> None:
+        self._overflowed = True
+
+    async def next(self, timeout: float) -> LiveFeedItem | None:
+        """다음 항목을 기다립니다. timeout 안에 없으면 None (호출자가 heartbeat 를 보냄)."""
+        if self._overflowed:
+            raise LiveFeedOverflow()
+        try:
+            return await asyncio.wait_for(self._queue.get(), timeout=timeout)
+        except asyncio.TimeoutError:
+            if self._overflowed:
+                raise LiveFeedOverflow()
+            return None
+
+
+def record_item(record: MoodRecord, analysis_text: str | None = None) -> dict:
+    """/api/debug/recent-records 의 행과 같은 모양."""
+    return {
+        "record_id":     record.id,
+        "anon_id":       record.anon_id,
+        "user_id":       record.user_id,
+        "emoji":         record.mood_emoji,
+        "intensity":     record.intensity,
+        "mood_text":     record.mood_text,
+        "analysis_text": analysis_text,
+        "recorded_at":   str(record.recorded_at) if record.recorded_at else None,
+    }
+
+
+class LiveFeedHub:
+    __instance = None
+
+    def __new__(cls):
+        if cls.__instance is None:
+            cls.__instance = super().__new__(cls)
+        return cls.__instance
+
+    @classmethod
+    def get_instance(cls) -> "LiveFeedHub":
+        if cls.__instance is None:
+            cls.__instance = cls()
+        return cls.__instance
+
+    def __init__(self) -> None:
+        if hasattr(self, "_initialized"):
+            return
+        self._initialized = True
+        self.event_log_repository = EventLogRepositoryImpl.get_instance()
+        settings = get_settings()
+        self._buffer: deque[LiveFeedItem] = deque(maxlen=settings.live_feed_buffer_size)
+        self._subscribers: set[LiveFeedSubscription] = set()
+        self._epoch = format(time.time_ns(), "x")
+        self._seq = 0
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._loop_thread_id: int | None = None
+
+    def start(self) -> None:
+        """이벤트 루프에서 호출합니다. 다른 스레드에서 발행한 항목은 이 루프로 넘겨 전달합니다."""
+        self._loop = asyncio.get_running_loop()
+        self._loop_thread_id = threading.get_ident()
+        if get_settings().live_feed_seed_on_start:
+            self._seed()
+
+    def stop(self) -> None:
+        for subscription in list(self._subscribers):
+            subscription.close()
+        self._subscribers.clear()
+        LIVE_FEED_SUBSCRIBERS.set(0)
+        self._loop = None
+        self._loop_thread_id = None
+
+    def publish_record(self, record: MoodRecord) -> None:
+        """기록 저장이 커밋된 뒤 호출합니다."""
+        self.publish(LIVE_FEED_KIND_RECORD, record_item(record))
+
+    def publish_analysis(self, record_id: int, analysis_text: str) -> None:
+        """분석 저장이 커밋된 뒤 호출합니다."""
+        self.publish(LIVE_FEED_KIND_ANALYSIS, {"record_id": record_id, "analysis_text": analysis_text})
+
+    def publish(self, kind: str, data: dict) -> None:
+        if self._loop is not None and threading.get_ident() != self._loop_thread_id:
+            self._loop.call_soon_threadsafe(self._publish, kind, data)
+            return
+        self._publish(kind, data)
+
+    def subscribe(self, last_event_id: str | None = None) -> LiveFeedSubscription:
+        """버퍼에서 last_event_id 이후 항목을 backlog 로 담아 구독을 등록합니다 (발행과 같은 루프에서 원자적으로)."""
+        subscription = LiveFeedSubscription(
+            backlog=self._backlog_after(last_event_id),
+            queue_size=get_settings().live_feed_subscriber_queue_size,
+        )
+        self._subscribers.add(subscription)
+        LIVE_FEED_SUBSCRIBERS.set(len(self._subscribers))
+        return subscription
+
+    def unsubscribe(self, subscription: LiveFeedSubscription) -> None:
+        self._subscribers.discard(subscription)
+        LIVE_FEED_SUBSCRIBERS.set(len(self._subscribers))
+
+    def _publish(self, kind: str, data: dict) -> None:
+        self._seq += 1
+        item = LiveFeedItem(event_id=f"{self._epoch}-{self._seq}", seq=self._seq, kind=kind, data=data)
+        self._buffer.append(item)
+        LIVE_FEED_PUBLISHED.labels(kind=kind).inc()
+        for subscription in list(self._subscribers):
+            if not subscription._offer(item):
+                self._subscribers.discard(subscription)
+                LIVE_FEED_DROPPED_SUBSCRIBERS.inc()
+        LIVE_FEED_SUBSCRIBERS.set(len(self._subscribers))
+
+    def _backlog_after(self, last_event_id: str | None) -> list[LiveFeedItem]:
+        if last_event_id:
+            epoch, _, seq = last_event_id.partition("-")
+            if epoch == self._epoch and seq.isdigit():
+                last_seq = int(seq)
+                return [item for item in self._buffer if item.seq > last_seq]
+        return list(self._buffer)
+
+    def _seed(self) -> None:
+        """시작 시 최근 기록(분석 포함)을 오래된 순으로 버퍼에 채웁니다. 실패해도 빈 버퍼로 시작합니다."""
+        try:
+            with UnitOfWork() as uow:
+                records = self.event_log_repository.get_recent_records(uow.session)
+        except Exception as e:
+            logger.warning("실시간 피드 버퍼 초기화 실패: %s", e)
+            return
+        for row in reversed(records):
+            self._publish(LIVE_FEED_KIND_RECORD, row)
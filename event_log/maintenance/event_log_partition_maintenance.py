@@ -0,0 +1,305 @@
+"""
+event_log 월 단위 파티션 유지보수.
+
+event_log 는 occurred_at 기준 RANGE COLUMNS 파티션(pYYYYMM = 해당 월, pmax = 나머지)입니다.
+주기마다 GET_LOCK 을 잡은 프로세스 하나만 다음을 수행합니다.
+- 전환: 파티션이 없는 event_log 가 비어 있으면 바로 파티션 테이블로 바꿉니다.
+  데이터가 있으면 테이블 복사가 일어나므로 CLI(event_log.cli.event_log_partitions convert)로 따로 실행합니다.
+- 미리 만들기: 이번 달부터 EVENT_PARTITION_MONTHS_AHEAD 개월 뒤까지의 파티션을 (비어 있는) pmax 분할로 만듭니다.
+- 만료: EVENT_LOG_RETENTION_MONTHS 를 벗어난 파티션을 gzip JSON Lines 로 내보내고 fsync 한 뒤 DROP PARTITION 합니다.
+  내보낸 파일이 이미 있으면(이전 실행이 DROP 전에 중단) 다시 내보내지 않고 바로 DROP 합니다.
+- 정리: event_log_dedup(EVENT_DEDUP_RETENTION_DAYS), session_summary(보존 기간) 의 오래된 행을 나눠서 지웁니다.
+"""
+import asyncio
+import gzip
+import json
+import logging
+import os
+import re
+from datetime import date, datetime, timedelta
+from pathlib import Path
+
+from prometheus_client import Counter, Gauge
+from sqlalchemy import text
+from sqlalchemy.engine import Connection
+
+from moodping.config.mysql_config import engine
+from moodping.config.settings import get_settings
+from moodping.event_log.domain.entity.event_log import EventLog
+
+logger = logging.getLogger(__name__)
+
+_LOCK_NAME = "moodping_event_log_partition_maintenance"
+_MAX_PARTITION = "pmax"
+_PARTITION_NAME = re.compile(r"^p(\d{4})(\d{2})$")
+_DELETE_CHUNK_ROWS = 5000
+_EXPORT_FETCH_ROWS = 1000
+
+EVENT_PARTITIONS_CREATED = Counter("moodping_event_partitions_created_total", "미리 만든 event_log 월 파티션 수")
+EVENT_PARTITIONS_DROPPED = Counter("moodping_event_partitions_dropped_total", "보관 후 삭제한 event_log 월 파티션 수")
+EVENT_ARCHIVED_ROWS = Counter("moodping_event_archived_rows_total", "만료 파티션에서 파일로 내보낸 이벤트 수")
+EVENT_PARTITION_MAINTENANCE_LAST_SUCCESS = Gauge(
+    "moodping_event_partition_maintenance_last_success_timestamp",
+    "마지막으로 유지보수를 끝낸 시각 (unix time)",
+)
+
+
+def _month_start(d: date) -> date:
+    return d.replace(day=1)
+
+
+def _add_months(d: date, months: int) -> date:
+    index = d.year * 12 + (d.month - 1) + months
+    return date(index // 12, index % 12 + 1, 1)
+
+
+def _partition_name(month: date) -> str:
+    return f"p{month:%Y%m}"
+
+
+def _partition_month(name: str) -> date | None:
+    match = _PARTITION_NAME.match(name)
+    return date(int(match.group(1)), int(match.group(2)), 1) if match else None
+
+
+def _partition_definitions(months: list[date]) -> str:
+    definitions = [
+        f"PARTITION {_partition_name(month)} VALUES LESS THAN ('{_add_months(month, 1):%Y-%m-%d}')"
+        for month in months
+    ]
+    definitions.append(f"PARTITION {_MAX_PARTITION} VALUES LESS THAN (MAXVALUE)")
+    return ",\n    ".join(definitions)
+
+
+class EventLogPartitionMaintenance:
+    __instance = None
+
+    def __new__(cls):
+        if cls.__instance is None:
+            cls.__instance = super().__new__(cls)
+        return cls.__instance
+
+    @classmethod
+    def get_instance(cls) -> "EventLogPartitionMaintenance":
+        if cls.__instance is None:
+            cls.__instance = cls()
+        return cls.__instance
+
+    def __init__(self) -> None:
+        if hasattr(self, "_initialized"):
+            return
+        self._initialized = True
+        self._task: asyncio.Task | None = None
+        self._warned_unpartitioned = False
+
+    def start(self) -> None:
+        if not get_settings().event_partition_maintenance_enabled or self._task is not None:
+            return
+        self._task = asyncio.create_task(self._run(), name="event-log-partition-maintenance")
+        logger.info("event_log 파티션 유지보수 시작")
+
+    async def stop(self) -> None:
+        if self._task is None:
+            return
+        self._task.cancel()
+        await asyncio.gather(self._task, return_exceptions=True)
+        self._task = None
+
+    async def _run(self) -> None:
+        interval = get_settings().event_partition_maintenance_interval_seconds
+        while True:
+            try:
+                await asyncio.to_thread(self.run_once)
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.error("event_log 파티션 유지보수 실패: %s", e)
+            await asyncio.sleep(interval)
+
+    def run_once(self, today: date | None = None) -> bool:
+        """유지보수를 한 번 수행합니다. 다른 프로세스가 실행 중이면 False."""
+        today = today or datetime.utcnow().date()  # occurred_at 은 UTC
+        with engine.connect() as conn:
+            if not conn.execute(text("SELECT GET_LOCK(:name, 0)"), {"name": _LOCK_NAME}).scalar():
+                return False
+            try:
+                partitions = self._partitions(conn)
+                if partitions is None:
+                    partitions = self._partition_if_empty(conn, today)
+                if partitions is not None:
+                    self._create_future_partitions(conn, partitions, today)
+                    self._expire_partitions(conn, partitions, today)
+                self._purge_expired_rows(conn, today)
+            finally:
+                conn.execute(text("SELECT RELEASE_LOCK(:name)"), {"name": _LOCK_NAME})
+                conn.commit()
+        EVENT_PARTITION_MAINTENANCE_LAST_SUCCESS.set_to_current_time()
+        return True
+
+    def convert(self, today: date | None = None) -> None:
+        """
+        기존(파티션 없는) event_log 를 파티션 테이블로 바꿉니다. 테이블을 복사하므로 한가한 시간에 CLI 로 실행합니다.
+        1) event_id 유니크 키가 있으면 최근 event_id 를 event_log_dedup 으로 옮기고 유니크 키를 지움
+        2) PK 를 (id, occurred_at) 로 변경
+        3) 가장 오래된 이벤트의 월부터 파티션 생성
+        """
+        today = today or datetime.utcnow().date()  # occurred_at 은 UTC
+        settings = get_settings()
+        with engine.connect() as conn:
+            if self._partitions(conn) is not None:
+                logger.info("event_log 는 이미 파티션 테이블입니다.")
+                return
+
+            unique_indexes = conn.execute(text("""
+                SELECT DISTINCT INDEX_NAME FROM information_schema.STATISTICS
+                WHERE TABLE_SCHEMA = DATABASE() AND TABLE_NAME = 'event_log'
+                  AND NON_UNIQUE = 0 AND INDEX_NAME <> 'PRIMARY' AND COLUMN_NAME = 'event_id'
+            """)).scalars().all()
+            if unique_indexes:
+                logger.info("최근 %d일 event_id 를 event_log_dedup 으로 옮기는 중", settings.event_dedup_retention_days)
+                conn.execute(
+                    text("""
+                        INSERT INTO event_log_dedup (event_id, write_token, created_at)
+                        SELECT event_id, '', occurred_at FROM event_log WHERE occurred_at >= :since
+                        ON DUPLICATE KEY UPDATE event_id = event_log_dedup.event_id
+                    """),
+                    {"since": datetime.combine(today - timedelta(days=settings.event_dedup_retention_days), datetime.min.time())},
+                )
+                conn.commit()
+                for index_name in unique_indexes:
+                    conn.execute(text(f"ALTER TABLE event_log DROP INDEX `{index_name}`"))
+
+            primary_key = conn.execute(text("""
+                SELECT COLUMN_NAME FROM information_schema.STATISTICS
+                WHERE TABLE_SCHEMA = DATABASE() AND TABLE_NAME = 'event_log' AND INDEX_NAME = 'PRIMARY'
+                ORDER BY SEQ_IN_INDEX
+            """)).scalars().all()
+            if list(primary_key) == ["id"]:
+                logger.info("event_log PK 를 (id, occurred_at) 로 변경하는 중")
+                conn.execute(text("ALTER TABLE event_log DROP PRIMARY KEY, ADD PRIMARY KEY (id, occurred_at)"))
+
+            oldest = conn.execute(text("SELECT MIN(occurred_at) FROM event_log")).scalar()
+            first_month = _month_start(oldest.date() if oldest is not None else today)
+            self._partition_table(conn, first_month, today)
+
+    # ── 파티션 조회/생성 ───────────────────────────────────────────────
+
+    @staticmethod
+    def _partitions(conn: Connection) -> list[str] | None:
+        """파티션 이름 목록 (정의 순서). 파티션 테이블이 아니면 None."""
+        names = conn.execute(text("""
+            SELECT PARTITION_NAME FROM information_schema.PARTITIONS
+            WHERE TABLE_SCHEMA = DATABASE() AND TABLE_NAME = 'event_log'
+            ORDER BY PARTITION_ORDINAL_POSITION
+        """)).scalars().all()
+        if not names or names[0] is None:
+            return None
+        return list(names)
+
+    def _partition_if_empty(self, conn: Connection, today: date) -> list[str] | None:
+        if conn.execute(text("SELECT 1 FROM event_log LIMIT 1")).first() is not None:
+            if not self._warned_unpartitioned:
+                logger.warning(
+                    "event_log 가 파티션 테이블이 아닙니다. "
+                    "python -m moodping.event_log.cli.event_log_partitions convert 로 전환하세요."
+                )
+                self._warned_unpartitioned = True
+            return None
+        self._partition_table(conn, _month_start(today), today)
+        return self._partitions(conn)
+
+    def _partition_table(self, conn: Connection, first_month: date, today: date) -> None:
+        last_month = _add_months(_month_start(today), get_settings().event_partition_months_ahead)
+        months = []
+        month = first_month
+        while month <= last_month:
+            months.append(month)
+            month = _add_months(month, 1)
+        logger.info("event_log 를 월 파티션 %d개로 전환 (%s ~ %s)", len(months), months[0], months[-1])
+        conn.execute(text(
+            f"ALTER TABLE event_log PARTITION BY RANGE COLUMNS(occurred_at) (\n    {_partition_definitions(months)}\n)"
+        ))
+        EVENT_PARTITIONS_CREATED.inc(len(months))
+
+    def _create_future_partitions(self, conn: Connection, partitions: list[str], today: date) -> None:
+        if _MAX_PARTITION not in partitions:
+            logger.error("event_log 에 %s 파티션이 없어 새 파티션을 만들 수 없습니다.", _MAX_PARTITION)
+            return
+        existing = [month for month in map(_partition_month, partitions) if month is not None]
+        last_month = _add_months(_month_start(today), get_settings().event_partition_months_ahead)
+        month = _add_months(max(existing), 1) if existing else _month_start(today)
+        months = []
+        while month <= last_month:
+            months.append(month)
+            month = _add_months(month, 1)
+        if not months:
+            return
+        conn.execute(text(
+            f"ALTER TABLE event_log REORGANIZE PARTITION {_MAX_PARTITION} INTO (\n    {_partition_definitions(months)}\n)"
+        ))
+        partitions[partitions.index(_MAX_PARTITION):] = [*map(_partition_name, months), _MAX_PARTITION]
+        EVENT_PARTITIONS_CREATED.inc(len(months))
+        logger.info("event_log 파티션 생성: %s", ", ".join(map(_partition_name, months)))
+
+    # ── 만료/보관 ──────────────────────────────────────────────────────
+
+    def _expire_partitions(self, conn: Connection, partitions: list[str], today: date) -> None:
+        keep_from = _add_months(_month_start(today), -(get_settings().event_log_retention_months - 1))
+        for name in list(partitions):
+            month = _partition_month(name)
+            if month is None or _add_months(month, 1) > keep_from:
+                continue
+            archive_path = self._archive_path(name)
+            if not archive_path.exists():
+                self._export_partition(name, archive_path)
+            conn.execute(text(f"ALTER TABLE event_log DROP PARTITION {name}"))
+            partitions.remove(name)
+            EVENT_PARTITIONS_DROPPED.inc()
+            logger.info("event_log 파티션 %s 보관 후 삭제 (%s)", name, archive_path)
+
+    @staticmethod
+    def _archive_path(partition_name: str) -> Path:
+        archive_dir = Path(get_settings().event_log_archive_dir)
+        archive_dir.mkdir(parents=True, exist_ok=True)
+        return archive_dir / f"event_log-{partition_name}.jsonl.gz"
+
+    @staticmethod
+    def _export_partition(partition_name: str, archive_path: Path) -> None:
+        """파티션 하나를 서버 측 커서로 흘려 읽어 임시 파일에 쓰고, fsync 후 최종 이름으로 바꿉니다."""
+        columns = list(EventLog.__table__.columns)
+        sql = text(
+            f"SELECT {', '.join(column.name for column in columns)} FROM event_log PARTITION ({partition_name})"
+        ).columns(*columns)
+        tmp_path = archive_path.with_name(archive_path.name + ".tmp")
+        rows = 0
+        with engine.connect() as conn, gzip.open(tmp_path, "wt", encoding="utf-8") as f:
+            result = conn.execution_options(stream_results=True, max_row_buffer=_EXPORT_FETCH_ROWS).execute(sql)
+            for row in result.mappings():
+                record = dict(row)
+                record["occurred_at"] = record["occurred_at"].isoformat()
+                f.write(json.dumps(record, ensure_ascii=False, default=str) + "\n")
+                rows += 1
+        with open(tmp_path, "rb") as f:
+            os.fsync(f.fileno())
+        os.replace(tmp_path, archive_path)
+        dir_fd = os.open(archive_path.parent, os.O_RDONLY)
+        try:
+            os.fsync(dir_fd)
+        finally:
+            os.close(dir_fd)
+        EVENT_ARCHIVED_ROWS.inc(rows)
+
+    def _purge_expired_rows(self, conn: Connection, today: date) -> None:
+        settings = get_settings()
+        keep_from = _add_months(_month_start(today), -(settings.event_log_retention_months - 1))
+        dedup_before = today - timedelta(days=settings.event_dedup_retention_days)
+        self._delete_in_chunks(conn, "DELETE FROM event_log_dedup WHERE created_at < :before LIMIT :chunk", dedup_before)
+        self._delete_in_chunks(conn, "DELETE FROM session_summary WHERE last_event_at < :before LIMIT :chunk", keep_from)
+
+    @staticmethod
+    def _delete_in_chunks(conn: Connection, sql: str, before: date) -> None:
+        while True:
+            deleted = conn.execute(text(sql), {"before": before, "chunk": _DELETE_CHUNK_ROWS}).rowcount
+            conn.commit()
+            if deleted < _DELETE_CHUNK_ROWS:
+                return
@@ -1,4 +1,6 @@
 from abc import ABC, abstractmethod
+from collections.abc import Iterator
+from datetime import datetime
 from sqlalchemy.orm import Session
 from moodping.event_log.domain.entity.event_log import EventLog
 
@@ -8,17 +10,36 @@ class EventLogRepository(ABC):
         pass
 
     @abstractmethod
-    def get_record_funnel(self, session: Session, threshold_minutes: int) -> dict:
+    def save_all_ignore_duplicates(self, session: Session, event_logs: list[EventLog]) -> list[EventLog]:
         pass
 
     @abstractmethod
-    def get_analysis_funnel(self, session: Session, threshold_minutes: int) -> dict:
+    def stream_snapshot_rows(
+        self,
+        session: Session,
+        since: datetime | None,
+        until: datetime | None,
+        batch_size: int,
+    ) -> Iterator[list[tuple]]:
         pass
 
     @abstractmethod
-    def get_step_funnel(self, session: Session, step_names: list[str]) -> list[dict]:
+    def get_funnels(
+        self,
+        session: Session,
+        threshold_minutes: int,
+        step_names: list[str],
+        since: datetime | None = None,
+        until: datetime | None = None,
+    ) -> dict:
         pass
 
     @abstractmethod
-    def get_retention(self, session: Session, retention_days: int) -> dict:
+    def get_retention(
+        self,
+        session: Session,
+        retention_days: int,
+        since: datetime | None = None,
+        until: datetime | None = None,
+    ) -> dict:
         pass
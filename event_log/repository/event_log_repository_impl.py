@@ -1,18 +1,14 @@
+import uuid
+from collections.abc import Iterator
+from datetime import datetime
 from sqlalchemy.orm import Session
-from sqlalchemy import text
+from sqlalchemy import select, text
+from sqlalchemy.dialects.mysql import insert
 from moodping.event_log.domain.entity.event_log import EventLog
+from moodping.event_log.domain.entity.event_log_dedup import EventLogDedup
+from moodping.event_log.domain.entity.session_summary import FUNNEL_STEPS  # noqa: F401 (기존 import 경로 유지)
 from moodping.event_log.repository.event_log_repository import EventLogRepository
 
-FUNNEL_STEPS = [
-    "record_screen_view",
-    "emoji_selected",
-    "intensity_selected",
-    "text_input_start",
-    "record_complete",
-    "analysis_view",
-    "feedback_confirmed",
-]
-
 STEP_LABELS = {
     "record_screen_view": "페이지 진입",
     "emoji_selected": "이모지 선택",
@@ -23,6 +19,35 @@ STEP_LABELS = {
     "feedback_confirmed": "확인 완료",
 }
 
+# 리텐션 최초 활동일 기준: 기간 안의 첫 활동(event_log 원본) / 전체 기간의 첫 활동(identifier_activity)
+FIRST_SEEN_SCOPE_PERIOD = "period"
+FIRST_SEEN_SCOPE_ALL_TIME = "all_time"
+
+
+def build_step_funnel(step_names: list[str], counts: dict[str, int]) -> list[dict]:
+    """단계별 세션 수로 이전 단계 대비 이탈률을 계산합니다."""
+    result = []
+    for i, step in enumerate(step_names):
+        current = counts.get(step, 0)
+        prev = counts.get(step_names[i - 1], 0) if i > 0 else current
+        drop_rate = round(1.0 - current / prev, 4) if prev > 0 else 0.0
+        result.append({"step": step, "label": STEP_LABELS.get(step, step), "sessions": current, "drop_rate": drop_rate})
+    return result
+
+
+def period_params(since: datetime | None, until: datetime | None) -> dict:
+    """기간 조건 [since, until) 바인드 값. 비어 있으면 전체 기간 (파티션 프루닝은 값이 있을 때만 의미가 있음)."""
+    return {
+        "since": since or datetime(1970, 1, 1),
+        "until": until or datetime(9999, 12, 31),
+    }
+
+
+def safe_funnel_row(row, k0: str, k1: str, k2: str, k3: str) -> dict:
+    if not row:
+        return {k0: 0, k1: 0, k2: 0.0, k3: 0.0}
+    return {k0: int(row[k0] or 0), k1: int(row[k1] or 0), k2: float(row[k2] or 0.0), k3: float(row[k3] or 0.0)}
+
 class EventLogRepositoryImpl(EventLogRepository):
     __instance = None
 
@@ -73,59 +98,174 @@ class EventLogRepositoryImpl(EventLogRepository):
         session.flush()
         return event_log
 
-    def get_record_funnel(self, session: Session, threshold_minutes: int) -> dict:
-        sql = text("""
-            SELECT
-                COUNT(DISTINCT s.session_id) AS record_start_count,
-                COUNT(DISTINCT c.session_id) AS record_complete_count,
-                ROUND(CASE WHEN COUNT(DISTINCT s.session_id) = 0 THEN 0
-                     ELSE 1.0 - COUNT(DISTINCT c.session_id) * 1.0 / COUNT(DISTINCT s.session_id) END, 4) AS record_drop_rate,
-                ROUND(COALESCE(AVG(CASE WHEN c.session_id IS NOT NULL
-                     THEN TIMESTAMPDIFF(SECOND, s.occurred_at, c.occurred_at) END) / 60.0, 0), 2) AS avg_record_duration_minutes
-            FROM event_log s
-            LEFT JOIN event_log c ON s.session_id = c.session_id AND c.event_name = 'record_complete'
-                AND TIMESTAMPDIFF(MINUTE, s.occurred_at, c.occurred_at) BETWEEN 0 AND :threshold
-            WHERE s.event_name = 'record_screen_view'
-        """)
-        row = session.execute(sql, {"threshold": threshold_minutes}).mappings().first()
-        return self._safe_funnel_row(row, "record_start_count", "record_complete_count", "record_drop_rate", "avg_record_duration_minutes")
+    def save_all_ignore_duplicates(self, session: Session, event_logs: list[EventLog]) -> list[EventLog]:
+        """
+        처음 보는 event_id 의 이벤트만 multi-row INSERT 로 저장하고, 저장한 이벤트를 반환합니다.
+        event_log_dedup 에 이번 쓰기의 토큰으로 event_id 를 넣어 보고(이미 있으면 no-op) 토큰이 남은 행만 새 이벤트로 봅니다.
+        같은 event_id 를 동시에 넣는 트랜잭션은 dedup PK 잠금에서 순서가 정해지므로 한쪽만 저장됩니다.
+        """
+        unique_logs: list[EventLog] = []
+        seen_ids: set[str] = set()
+        for event_log in event_logs:
+            if event_log.event_id not in seen_ids:
+                seen_ids.add(event_log.event_id)
+                unique_logs.append(event_log)
+        if not unique_logs:
+            return []
+        write_token = uuid.uuid4().hex
+        dedup_stmt = insert(EventLogDedup).values([
+            {"event_id": event_log.event_id, "write_token": write_token}
+            for event_log in sorted(unique_logs, key=lambda event_log: event_log.event_id)
+        ])
+        session.execute(dedup_stmt.on_duplicate_key_update(event_id=dedup_stmt.inserted.event_id))
+        new_ids = set(session.execute(
+            select(EventLogDedup.event_id).where(
+                EventLogDedup.event_id.in_([event_log.event_id for event_log in unique_logs]),
+                EventLogDedup.write_token == write_token,
+            )
+        ).scalars())
+        new_logs = [event_log for event_log in unique_logs if event_log.event_id in new_ids]
+        if not new_logs:
+            return []
+        rows = [
+            {
+                "event_id":    event_log.event_id,
+                "session_id":  event_log.session_id,
+                "user_id":     event_log.user_id,
+                "anon_id":     event_log.anon_id,
+                "event_name":  event_log.event_name,
+                "occurred_at": event_log.occurred_at,
+                "extra_data":  event_log.extra_data,
+            }
+            for event_log in new_logs
+        ]
+        # 파티션 전환(event_id 유니크 키 제거) 전 DB 에서도 안전하도록 중복 키는 no-op 으로 둡니다.
+        stmt = insert(EventLog).values(rows)
+        session.execute(stmt.on_duplicate_key_update(event_id=stmt.inserted.event_id))
+        return new_logs
 
-    def get_analysis_funnel(self, session: Session, threshold_minutes: int) -> dict:
+    def stream_snapshot_rows(
+        self,
+        session: Session,
+        since: datetime | None,
+        until: datetime | None,
+        batch_size: int,
+    ) -> Iterator[list[tuple]]:
+        """
+        스냅샷용 (session_id, identifier, event_name, epoch 초) 행을 batch_size 개씩 돌려줍니다.
+        서버 사이드 커서(stream_results)로 읽으므로 전체 결과를 메모리에 올리지 않고,
+        ORDER BY 없이 읽어 MySQL 쪽 정렬(filesort)도 없습니다. 세션 바인드는 서버 사이드 커서를 지원하는 드라이버여야 합니다.
+        """
         sql = text("""
             SELECT
-                COUNT(DISTINCT rc.session_id) AS record_complete_count,
-                COUNT(DISTINCT av.session_id) AS analysis_view_count,
-                ROUND(CASE WHEN COUNT(DISTINCT rc.session_id) = 0 THEN 0
-                     ELSE 1.0 - COUNT(DISTINCT av.session_id) * 1.0 / COUNT(DISTINCT rc.session_id) END, 4) AS analysis_drop_rate,
-                ROUND(COALESCE(AVG(CASE WHEN av.session_id IS NOT NULL
-                     THEN TIMESTAMPDIFF(SECOND, rc.occurred_at, av.occurred_at) END) / 60.0, 0), 2) AS avg_analysis_duration_minutes
-            FROM event_log rc
-            LEFT JOIN event_log av ON rc.session_id = av.session_id AND av.event_name = 'analysis_view'
-                AND TIMESTAMPDIFF(MINUTE, rc.occurred_at, av.occurred_at) BETWEEN 0 AND :threshold
-            WHERE rc.event_name = 'record_complete'
+                session_id,
+                COALESCE(user_id, anon_id) AS identifier,
+                event_name,
+                TIMESTAMPDIFF(SECOND, '1970-01-01 00:00:00', occurred_at) AS ts
+            FROM event_log
+            WHERE occurred_at >= :since AND occurred_at < :until
         """)
-        row = session.execute(sql, {"threshold": threshold_minutes}).mappings().first()
-        return self._safe_funnel_row(row, "record_complete_count", "analysis_view_count", "analysis_drop_rate", "avg_analysis_duration_minutes")
+        result = session.execute(
+            sql, period_params(since, until), execution_options={"stream_results": True, "max_row_buffer": batch_size},
+        )
+        for partition in result.partitions(batch_size):
+            yield [tuple(row) for row in partition]
 
-    def get_step_funnel(self, session: Session, step_names: list[str]) -> list[dict]:
-        placeholders = ", ".join(f":s{i}" for i in range(len(step_names)))
+    def get_funnels(
+        self,
+        session: Session,
+        threshold_minutes: int,
+        step_names: list[str],
+        since: datetime | None = None,
+        until: datetime | None = None,
+    ) -> dict:
+        """
+        record / analysis / step 퍼널을 event_log 한 번 스캔으로 함께 계산합니다.
+        (event_name, session_id, occurred_at) 커버링 인덱스만 읽고, 세션별 시간순 윈도우로 짝을 셉니다.
+
+        결과 정의는 이전 self-join 쿼리와 같습니다.
+        - 도착 단계 행 c 마다 TIMESTAMPDIFF(MINUTE, s, c) BETWEEN 0 AND threshold 인 시작 단계 행 s 의 수와
+          시각 합을 RANGE 윈도우로 구합니다. 분 단위 차이는 0 쪽으로 잘리므로 c - s 가 -59초 ~ threshold분 59초인 범위입니다.
+        - 완료 세션 수는 짝이 하나라도 있는 세션 수, 평균 소요 시간은 모든 (s, c) 짝의 평균입니다.
+        since / until 은 occurred_at 조건이라 해당 월 파티션만 읽습니다.
+        """
+        event_names = list(dict.fromkeys([*step_names, "record_screen_view", "record_complete", "analysis_view"]))
+        params = {f"e{i}": name for i, name in enumerate(event_names)}
+        params.update({"screen_view": "record_screen_view", "complete": "record_complete", "analysis_view": "analysis_view"})
+        params.update(period_params(since, until))
+        placeholders = ", ".join(f":e{i}" for i in range(len(event_names)))
+        step_flags = ",\n                    ".join(
+            f"MAX(event_name = :e{event_names.index(step)}) AS step{i}" for i, step in enumerate(step_names)
+        )
+        step_counts = ",\n                ".join(f"SUM(step{i}) AS step{i}" for i in range(len(step_names)))
+        # 윈도우 프레임 경계는 리터럴이어야 하므로 정수로 만들어 넣습니다.
+        preceding_seconds = int(threshold_minutes) * 60 + 59
         sql = text(f"""
-            SELECT event_name, COUNT(DISTINCT session_id) AS sessions
-            FROM event_log WHERE event_name IN ({placeholders}) GROUP BY event_name
+            WITH ev AS (
+                SELECT session_id, event_name, TO_SECONDS(occurred_at) AS ts
+                FROM event_log
+                WHERE event_name IN ({placeholders}) AND occurred_at >= :since AND occurred_at < :until
+            ),
+            paired AS (
+                SELECT
+                    session_id, event_name, ts,
+                    SUM(event_name = :screen_view) OVER w AS screen_view_pairs,
+                    SUM(CASE WHEN event_name = :screen_view THEN ts END) OVER w AS screen_view_ts_sum,
+                    SUM(event_name = :complete) OVER w AS complete_pairs,
+                    SUM(CASE WHEN event_name = :complete THEN ts END) OVER w AS complete_ts_sum
+                FROM ev
+                WINDOW w AS (PARTITION BY session_id ORDER BY ts RANGE BETWEEN {preceding_seconds} PRECEDING AND 59 FOLLOWING)
+            ),
+            per_session AS (
+                SELECT
+                    MAX(event_name = :screen_view) AS has_screen_view,
+                    MAX(event_name = :complete) AS has_complete,
+                    SUM(CASE WHEN event_name = :complete THEN screen_view_pairs END) AS record_pairs,
+                    SUM(CASE WHEN event_name = :complete
+                        THEN screen_view_pairs * ts - COALESCE(screen_view_ts_sum, 0) END) AS record_seconds,
+                    SUM(CASE WHEN event_name = :analysis_view THEN complete_pairs END) AS analysis_pairs,
+                    SUM(CASE WHEN event_name = :analysis_view
+                        THEN complete_pairs * ts - COALESCE(complete_ts_sum, 0) END) AS analysis_seconds,
+                    {step_flags}
+                FROM paired
+                GROUP BY session_id
+            )
+            SELECT
+                SUM(has_screen_view) AS record_start_count,
+                SUM(record_pairs > 0) AS record_complete_count,
+                ROUND(CASE WHEN COALESCE(SUM(has_screen_view), 0) = 0 THEN 0
+                     ELSE 1.0 - SUM(record_pairs > 0) * 1.0 / SUM(has_screen_view) END, 4) AS record_drop_rate,
+                ROUND(COALESCE(SUM(record_seconds) / SUM(record_pairs) / 60.0, 0), 2) AS avg_record_duration_minutes,
+                SUM(has_complete) AS analysis_record_complete_count,
+                SUM(analysis_pairs > 0) AS analysis_view_count,
+                ROUND(CASE WHEN COALESCE(SUM(has_complete), 0) = 0 THEN 0
+                     ELSE 1.0 - SUM(analysis_pairs > 0) * 1.0 / SUM(has_complete) END, 4) AS analysis_drop_rate,
+                ROUND(COALESCE(SUM(analysis_seconds) / SUM(analysis_pairs) / 60.0, 0), 2) AS avg_analysis_duration_minutes,
+                {step_counts}
+            FROM per_session
         """)
-        params = {f"s{i}": step for i, step in enumerate(step_names)}
-        rows = session.execute(sql, params).mappings().all()
-        counts = {row["event_name"]: int(row["sessions"]) for row in rows}
-
-        result = []
-        for i, step in enumerate(step_names):
-            current = counts.get(step, 0)
-            prev = counts.get(step_names[i - 1], 0) if i > 0 else current
-            drop_rate = round(1.0 - current / prev, 4) if prev > 0 else 0.0
-            result.append({"step": step, "label": STEP_LABELS.get(step, step), "sessions": current, "drop_rate": drop_rate})
-        return result
-
-    def get_retention(self, session: Session, retention_days: int) -> dict:
+        row = session.execute(sql, params).mappings().first()
+        record_funnel = safe_funnel_row(
+            row, "record_start_count", "record_complete_count", "record_drop_rate", "avg_record_duration_minutes",
+        )
+        analysis_row = safe_funnel_row(
+            row, "analysis_record_complete_count", "analysis_view_count", "analysis_drop_rate", "avg_analysis_duration_minutes",
+        )
+        analysis_funnel = {"record_complete_count": analysis_row.pop("analysis_record_complete_count"), **analysis_row}
+        counts = {step: int(row[f"step{i}"] or 0) if row else 0 for i, step in enumerate(step_names)}
+        return {
+            "record_funnel": record_funnel,
+            "analysis_funnel": analysis_funnel,
+            "step_funnel": build_step_funnel(step_names, counts),
+        }
+
+    def get_retention(
+        self,
+        session: Session,
+        retention_days: int,
+        since: datetime | None = None,
+        until: datetime | None = None,
+    ) -> dict:
         sql = text("""
             SELECT
                 COUNT(DISTINCT fv.identifier) AS total_users,
@@ -135,25 +275,26 @@ class EventLogRepositoryImpl(EventLogRepository):
             FROM (
                 SELECT COALESCE(user_id, anon_id) AS identifier, MIN(occurred_at) AS first_view_at
                 FROM event_log WHERE event_name = 'analysis_view' AND COALESCE(user_id, anon_id) IS NOT NULL
+                    AND occurred_at >= :since AND occurred_at < :until
                 GROUP BY COALESCE(user_id, anon_id)
             ) fv
             LEFT JOIN (
                 SELECT COALESCE(user_id, anon_id) AS identifier, occurred_at
                 FROM event_log WHERE event_name = 'analysis_view' AND COALESCE(user_id, anon_id) IS NOT NULL
+                    AND occurred_at >= :since AND occurred_at < :until
             ) rv ON fv.identifier = rv.identifier AND rv.occurred_at > fv.first_view_at
                 AND DATEDIFF(rv.occurred_at, fv.first_view_at) <= :days
         """)
-        row = session.execute(sql, {"days": retention_days}).mappings().first()
+        row = session.execute(sql, {"days": retention_days, **period_params(since, until)}).mappings().first()
         if not row:
-            return {"total_users": 0, "retained_users": 0, "retention_rate_percent": 0.0, "retention_window_days": retention_days}
+            return {
+                "total_users": 0, "retained_users": 0, "retention_rate_percent": 0.0,
+                "retention_window_days": retention_days, "first_seen_scope": FIRST_SEEN_SCOPE_PERIOD,
+            }
         return {
             "total_users": int(row["total_users"] or 0),
             "retained_users": int(row["retained_users"] or 0),
             "retention_rate_percent": float(row["retention_rate_percent"] or 0.0),
             "retention_window_days": retention_days,
+            "first_seen_scope": FIRST_SEEN_SCOPE_PERIOD,
         }
-
-    def _safe_funnel_row(self, row, k0: str, k1: str, k2: str, k3: str) -> dict:
-        if not row:
-            return {k0: 0, k1: 0, k2: 0.0, k3: 0.0}
-        return {k0: int(row[k0] or 0), k1: int(row[k1] or 0), k2: float(row[k2] or 0.0), k3: float(row[k3] or 0.0)}
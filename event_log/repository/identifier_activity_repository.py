@@ -0,0 +1,35 @@
+from abc import ABC, abstractmethod
+from datetime import date, datetime
+from sqlalchemy.orm import Session
+from moodping.event_log.domain.entity.event_log import EventLog
+
+class IdentifierActivityRepository(ABC):
+    @abstractmethod
+    def upsert_from_events(self, session: Session, event_logs: list[EventLog]) -> None:
+        pass
+
+    @abstractmethod
+    def rebuild_from_event_log(self, session: Session, day: date) -> int:
+        pass
+
+    @abstractmethod
+    def get_retention(
+        self,
+        session: Session,
+        retention_days: int,
+        since: datetime | None = None,
+        until: datetime | None = None,
+    ) -> dict:
+        pass
+
+    @abstractmethod
+    def get_retention_cohorts(
+        self,
+        session: Session,
+        as_of: date,
+        curve_days: int,
+        cohort_weeks: int,
+        since: datetime | None = None,
+        until: datetime | None = None,
+    ) -> dict:
+        pass
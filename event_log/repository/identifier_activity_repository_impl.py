@@ -0,0 +1,250 @@
+from collections import defaultdict
+from datetime import date, datetime, timedelta
+from sqlalchemy.orm import Session
+from sqlalchemy import case, func, text
+from sqlalchemy.dialects.mysql import insert
+from moodping.event_log.domain.entity.event_log import EventLog
+from moodping.event_log.domain.entity.identifier_activity import (
+    ACTIVITY_BITMAP_MASK,
+    ACTIVITY_EVENT_NAME,
+    ACTIVITY_WINDOW_DAYS,
+    IdentifierActivity,
+    activity_bitmap,
+)
+from moodping.event_log.repository.event_log_repository_impl import FIRST_SEEN_SCOPE_ALL_TIME, period_params
+from moodping.event_log.repository.identifier_activity_repository import IdentifierActivityRepository
+
+DAYS_PER_WEEK = 7
+WEEK_BITS = (1 << DAYS_PER_WEEK) - 1
+
+
+def retention_rate(retained: int, eligible: int) -> float:
+    return round(retained * 100.0 / eligible, 2) if eligible > 0 else 0.0
+
+
+class IdentifierActivityRepositoryImpl(IdentifierActivityRepository):
+    __instance = None
+
+    def __new__(cls):
+        if cls.__instance is None:
+            cls.__instance = super().__new__(cls)
+        return cls.__instance
+
+    @classmethod
+    def get_instance(cls):
+        if cls.__instance is None:
+            cls.__instance = cls()
+        return cls.__instance
+
+    def upsert_from_events(self, session: Session, event_logs: list[EventLog]) -> None:
+        """
+        ACTIVITY_EVENT_NAME 이벤트를 식별자별 활동일로 모아 identifier_activity 에 multi-row upsert 합니다.
+        event_log 저장과 같은 트랜잭션에서 호출합니다. 잠금 순서를 맞추기 위해 identifier 순으로 넣습니다.
+        """
+        active_times: dict[str, list[datetime]] = defaultdict(list)
+        for event_log in event_logs:
+            identifier = event_log.user_id or event_log.anon_id
+            if event_log.event_name == ACTIVITY_EVENT_NAME and identifier:
+                active_times[identifier].append(event_log.occurred_at)
+        if not active_times:
+            return
+
+        rows = []
+        for identifier in sorted(active_times):
+            times = active_times[identifier]
+            dates = {occurred_at.date() for occurred_at in times}
+            first_seen_date = min(dates)
+            rows.append({
+                "identifier":             identifier,
+                "first_seen_date":        first_seen_date,
+                "last_seen_date":         max(dates),
+                "activity_bitmap":        activity_bitmap(first_seen_date, dates),
+                "first_seen_at":          min(times),
+                "first_day_last_seen_at": max(t for t in times if t.date() == first_seen_date),
+            })
+
+        stmt = insert(IdentifierActivity).values(rows)
+        current = IdentifierActivity.__table__.c
+        inserted = stmt.inserted
+        # 두 비트맵을 더 이른 최초 활동일 기준으로 맞춰 OR 합니다. (63일 이상 밀리면 MySQL 시프트 결과는 0)
+        current_shift = func.greatest(func.datediff(current.first_seen_date, inserted.first_seen_date), 0)
+        inserted_shift = func.greatest(func.datediff(inserted.first_seen_date, current.first_seen_date), 0)
+        merged_bitmap = (
+            current.activity_bitmap.op("<<")(current_shift)
+            .op("|")(inserted.activity_bitmap.op("<<")(inserted_shift))
+            .op("&")(ACTIVITY_BITMAP_MASK)
+        )
+        # 최초 활동일이 같으면 더 늦은 시각, 다르면 더 이른 최초 활동일 쪽 값 (컬럼 추가 전 NULL 행은 새 값)
+        merged_first_day_last_seen_at = case(
+            (inserted.first_seen_date < current.first_seen_date, inserted.first_day_last_seen_at),
+            (inserted.first_seen_date > current.first_seen_date, current.first_day_last_seen_at),
+            else_=func.coalesce(
+                func.greatest(current.first_day_last_seen_at, inserted.first_day_last_seen_at),
+                inserted.first_day_last_seen_at,
+            ),
+        )
+        # MySQL 은 ON DUPLICATE KEY UPDATE 를 왼쪽부터 적용하므로 비트맵·당일 마지막 시각을 first_seen_date 보다 먼저 갱신해야 합니다.
+        session.execute(stmt.on_duplicate_key_update([
+            ("activity_bitmap", merged_bitmap),
+            ("first_day_last_seen_at", merged_first_day_last_seen_at),
+            ("first_seen_at", func.coalesce(
+                func.least(current.first_seen_at, inserted.first_seen_at), inserted.first_seen_at,
+            )),
+            ("first_seen_date", func.least(current.first_seen_date, inserted.first_seen_date)),
+            ("last_seen_date", func.greatest(current.last_seen_date, inserted.last_seen_date)),
+        ]))
+
+    def rebuild_from_event_log(self, session: Session, day: date) -> int:
+        """
+        event_log 의 하루치(occurred_at 기준) 활동을 identifier_activity 에 반영합니다.
+        적재 시점 갱신과 같은 병합 규칙이라 날짜 순서와 무관하게, 서비스 중에도 실행할 수 있습니다.
+        반영한 식별자 수(MySQL 영향 행 수 기준, 갱신은 2로 셈)를 반환합니다.
+        """
+        sql = text(f"""
+            INSERT INTO identifier_activity
+                (identifier, first_seen_date, last_seen_date, activity_bitmap, first_seen_at, first_day_last_seen_at)
+            SELECT COALESCE(user_id, anon_id), :day, :day, 1, MIN(occurred_at), MAX(occurred_at)
+            FROM event_log
+            WHERE event_name = :event_name AND occurred_at >= :start AND occurred_at < :end
+                AND COALESCE(user_id, anon_id) IS NOT NULL
+            GROUP BY COALESCE(user_id, anon_id)
+            ON DUPLICATE KEY UPDATE
+                activity_bitmap = (
+                    (activity_bitmap << GREATEST(DATEDIFF(first_seen_date, VALUES(first_seen_date)), 0))
+                    | (VALUES(activity_bitmap) << GREATEST(DATEDIFF(VALUES(first_seen_date), first_seen_date), 0))
+                ) & {ACTIVITY_BITMAP_MASK},
+                first_day_last_seen_at = CASE
+                    WHEN VALUES(first_seen_date) < first_seen_date THEN VALUES(first_day_last_seen_at)
+                    WHEN VALUES(first_seen_date) > first_seen_date THEN first_day_last_seen_at
+                    ELSE COALESCE(GREATEST(first_day_last_seen_at, VALUES(first_day_last_seen_at)), VALUES(first_day_last_seen_at))
+                END,
+                first_seen_at = COALESCE(LEAST(first_seen_at, VALUES(first_seen_at)), VALUES(first_seen_at)),
+                first_seen_date = LEAST(first_seen_date, VALUES(first_seen_date)),
+                last_seen_date = GREATEST(last_seen_date, VALUES(last_seen_date))
+        """)
+        start = datetime.combine(day, datetime.min.time())
+        result = session.execute(sql, {
+            "day": day,
+            "event_name": ACTIVITY_EVENT_NAME,
+            "start": start,
+            "end": start + timedelta(days=1),
+        })
+        return result.rowcount
+
+    def get_retention(
+        self,
+        session: Session,
+        retention_days: int,
+        since: datetime | None = None,
+        until: datetime | None = None,
+    ) -> dict:
+        """
+        최초 활동일이 기간 안인 식별자 중 최초 활동 뒤 retention_days 일째까지 다시 활동한 비율.
+        event_log 원본 집계와 같이 최초 활동일 당일의 재방문(first_day_last_seen_at > first_seen_at)도 유지로 셉니다.
+        since / until 을 주면 최초 활동일은 기간 안의 첫 활동이 아니라 전체 기간의 첫 활동일입니다 (first_seen_scope 로 표시).
+        """
+        if not 0 < retention_days < ACTIVITY_WINDOW_DAYS:
+            raise ValueError(f"retention_days must be between 1 and {ACTIVITY_WINDOW_DAYS - 1}")
+        retained_bits = ((1 << (retention_days + 1)) - 1) & ~1
+        sql = text(f"""
+            SELECT
+                COUNT(*) AS total_users,
+                COALESCE(SUM(
+                    (activity_bitmap & {retained_bits}) <> 0 OR first_day_last_seen_at > first_seen_at
+                ), 0) AS retained_users
+            FROM identifier_activity
+            WHERE first_seen_date >= :since AND first_seen_date < :until
+        """)
+        row = session.execute(sql, period_params(since, until)).mappings().first()
+        total_users = int(row["total_users"] or 0) if row else 0
+        retained_users = int(row["retained_users"] or 0) if row else 0
+        return {
+            "total_users": total_users,
+            "retained_users": retained_users,
+            "retention_rate_percent": retention_rate(retained_users, total_users),
+            "retention_window_days": retention_days,
+            "first_seen_scope": FIRST_SEEN_SCOPE_ALL_TIME,
+        }
+
+    def get_retention_cohorts(
+        self,
+        session: Session,
+        as_of: date,
+        curve_days: int,
+        cohort_weeks: int,
+        since: datetime | None = None,
+        until: datetime | None = None,
+    ) -> dict:
+        """
+        identifier_activity 한 번 스캔으로 d일째 리텐션 곡선(1~curve_days)과 최초 활동 주(월요일 시작)별 주간 코호트를 계산합니다.
+        d일째(또는 w주째) 구간이 as_of 까지 시작된 식별자만 분모에 넣습니다.
+        곡선은 주간 코호트 행을 합쳐서 만듭니다.
+        """
+        if not 0 < curve_days < ACTIVITY_WINDOW_DAYS:
+            raise ValueError(f"curve_days must be between 1 and {ACTIVITY_WINDOW_DAYS - 1}")
+        if not 0 < cohort_weeks or DAYS_PER_WEEK * (cohort_weeks + 1) > ACTIVITY_WINDOW_DAYS:
+            raise ValueError(f"cohort_weeks must be between 1 and {ACTIVITY_WINDOW_DAYS // DAYS_PER_WEEK - 1}")
+
+        params = period_params(since, until)
+        columns = []
+        for d in range(1, curve_days + 1):
+            params[f"day_cutoff{d}"] = as_of - timedelta(days=d)
+            columns.append(f"SUM(first_seen_date <= :day_cutoff{d}) AS day_eligible{d}")
+            columns.append(f"SUM((activity_bitmap >> {d}) & 1) AS day_retained{d}")
+        for w in range(1, cohort_weeks + 1):
+            params[f"week_cutoff{w}"] = as_of - timedelta(days=DAYS_PER_WEEK * w)
+            columns.append(f"SUM(first_seen_date <= :week_cutoff{w}) AS week_eligible{w}")
+            columns.append(
+                f"SUM(((activity_bitmap >> {DAYS_PER_WEEK * w}) & {WEEK_BITS}) <> 0) AS week_retained{w}"
+            )
+        select_columns = ",\n                ".join(columns)
+        sql = text(f"""
+            SELECT
+                DATE_SUB(first_seen_date, INTERVAL WEEKDAY(first_seen_date) DAY) AS cohort_week,
+                COUNT(*) AS users,
+                {select_columns}
+            FROM identifier_activity
+            WHERE first_seen_date >= :since AND first_seen_date < :until
+            GROUP BY cohort_week
+            ORDER BY cohort_week
+        """)
+        rows = session.execute(sql, params).mappings().all()
+
+        day_eligible = [0] * (curve_days + 1)
+        day_retained = [0] * (curve_days + 1)
+        weekly_cohorts = []
+        for row in rows:
+            for d in range(1, curve_days + 1):
+                day_eligible[d] += int(row[f"day_eligible{d}"] or 0)
+                day_retained[d] += int(row[f"day_retained{d}"] or 0)
+            weeks = []
+            for w in range(1, cohort_weeks + 1):
+                eligible = int(row[f"week_eligible{w}"] or 0)
+                retained = int(row[f"week_retained{w}"] or 0)
+                weeks.append({
+                    "week": w,
+                    "eligible_users": eligible,
+                    "retained_users": retained,
+                    "retention_rate_percent": retention_rate(retained, eligible),
+                })
+            weekly_cohorts.append({
+                "cohort_week": str(row["cohort_week"]),
+                "users": int(row["users"] or 0),
+                "weeks": weeks,
+            })
+
+        return {
+            "as_of": as_of.isoformat(),
+            "activity_event": ACTIVITY_EVENT_NAME,
+            "total_users": sum(cohort["users"] for cohort in weekly_cohorts),
+            "curve": [
+                {
+                    "day": d,
+                    "eligible_users": day_eligible[d],
+                    "retained_users": day_retained[d],
+                    "retention_rate_percent": retention_rate(day_retained[d], day_eligible[d]),
+                }
+                for d in range(1, curve_days + 1)
+            ],
+            "weekly_cohorts": weekly_cohorts,
+        }
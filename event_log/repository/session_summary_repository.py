@@ -0,0 +1,40 @@
+from abc import ABC, abstractmethod
+from datetime import datetime
+from sqlalchemy.orm import Session
+from moodping.event_log.domain.entity.event_log import EventLog
+
+class SessionSummaryRepository(ABC):
+    @abstractmethod
+    def upsert_from_events(self, session: Session, event_logs: list[EventLog]) -> None:
+        pass
+
+    @abstractmethod
+    def refresh_pairs(self, session: Session, session_ids: list[str]) -> None:
+        pass
+
+    @abstractmethod
+    def rebuild_from_event_log(self, session: Session, after_session_id: str, limit: int) -> str | None:
+        pass
+
+    @abstractmethod
+    def get_funnels(
+        self,
+        session: Session,
+        threshold_minutes: int,
+        step_names: list[str],
+        since: datetime | None = None,
+        until: datetime | None = None,
+    ) -> dict:
+        pass
+
+    @abstractmethod
+    def get_record_funnel(self, session: Session, threshold_minutes: int, period: dict) -> dict:
+        pass
+
+    @abstractmethod
+    def get_analysis_funnel(self, session: Session, threshold_minutes: int, period: dict) -> dict:
+        pass
+
+    @abstractmethod
+    def get_step_funnel(self, session: Session, step_names: list[str], period: dict) -> list[dict]:
+        pass
@@ -0,0 +1,241 @@
+from datetime import datetime
+from sqlalchemy.orm import Session
+from sqlalchemy import bindparam, func, text
+from sqlalchemy.dialects.mysql import insert
+from moodping.event_log.domain.entity.event_log import EventLog
+from moodping.event_log.domain.entity.session_summary import (
+    FUNNEL_PAIR_THRESHOLD_MINUTES,
+    FUNNEL_STEPS,
+    KEY_STEP_COLUMNS,
+    SessionSummary,
+    step_bit,
+)
+from moodping.event_log.repository.event_log_repository_impl import build_step_funnel, period_params, safe_funnel_row
+from moodping.event_log.repository.session_summary_repository import SessionSummaryRepository
+
+
+# 세션들의 짝 수·소요 초 합을 event_log 에서 다시 계산해 덮어씁니다 (EventLogRepositoryImpl.get_funnels 와 같은 윈도우 정의).
+# INSERT ... SELECT 는 event_log 를 잠금 읽기로 읽으므로, 다른 트랜잭션이 같은 세션에 막 넣은 이벤트도 커밋을 기다려 반영합니다.
+# 행은 upsert_from_events / rebuild_from_event_log 가 먼저 만들어 두므로 INSERT 쪽 값은 쓰이지 않습니다.
+_REFRESH_PAIRS_SQL = """
+    INSERT INTO session_summary
+        (session_id, first_event_at, last_event_at, steps_mask,
+         record_pairs, record_pair_seconds, analysis_pairs, analysis_pair_seconds)
+    SELECT
+        session_id, MIN(occurred_at), MAX(occurred_at), 0,
+        COALESCE(SUM(CASE WHEN event_name = :complete THEN screen_view_pairs END), 0),
+        COALESCE(SUM(CASE WHEN event_name = :complete THEN screen_view_pairs * ts - COALESCE(screen_view_ts_sum, 0) END), 0),
+        COALESCE(SUM(CASE WHEN event_name = :analysis_view THEN complete_pairs END), 0),
+        COALESCE(SUM(CASE WHEN event_name = :analysis_view THEN complete_pairs * ts - COALESCE(complete_ts_sum, 0) END), 0)
+    FROM (
+        SELECT
+            session_id, event_name, occurred_at, ts,
+            SUM(event_name = :screen_view) OVER w AS screen_view_pairs,
+            SUM(CASE WHEN event_name = :screen_view THEN ts END) OVER w AS screen_view_ts_sum,
+            SUM(event_name = :complete) OVER w AS complete_pairs,
+            SUM(CASE WHEN event_name = :complete THEN ts END) OVER w AS complete_ts_sum
+        FROM (
+            SELECT session_id, event_name, occurred_at, TO_SECONDS(occurred_at) AS ts
+            FROM event_log
+            WHERE session_id IN :session_ids AND event_name IN (:screen_view, :complete, :analysis_view)
+        ) ev
+        WINDOW w AS (PARTITION BY session_id ORDER BY ts RANGE BETWEEN {preceding_seconds} PRECEDING AND 59 FOLLOWING)
+    ) paired
+    GROUP BY session_id
+    ON DUPLICATE KEY UPDATE
+        record_pairs = VALUES(record_pairs),
+        record_pair_seconds = VALUES(record_pair_seconds),
+        analysis_pairs = VALUES(analysis_pairs),
+        analysis_pair_seconds = VALUES(analysis_pair_seconds)
+"""
+
+
+def _least_nullable(current, new):
+    # MySQL LEAST 는 인자 중 NULL 이 있으면 NULL 을 돌려주므로 한쪽만 있을 때는 그 값을 씁니다.
+    return func.coalesce(func.least(current, new), current, new)
+
+
+class SessionSummaryRepositoryImpl(SessionSummaryRepository):
+    __instance = None
+
+    def __new__(cls):
+        if cls.__instance is None:
+            cls.__instance = super().__new__(cls)
+        return cls.__instance
+
+    @classmethod
+    def get_instance(cls):
+        if cls.__instance is None:
+            cls.__instance = cls()
+        return cls.__instance
+
+    def upsert_from_events(self, session: Session, event_logs: list[EventLog]) -> None:
+        """
+        이벤트를 세션별로 모아 session_summary 에 multi-row upsert 합니다.
+        event_log 저장과 같은 트랜잭션에서 호출합니다. 잠금 순서를 맞추기 위해 session_id 순으로 넣습니다.
+        """
+        if not event_logs:
+            return
+        rows: dict[str, dict] = {}
+        for event_log in event_logs:
+            occurred_at = event_log.occurred_at
+            row = rows.get(event_log.session_id)
+            if row is None:
+                row = rows[event_log.session_id] = {
+                    "session_id":     event_log.session_id,
+                    "first_event_at": occurred_at,
+                    "last_event_at":  occurred_at,
+                    "steps_mask":     0,
+                    **{column: None for column in KEY_STEP_COLUMNS.values()},
+                }
+            row["first_event_at"] = min(row["first_event_at"], occurred_at)
+            row["last_event_at"] = max(row["last_event_at"], occurred_at)
+            row["steps_mask"] |= step_bit(event_log.event_name)
+            column = KEY_STEP_COLUMNS.get(event_log.event_name)
+            if column is not None and (row[column] is None or occurred_at < row[column]):
+                row[column] = occurred_at
+
+        stmt = insert(SessionSummary).values([rows[session_id] for session_id in sorted(rows)])
+        current = SessionSummary.__table__.c
+        session.execute(stmt.on_duplicate_key_update(
+            first_event_at=func.least(current.first_event_at, stmt.inserted.first_event_at),
+            last_event_at=func.greatest(current.last_event_at, stmt.inserted.last_event_at),
+            steps_mask=current.steps_mask.op("|")(stmt.inserted.steps_mask),
+            **{
+                column: _least_nullable(current[column], stmt.inserted[column])
+                for column in KEY_STEP_COLUMNS.values()
+            },
+        ))
+        key_step_sessions = sorted({
+            event_log.session_id for event_log in event_logs if event_log.event_name in KEY_STEP_COLUMNS
+        })
+        self.refresh_pairs(session, key_step_sessions)
+
+    def refresh_pairs(self, session: Session, session_ids: list[str]) -> None:
+        """
+        세션들의 (시작, 도착) 짝 수와 소요 초 합을 그 세션의 event_log 전체로 다시 계산합니다.
+        임계값은 TIMESTAMPDIFF(MINUTE) 가 0 쪽으로 잘리므로 도착 - 시작이 -59초 ~ 임계값분 59초인 범위입니다.
+        """
+        if not session_ids:
+            return
+        preceding_seconds = FUNNEL_PAIR_THRESHOLD_MINUTES * 60 + 59
+        sql = text(_REFRESH_PAIRS_SQL.format(preceding_seconds=preceding_seconds))
+        session.execute(sql.bindparams(bindparam("session_ids", expanding=True)), {
+            "session_ids": list(session_ids),
+            "screen_view": "record_screen_view",
+            "complete": "record_complete",
+            "analysis_view": "analysis_view",
+        })
+
+    def rebuild_from_event_log(self, session: Session, after_session_id: str, limit: int) -> str | None:
+        """
+        session_id 가 after_session_id 보다 큰 세션 limit 개를 event_log 에서 다시 요약해 반영합니다.
+        적재 시점 갱신과 같은 병합 규칙을 쓰므로 서비스 중에 실행해도 됩니다. 처리한 마지막 session_id 를 반환합니다.
+        """
+        session_ids = session.execute(
+            text("""
+                SELECT DISTINCT session_id FROM event_log
+                WHERE session_id > :after ORDER BY session_id LIMIT :limit
+            """),
+            {"after": after_session_id, "limit": limit},
+        ).scalars().all()
+        if not session_ids:
+            return None
+
+        step_cases = " ".join(f"WHEN :step{i} THEN {1 << i}" for i in range(len(FUNNEL_STEPS)))
+        key_step_selects = ",\n                ".join(
+            f"MIN(CASE WHEN event_name = :key_{column} THEN occurred_at END)"
+            for column in KEY_STEP_COLUMNS.values()
+        )
+        key_step_updates = ",\n                ".join(
+            f"{column} = COALESCE(LEAST({column}, VALUES({column})), {column}, VALUES({column}))"
+            for column in KEY_STEP_COLUMNS.values()
+        )
+        sql = text(f"""
+            INSERT INTO session_summary
+                (session_id, first_event_at, last_event_at, steps_mask, {", ".join(KEY_STEP_COLUMNS.values())})
+            SELECT
+                session_id,
+                MIN(occurred_at),
+                MAX(occurred_at),
+                BIT_OR(CASE event_name {step_cases} ELSE 0 END),
+                {key_step_selects}
+            FROM event_log
+            WHERE session_id IN :session_ids
+            GROUP BY session_id
+            ON DUPLICATE KEY UPDATE
+                first_event_at = LEAST(first_event_at, VALUES(first_event_at)),
+                last_event_at = GREATEST(last_event_at, VALUES(last_event_at)),
+                steps_mask = steps_mask | VALUES(steps_mask),
+                {key_step_updates}
+        """).bindparams(bindparam("session_ids", expanding=True))
+        params = {"session_ids": list(session_ids)}
+        params.update({f"step{i}": step for i, step in enumerate(FUNNEL_STEPS)})
+        params.update({f"key_{column}": step for step, column in KEY_STEP_COLUMNS.items()})
+        session.execute(sql, params)
+        self.refresh_pairs(session, list(session_ids))
+        return session_ids[-1]
+
+    def get_funnels(
+        self,
+        session: Session,
+        threshold_minutes: int,
+        step_names: list[str],
+        since: datetime | None = None,
+        until: datetime | None = None,
+    ) -> dict:
+        """
+        기간 조건은 세션 시작 시각(first_event_at) 기준입니다.
+        짝은 적재 시점에 FUNNEL_PAIR_THRESHOLD_MINUTES 로 계산해 두므로 다른 임계값은 받지 않습니다.
+        """
+        if threshold_minutes != FUNNEL_PAIR_THRESHOLD_MINUTES:
+            raise ValueError(
+                f"session_summary 는 {FUNNEL_PAIR_THRESHOLD_MINUTES}분 임계값으로만 집계됩니다 "
+                f"(다른 값은 EVENT_METRICS_SOURCE=events 를 사용하세요)."
+            )
+        period = period_params(since, until)
+        return {
+            "record_funnel": self.get_record_funnel(session, threshold_minutes, period),
+            "analysis_funnel": self.get_analysis_funnel(session, threshold_minutes, period),
+            "step_funnel": self.get_step_funnel(session, step_names, period),
+        }
+
+    def get_record_funnel(self, session: Session, threshold_minutes: int, period: dict) -> dict:
+        sql = text("""
+            SELECT
+                COUNT(*) AS record_start_count,
+                SUM(record_pairs > 0) AS record_complete_count,
+                ROUND(CASE WHEN COUNT(*) = 0 THEN 0
+                     ELSE 1.0 - SUM(record_pairs > 0) * 1.0 / COUNT(*) END, 4) AS record_drop_rate,
+                ROUND(COALESCE(SUM(record_pair_seconds) / NULLIF(SUM(record_pairs), 0) / 60.0, 0), 2) AS avg_record_duration_minutes
+            FROM session_summary
+            WHERE record_screen_view_at IS NOT NULL AND first_event_at >= :since AND first_event_at < :until
+        """)
+        row = session.execute(sql, period).mappings().first()
+        return safe_funnel_row(row, "record_start_count", "record_complete_count", "record_drop_rate", "avg_record_duration_minutes")
+
+    def get_analysis_funnel(self, session: Session, threshold_minutes: int, period: dict) -> dict:
+        sql = text("""
+            SELECT
+                COUNT(*) AS record_complete_count,
+                SUM(analysis_pairs > 0) AS analysis_view_count,
+                ROUND(CASE WHEN COUNT(*) = 0 THEN 0
+                     ELSE 1.0 - SUM(analysis_pairs > 0) * 1.0 / COUNT(*) END, 4) AS analysis_drop_rate,
+                ROUND(COALESCE(SUM(analysis_pair_seconds) / NULLIF(SUM(analysis_pairs), 0) / 60.0, 0), 2) AS avg_analysis_duration_minutes
+            FROM session_summary
+            WHERE record_complete_at IS NOT NULL AND first_event_at >= :since AND first_event_at < :until
+        """)
+        row = session.execute(sql, period).mappings().first()
+        return safe_funnel_row(row, "record_complete_count", "analysis_view_count", "analysis_drop_rate", "avg_analysis_duration_minutes")
+
+    def get_step_funnel(self, session: Session, step_names: list[str], period: dict) -> list[dict]:
+        columns = ", ".join(
+            f"COALESCE(SUM((steps_mask & {step_bit(step)}) <> 0), 0) AS s{i}"
+            for i, step in enumerate(step_names)
+        )
+        row = session.execute(
+            text(f"SELECT {columns} FROM session_summary WHERE first_event_at >= :since AND first_event_at < :until"),
+            period,
+        ).mappings().first()
+        counts = {step: int(row[f"s{i}"]) if row else 0 for i, step in enumerate(step_names)}
+        return build_step_funnel(step_names, counts)
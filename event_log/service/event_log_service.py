@@ -1,9 +1,11 @@
 from abc import ABC, abstractmethod
+from datetime import date
 from typing import TYPE_CHECKING
 from moodping.event_log.domain.entity.event_log import EventLog
 
 if TYPE_CHECKING:
     from moodping.event_log.controller.request.create_event_log_request import CreateEventLogRequest
+    from moodping.event_log.controller.request.create_event_log_batch_request import CreateEventLogBatchRequest
 
 class EventLogService(ABC):
     @abstractmethod
@@ -11,5 +13,13 @@ class EventLogService(ABC):
         pass
 
     @abstractmethod
-    def get_metrics(self) -> dict:
+    def create_batch(self, request: "CreateEventLogBatchRequest") -> dict:
+        pass
+
+    @abstractmethod
+    def get_metrics(self, since: date | None = None, until: date | None = None) -> dict:
+        pass
+
+    @abstractmethod
+    def get_retention(self, since: date | None = None, until: date | None = None) -> dict:
         pass
@@ -1,16 +1,34 @@
+import functools
 import logging
-from datetime import datetime
-from sqlalchemy.orm import Session
-from moodping.config.mysql_config import SessionLocal
+from collections.abc import Callable
+from datetime import date, datetime, time, timedelta, timezone
+from moodping.config.read_replica import replica_read
+from moodping.config.unit_of_work import UnitOfWork
 from moodping.event_log.domain.entity.event_log import EventLog
-from moodping.event_log.repository.event_log_repository_impl import EventLogRepositoryImpl, FUNNEL_STEPS
+from moodping.config.settings import get_settings
+from moodping.event_log.cache.result_cache import CachedResult, StaleWhileRevalidateCache
+from moodping.event_log.domain.entity.session_summary import FUNNEL_PAIR_THRESHOLD_MINUTES, FUNNEL_STEPS
+from moodping.event_log.repository.event_log_repository_impl import EventLogRepositoryImpl
+from moodping.event_log.repository.identifier_activity_repository_impl import IdentifierActivityRepositoryImpl
+from moodping.event_log.repository.session_summary_repository_impl import SessionSummaryRepositoryImpl
 from moodping.event_log.controller.request.create_event_log_request import CreateEventLogRequest
+from moodping.event_log.controller.request.create_event_log_batch_request import (
+    BatchEventLogItem,
+    CreateEventLogBatchRequest,
+)
 from moodping.event_log.service.event_log_service import EventLogService
+from moodping.event_log.spool.event_spool import EventSpool
 
 logger = logging.getLogger(__name__)
 
-DROP_THRESHOLD_MINUTES = 10
+DROP_THRESHOLD_MINUTES = FUNNEL_PAIR_THRESHOLD_MINUTES
 RETENTION_DAYS = 7
+RETENTION_CURVE_DAYS = 30
+RETENTION_COHORT_WEEKS = 4
+METRICS_SOURCE_SUMMARY = "summary"
+METRICS_SOURCE_EVENTS = "events"
+# 클라이언트 버퍼링 지연 보정 상한. 이보다 오래 묵은 이벤트도 이만큼만 앞당깁니다.
+MAX_CLIENT_DELAY_SECONDS = 600
 
 class EventLogServiceImpl(EventLogService):
     __instance = None
@@ -28,47 +46,179 @@ class EventLogServiceImpl(EventLogService):
 
     def __init__(self):
         self.event_log_repository = EventLogRepositoryImpl.get_instance()
+        self.session_summary_repository = SessionSummaryRepositoryImpl.get_instance()
+        self.identifier_activity_repository = IdentifierActivityRepositoryImpl.get_instance()
+        self.event_spool = EventSpool.get_instance()
+        settings = get_settings()
+        self.debug_cache = (
+            StaleWhileRevalidateCache(
+                name="debug",
+                fresh_seconds=settings.debug_cache_fresh_seconds,
+                max_stale_seconds=settings.debug_cache_max_stale_seconds,
+            )
+            if settings.debug_cache_enabled else None
+        )
 
     def create(self, request: CreateEventLogRequest) -> EventLog:
-        session: Session = SessionLocal()
-        try:
-            event_log = EventLog.create(
-                event_id=request.event_id,
-                session_id=request.session_id,
-                event_name=request.event_name,
-                user_id=request.user_id,
-                anon_id=request.anon_id,
-                extra_data=request.extra_data,
-                occurred_at=datetime.utcnow(),
-            )
-            self.event_log_repository.save(session, event_log)
-            session.commit()
-            return event_log
-        except Exception:
-            session.rollback()
-            raise
-        finally:
-            session.close()
-
-    def get_recent_records(self) -> list[dict]:
-        session: Session = SessionLocal()
-        try:
-            return self.event_log_repository.get_recent_records(session)
-        finally:
-            session.close()
-
-    def get_metrics(self) -> dict:
-        session: Session = SessionLocal()
-        try:
-            record_funnel = self.event_log_repository.get_record_funnel(session, DROP_THRESHOLD_MINUTES)
-            analysis_funnel = self.event_log_repository.get_analysis_funnel(session, DROP_THRESHOLD_MINUTES)
-            step_funnel = self.event_log_repository.get_step_funnel(session, FUNNEL_STEPS)
-            retention = self.event_log_repository.get_retention(session, RETENTION_DAYS)
+        event_log = EventLog.create(
+            event_id=request.event_id,
+            session_id=request.session_id,
+            event_name=request.event_name,
+            user_id=request.user_id,
+            anon_id=request.anon_id,
+            extra_data=request.extra_data,
+            occurred_at=datetime.utcnow(),
+        )
+        self._write([event_log])
+        return event_log
+
+    def create_batch(self, request: CreateEventLogBatchRequest) -> dict:
+        """
+        배치로 받은 이벤트를 스풀(없으면 한 트랜잭션·한 INSERT)로 저장합니다.
+        occurred_at 은 서버 시각에서 클라이언트 버퍼링 지연(sent_at - client_ts)만큼 앞당겨
+        클라이언트 시계 오차와 무관하게 이벤트 발생 시각에 가깝게 맞춥니다.
+        도메인 검증에 실패한 이벤트는 건너뛰고 나머지는 저장합니다.
+        """
+        now = datetime.utcnow()
+        event_logs: list[EventLog] = []
+        rejected = 0
+        for item in request.events:
+            try:
+                event_logs.append(EventLog.create(
+                    event_id=item.event_id,
+                    session_id=item.session_id,
+                    event_name=item.event_name,
+                    user_id=item.user_id,
+                    anon_id=item.anon_id,
+                    extra_data=item.extra_data,
+                    occurred_at=now - self._client_delay(request.sent_at, item),
+                ))
+            except ValueError as e:
+                rejected += 1
+                logger.warning("이벤트 검증 실패 (event_id=%s): %s", item.event_id, e)
+
+        if event_logs:
+            self._write(event_logs)
+        return {"received": len(request.events), "accepted": len(event_logs), "rejected": rejected}
+
+    def _write(self, event_logs: list[EventLog]) -> None:
+        """
+        스풀이 켜져 있으면 로컬 세그먼트에 fsync 까지만 하고 반환합니다 (event_log 적재는 플러셔가 담당).
+        스풀을 쓸 수 없으면 DB 에 바로 저장합니다. 어느 경로든 event_id 중복은 무시되고
+        session_summary·identifier_activity 도 같은 트랜잭션에서 갱신됩니다.
+        """
+        if self.event_spool.running:
+            try:
+                self.event_spool.append([self._to_spool_row(event_log) for event_log in event_logs])
+                return
+            except (RuntimeError, TimeoutError, OSError) as e:
+                logger.warning("이벤트 스풀 기록 실패 → DB 직접 저장: %s", e)
+        with UnitOfWork() as uow:
+            self.event_log_repository.save_all_ignore_duplicates(uow.session, event_logs)
+            self.session_summary_repository.upsert_from_events(uow.session, event_logs)
+            self.identifier_activity_repository.upsert_from_events(uow.session, event_logs)
+            uow.commit()
+
+    @staticmethod
+    def _to_spool_row(event_log: EventLog) -> dict:
+        return {
+            "event_id": event_log.event_id,
+            "session_id": event_log.session_id,
+            "user_id": event_log.user_id,
+            "anon_id": event_log.anon_id,
+            "event_name": event_log.event_name,
+            "occurred_at": event_log.occurred_at.isoformat(),
+            "extra_data": event_log.extra_data,
+        }
+
+    @staticmethod
+    def _client_delay(sent_at: int | None, item: BatchEventLogItem) -> timedelta:
+        if sent_at is None or item.client_ts is None:
+            return timedelta(0)
+        delay_ms = min(max(sent_at - item.client_ts, 0), MAX_CLIENT_DELAY_SECONDS * 1000)
+        return timedelta(milliseconds=delay_ms)
+
+    def get_recent_records(self) -> dict:
+        cached = self._get_cached("recent_records", self._load_recent_records)
+        return {"records": cached.value, **self._cache_info(cached)}
+
+    def get_metrics(self, since: date | None = None, until: date | None = None) -> dict:
+        """
+        대시보드 지표. 결과 캐시를 거치므로 열린 탭 수와 무관하게 주기당 한 번만 계산합니다.
+        since ~ until(포함) 날짜 범위를 주면 event_log 는 해당 월 파티션만 읽습니다.
+        """
+        if since is not None and until is not None and since > until:
+            raise ValueError("since must not be after until")
+        compute = functools.partial(self._compute_metrics, since, until)
+        cached = self._get_cached(f"metrics:{since}:{until}", compute)
+        return {**cached.value, **self._cache_info(cached)}
+
+    def get_retention(self, since: date | None = None, until: date | None = None) -> dict:
+        """
+        1~RETENTION_CURVE_DAYS 일째 리텐션 곡선과 주간 코호트. since ~ until(포함)은 최초 활동일 범위입니다.
+        """
+        if since is not None and until is not None and since > until:
+            raise ValueError("since must not be after until")
+        compute = functools.partial(self._compute_retention, since, until)
+        cached = self._get_cached(f"retention:{since}:{until}", compute)
+        return {**cached.value, **self._cache_info(cached)}
+
+    def _get_cached(self, key: str, compute: Callable[[], object]) -> CachedResult:
+        if self.debug_cache is None:
+            return CachedResult(value=compute(), computed_at=datetime.now(timezone.utc), age_seconds=0.0)
+        return self.debug_cache.get(key, compute)
+
+    @staticmethod
+    def _cache_info(cached: CachedResult) -> dict:
+        return {"computed_at": cached.computed_at.isoformat(), "cache_age_seconds": cached.age_seconds}
+
+    @replica_read
+    def _load_recent_records(self) -> list[dict]:
+        with UnitOfWork() as uow:
+            return self.event_log_repository.get_recent_records(uow.session)
+
+    @replica_read
+    def _compute_metrics(self, since: date | None, until: date | None) -> dict:
+        """
+        퍼널 지표는 기본적으로 session_summary 를 집계합니다 (세션당 한 행, event_log 크기와 무관).
+        세션마다 적재 시점에 event_log 원본 조인과 같은 조건으로 센 짝 수·소요 초 합(*_pairs, *_pair_seconds)을 더하므로
+        같은 단계가 반복돼도 원본 조인과 값이 같습니다. 짝은 FUNNEL_PAIR_THRESHOLD_MINUTES(= DROP_THRESHOLD_MINUTES) 기준으로
+        저장되므로 임계값을 바꾸면 rebuild_session_summary 로 session_summary 를 다시 만들어야 합니다.
+        리텐션은 identifier_activity 의 날짜 비트맵과 최초 활동일 첫·마지막 시각으로 원본 집계와 같은 기준(당일 재방문 포함)을 셉니다.
+        """
+        from_events = get_settings().event_metrics_source == METRICS_SOURCE_EVENTS
+        funnel_repository = self.event_log_repository if from_events else self.session_summary_repository
+        retention_repository = self.event_log_repository if from_events else self.identifier_activity_repository
+        since_at, until_at = self._period_bounds(since, until)
+        with UnitOfWork() as uow:
+            session = uow.session
+            funnels = funnel_repository.get_funnels(session, DROP_THRESHOLD_MINUTES, FUNNEL_STEPS, since_at, until_at)
+            retention = retention_repository.get_retention(session, RETENTION_DAYS, since_at, until_at)
             return {
+                "period": self._period(since, until),
                 "drop_threshold_minutes": DROP_THRESHOLD_MINUTES,
-                "funnel": {"record_funnel": record_funnel, "analysis_funnel": analysis_funnel},
-                "step_funnel": step_funnel,
+                "funnel": {"record_funnel": funnels["record_funnel"], "analysis_funnel": funnels["analysis_funnel"]},
+                "step_funnel": funnels["step_funnel"],
                 "retention": retention,
             }
-        finally:
-            session.close()
+
+    @replica_read
+    def _compute_retention(self, since: date | None, until: date | None) -> dict:
+        """identifier_activity 한 번 스캔 (식별자당 한 행, event_log 크기와 무관)."""
+        since_at, until_at = self._period_bounds(since, until)
+        with UnitOfWork() as uow:
+            retention = self.identifier_activity_repository.get_retention_cohorts(
+                uow.session, datetime.utcnow().date(), RETENTION_CURVE_DAYS, RETENTION_COHORT_WEEKS, since_at, until_at,
+            )
+            return {"period": self._period(since, until), **retention}
+
+    @staticmethod
+    def _period_bounds(since: date | None, until: date | None) -> tuple[datetime | None, datetime | None]:
+        """날짜 범위(until 포함)를 [since 00:00, until 다음 날 00:00) 로 바꿉니다."""
+        since_at = datetime.combine(since, time.min) if since is not None else None
+        until_at = datetime.combine(until + timedelta(days=1), time.min) if until is not None else None
+        return since_at, until_at
+
+    @staticmethod
+    def _period(since: date | None, until: date | None) -> dict:
+        return {"since": since.isoformat() if since else None, "until": until.isoformat() if until else None}
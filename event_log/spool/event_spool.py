@@ -0,0 +1,366 @@
+"""
+EventSpool — event_log 적재용 로컬 write-behind 스풀.
+
+요청 처리 경로는 이벤트를 현재 세그먼트 파일에 한 줄(JSON)씩 덧붙이고 fsync 가 끝나면 바로 응답합니다.
+- fsync 는 전용 스레드가 모아서 수행합니다 (fsync 중에 들어온 이벤트는 다음 fsync 에 함께 반영되는 group commit).
+- 세그먼트는 크기(EVENT_SPOOL_SEGMENT_MAX_BYTES)나 나이(EVENT_SPOOL_SEGMENT_MAX_AGE_SECONDS)를 넘기면 닫힙니다.
+- 백그라운드 플러셔가 닫힌 세그먼트를 큰 트랜잭션으로 event_log 에 multi-row INSERT 하고, 커밋 후 파일을 지웁니다.
+  이미 들어온 event_id 는 event_log_dedup 으로 걸러지므로 커밋 직후 중단되어 같은 세그먼트를 다시 적재해도 안전합니다.
+- 시작 시 이전 프로세스가 남긴 세그먼트를 그대로 재적재합니다.
+
+워커 프로세스마다 slot-N 디렉터리 하나를 flock 으로 점유합니다. 잠금이 풀린(종료된 프로세스의) 슬롯에 남은
+세그먼트는 살아 있는 프로세스의 플러셔가 가져가 적재합니다.
+"""
+import asyncio
+import json
+import logging
+import os
+import threading
+import time
+from datetime import datetime
+from pathlib import Path
+
+from prometheus_client import Counter, Gauge, Histogram
+
+from moodping.config.settings import get_settings
+from moodping.config.unit_of_work import UnitOfWork
+from moodping.event_log.domain.entity.event_log import EventLog
+from moodping.event_log.repository.event_log_repository_impl import EventLogRepositoryImpl
+from moodping.event_log.repository.identifier_activity_repository_impl import IdentifierActivityRepositoryImpl
+from moodping.event_log.repository.session_summary_repository_impl import SessionSummaryRepositoryImpl
+
+try:
+    import fcntl
+except ImportError:  # Windows: 단일 프로세스 개발 환경으로 보고 슬롯 잠금 없이 slot-0 만 사용
+    fcntl = None
+
+logger = logging.getLogger(__name__)
+
+_SEGMENT_SUFFIX = ".seg"
+_MAX_SLOTS = 64
+_APPEND_SYNC_TIMEOUT_SECONDS = 5.0
+
+EVENT_SPOOL_APPENDED = Counter("moodping_event_spool_appended_total", "스풀에 기록한 이벤트 수")
+EVENT_SPOOL_FLUSHED = Counter("moodping_event_spool_flushed_total", "스풀에서 event_log 로 적재한 이벤트 수")
+EVENT_SPOOL_FLUSH_ERRORS = Counter("moodping_event_spool_flush_errors_total", "세그먼트 적재 실패 횟수")
+EVENT_SPOOL_CORRUPT_LINES = Counter("moodping_event_spool_corrupt_lines_total", "읽지 못해 건너뛴 스풀 줄 수 (중단 시 잘린 마지막 줄 등)")
+EVENT_SPOOL_FSYNC = Histogram(
+    "moodping_event_spool_fsync_seconds",
+    "세그먼트 fsync 소요 시간",
+    buckets=(0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0),
+)
+EVENT_SPOOL_DEPTH_BYTES = Gauge("moodping_event_spool_depth_bytes", "적재되지 않은 세그먼트 크기 합")
+EVENT_SPOOL_DEPTH_SEGMENTS = Gauge("moodping_event_spool_depth_segments", "적재되지 않은 세그먼트 수")
+EVENT_SPOOL_FLUSH_LAG = Gauge("moodping_event_spool_flush_lag_seconds", "가장 오래된 미적재 세그먼트가 생성된 뒤 지난 시간")
+
+
+def _segment_path(slot_dir: Path, seq: int, created_at: float) -> Path:
+    return slot_dir / f"{seq:012d}-{int(created_at * 1000)}{_SEGMENT_SUFFIX}"
+
+
+def _segment_seq(path: Path) -> int:
+    return int(path.stem.split("-", 1)[0])
+
+
+def _segment_created_at(path: Path) -> float:
+    return int(path.stem.split("-", 1)[1]) / 1000
+
+
+def _list_segments(slot_dir: Path) -> list[Path]:
+    return sorted(slot_dir.glob(f"*{_SEGMENT_SUFFIX}"), key=_segment_seq)
+
+
+class _SegmentWriter:
+    def __init__(self, path: Path, seq: int, created_at: float):
+        self.path = path
+        self.seq = seq
+        self.created_at = created_at
+        self.file = open(path, "ab")
+        self.size = 0
+        self.events = 0
+
+
+class EventSpool:
+    __instance = None
+
+    def __new__(cls):
+        if cls.__instance is None:
+            cls.__instance = super().__new__(cls)
+        return cls.__instance
+
+    @classmethod
+    def get_instance(cls) -> "EventSpool":
+        if cls.__instance is None:
+            cls.__instance = cls()
+        return cls.__instance
+
+    def __init__(self) -> None:
+        if hasattr(self, "_initialized"):
+            return
+        self._initialized = True
+        self.event_log_repository = EventLogRepositoryImpl.get_instance()
+        self.session_summary_repository = SessionSummaryRepositoryImpl.get_instance()
+        self.identifier_activity_repository = IdentifierActivityRepositoryImpl.get_instance()
+        self._cond = threading.Condition()
+        self._writer: _SegmentWriter | None = None
+        self._sealing: _SegmentWriter | None = None
+        self._appended_seq = 0
+        self._synced_seq = 0
+        self._running = False
+        self._root: Path | None = None
+        self._slot_dir: Path | None = None
+        self._slot_lock = None
+        self._fsync_thread: threading.Thread | None = None
+        self._flush_task: asyncio.Task | None = None
+        self._flush_stopping: asyncio.Event | None = None
+
+    @property
+    def running(self) -> bool:
+        return self._running
+
+    def start(self) -> None:
+        settings = get_settings()
+        if not settings.event_spool_enabled or self._running:
+            return
+        self._root = Path(settings.event_spool_dir)
+        self._root.mkdir(parents=True, exist_ok=True)
+        self._slot_dir, self._slot_lock = self._acquire_slot(self._root)
+
+        pending = _list_segments(self._slot_dir)
+        next_seq = _segment_seq(pending[-1]) + 1 if pending else 1
+        self._open_segment(next_seq)
+        self._running = True
+        self._fsync_thread = threading.Thread(target=self._fsync_loop, name="event-spool-fsync", daemon=True)
+        self._fsync_thread.start()
+        self._flush_stopping = asyncio.Event()
+        self._flush_task = asyncio.create_task(self._run_flusher(), name="event-spool-flusher")
+        logger.info("이벤트 스풀 시작 (dir=%s, 재적재 대기 세그먼트 %d개)", self._slot_dir, len(pending))
+
+    async def stop(self) -> None:
+        if not self._running:
+            return
+        with self._cond:
+            self._running = False
+            self._cond.notify_all()
+        if self._flush_task is not None:
+            # 취소하면 to_thread 로 돌던 적재 스레드는 계속 돌므로, 진행 중인 적재가 끝날 때까지 기다립니다.
+            self._flush_stopping.set()
+            await asyncio.gather(self._flush_task, return_exceptions=True)
+            self._flush_task = None
+        await asyncio.to_thread(self._fsync_thread.join)
+        # 종료 전에 남은 세그먼트를 한 번 더 적재합니다. 실패해도 파일이 남아 다음 시작 때 재적재됩니다.
+        await asyncio.to_thread(self._flush_slot, self._slot_dir)
+        self._release_slot()
+        logger.info("이벤트 스풀 종료")
+
+    def append(self, rows: list[dict]) -> None:
+        """이벤트 행들을 현재 세그먼트에 기록하고 fsync 가 끝날 때까지 기다립니다."""
+        data = "".join(json.dumps(row, ensure_ascii=False, default=str) + "\n" for row in rows).encode("utf-8")
+        with self._cond:
+            if not self._running:
+                raise RuntimeError("이벤트 스풀이 실행 중이 아닙니다.")
+            writer = self._writer
+            writer.file.write(data)
+            writer.size += len(data)
+            writer.events += len(rows)
+            self._appended_seq += 1
+            target = self._appended_seq
+            self._cond.notify_all()
+            deadline = time.monotonic() + _APPEND_SYNC_TIMEOUT_SECONDS
+            while self._synced_seq < target:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    raise TimeoutError("이벤트 스풀 fsync 대기 시간 초과")
+                self._cond.wait(timeout=remaining)
+        EVENT_SPOOL_APPENDED.inc(len(rows))
+
+    # ── fsync / 세그먼트 회전 ───────────────────────────────────────────
+
+    def _fsync_loop(self) -> None:
+        settings = get_settings()
+        max_bytes = settings.event_spool_segment_max_bytes
+        max_age = settings.event_spool_segment_max_age_seconds
+        while True:
+            with self._cond:
+                if self._appended_seq == self._synced_seq and not self._rotation_due(max_bytes, max_age):
+                    if not self._running:
+                        self._seal_segment(open_next=False)
+                        return
+                    self._cond.wait(timeout=min(max_age, 0.5))
+                writer = self._writer
+                writer.file.flush()
+                target = self._appended_seq
+                # 크기·나이 상한에 닿으면 fsync 중에 덧붙이는 요청이 있더라도 바로 새 세그먼트로 바꿉니다.
+                # target 까지의 덧붙이기는 모두 옛 세그먼트에 들어 있으므로, 옛 세그먼트를 fsync·닫은 뒤 target 까지 확정합니다.
+                sealing = None
+                if self._rotation_due(max_bytes, max_age):
+                    sealing = writer
+                    self._sealing = sealing
+                    self._open_segment(writer.seq + 1)
+                fd = writer.file.fileno()
+
+            # fsync 동안에도 다른 요청은 계속 덧붙일 수 있습니다 (다음 fsync 에 함께 반영).
+            if sealing is not None or target != self._synced_seq:
+                started = time.perf_counter()
+                os.fsync(fd)
+                EVENT_SPOOL_FSYNC.observe(time.perf_counter() - started)
+            if sealing is not None:
+                sealing.file.close()
+
+            with self._cond:
+                self._synced_seq = target
+                self._sealing = None
+                self._cond.notify_all()
+
+    def _rotation_due(self, max_bytes: int, max_age: float) -> bool:
+        """_cond 를 잡은 상태에서 호출합니다."""
+        writer = self._writer
+        return bool(writer.events) and (writer.size >= max_bytes or time.time() - writer.created_at >= max_age)
+
+    def _open_segment(self, seq: int) -> None:
+        created_at = time.time()
+        self._writer = _SegmentWriter(_segment_path(self._slot_dir, seq, created_at), seq, created_at)
+
+    def _seal_segment(self, open_next: bool) -> None:
+        """현재 세그먼트를 닫습니다. 비어 있으면 지웁니다. _cond 를 잡은 상태에서 호출합니다."""
+        writer = self._writer
+        writer.file.flush()
+        os.fsync(writer.file.fileno())
+        writer.file.close()
+        if writer.events == 0:
+            writer.path.unlink(missing_ok=True)
+        if open_next:
+            self._open_segment(writer.seq + 1)
+
+    # ── 적재 ──────────────────────────────────────────────────────────
+
+    async def _run_flusher(self) -> None:
+        interval = get_settings().event_spool_flush_interval_seconds
+        while not self._flush_stopping.is_set():
+            try:
+                await asyncio.to_thread(self._flush_slot, self._slot_dir, self._active_seq())
+                await asyncio.to_thread(self._flush_orphan_slots)
+            except Exception as e:
+                logger.error("이벤트 스풀 적재 루프 오류: %s", e)
+            self._update_depth_metrics()
+            try:
+                await asyncio.wait_for(self._flush_stopping.wait(), timeout=interval)
+            except asyncio.TimeoutError:
+                pass
+
+    def _active_seq(self) -> int | None:
+        """이 번호 이상인 세그먼트는 아직 쓰는 중이거나 fsync·닫기 전이므로 적재하지 않습니다."""
+        with self._cond:
+            if self._sealing is not None:
+                return self._sealing.seq
+            return self._writer.seq if self._writer is not None else None
+
+    def _flush_slot(self, slot_dir: Path, active_seq: int | None = None) -> None:
+        """
+        닫힌 세그먼트를 오래된 순서로 적재합니다. active_seq 이상인 세그먼트(쓰는 중이거나 그 뒤에 열린 것)는 건너뜁니다.
+        실패하면 남은 세그먼트는 다음 주기에 재시도합니다.
+        """
+        for path in _list_segments(slot_dir):
+            if active_seq is not None and _segment_seq(path) >= active_seq:
+                break
+            try:
+                self._flush_segment(path)
+            except Exception as e:
+                EVENT_SPOOL_FLUSH_ERRORS.inc()
+                logger.warning("세그먼트 적재 실패, 다음 주기에 재시도 (%s): %s", path.name, e)
+                return
+
+    def _flush_segment(self, path: Path) -> None:
+        event_logs = self._load_segment(path)
+        chunk_size = get_settings().event_spool_insert_chunk_size
+        if event_logs:
+            with UnitOfWork() as uow:
+                for start in range(0, len(event_logs), chunk_size):
+                    chunk = event_logs[start:start + chunk_size]
+                    self.event_log_repository.save_all_ignore_duplicates(uow.session, chunk)
+                    self.session_summary_repository.upsert_from_events(uow.session, chunk)
+                    self.identifier_activity_repository.upsert_from_events(uow.session, chunk)
+                uow.commit()
+        path.unlink(missing_ok=True)
+        EVENT_SPOOL_FLUSHED.inc(len(event_logs))
+
+    @staticmethod
+    def _load_segment(path: Path) -> list[EventLog]:
+        event_logs: list[EventLog] = []
+        with open(path, "rb") as f:
+            for line in f:
+                line = line.strip()
+                if not line:
+                    continue
+                try:
+                    row = json.loads(line)
+                    row["occurred_at"] = datetime.fromisoformat(row["occurred_at"])
+                    event_logs.append(EventLog(**row))
+                except (ValueError, KeyError, TypeError):
+                    EVENT_SPOOL_CORRUPT_LINES.inc()
+        return event_logs
+
+    def _flush_orphan_slots(self) -> None:
+        if fcntl is None:
+            return
+        for slot_dir in self._root.glob("slot-*"):
+            if slot_dir == self._slot_dir or not _list_segments(slot_dir):
+                continue
+            lock = self._try_lock_slot(slot_dir)
+            if lock is None:
+                continue
+            try:
+                logger.info("종료된 프로세스의 스풀 세그먼트 적재 (%s)", slot_dir.name)
+                self._flush_slot(slot_dir)
+            finally:
+                lock.close()
+
+    def _update_depth_metrics(self) -> None:
+        depth_bytes = 0
+        depth_segments = 0
+        oldest = None
+        for slot_dir in self._root.glob("slot-*"):
+            for path in _list_segments(slot_dir):
+                try:
+                    size = path.stat().st_size
+                except FileNotFoundError:
+                    continue
+                if size == 0:
+                    continue
+                depth_bytes += size
+                depth_segments += 1
+                created_at = _segment_created_at(path)
+                oldest = created_at if oldest is None else min(oldest, created_at)
+        EVENT_SPOOL_DEPTH_BYTES.set(depth_bytes)
+        EVENT_SPOOL_DEPTH_SEGMENTS.set(depth_segments)
+        EVENT_SPOOL_FLUSH_LAG.set(time.time() - oldest if oldest is not None else 0)
+
+    # ── 프로세스별 슬롯 ────────────────────────────────────────────────
+
+    def _acquire_slot(self, root: Path):
+        if fcntl is None:
+            slot_dir = root / "slot-0"
+            slot_dir.mkdir(exist_ok=True)
+            return slot_dir, None
+        for i in range(_MAX_SLOTS):
+            slot_dir = root / f"slot-{i}"
+            slot_dir.mkdir(exist_ok=True)
+            lock = self._try_lock_slot(slot_dir)
+            if lock is not None:
+                return slot_dir, lock
+        raise RuntimeError(f"사용 가능한 이벤트 스풀 슬롯이 없습니다 ({root}).")
+
+    @staticmethod
+    def _try_lock_slot(slot_dir: Path):
+        lock = open(slot_dir / "lock", "a+")
+        try:
+            fcntl.flock(lock.fileno(), fcntl.LOCK_EX | fcntl.LOCK_NB)
+            return lock
+        except BlockingIOError:
+            lock.close()
+            return None
+
+    def _release_slot(self) -> None:
+        if self._slot_lock is not None:
+            self._slot_lock.close()
+            self._slot_lock = None
@@ -1,4 +1,5 @@
 from abc import ABC, abstractmethod
+from collections.abc import AsyncIterator
 
 
 class BaseLLMClient(ABC):
@@ -8,6 +9,9 @@ class BaseLLMClient(ABC):
     LLM_PROVIDER를 바꿔도 서비스 코드 수정이 불필요합니다.
     """
 
+    provider: str = ""     # 예: "openai" (캐시 키·지표 라벨에 사용)
+    model_name: str = ""   # 예: "gpt-4.1-mini"
+
     @abstractmethod
     async def complete(self, system_prompt: str, user_prompt: str) -> str | None:
         """
@@ -15,3 +19,17 @@ class BaseLLMClient(ABC):
         실패(타임아웃, API 오류 등) 시 None을 반환합니다.
         """
         ...
+
+    async def complete_stream(self, system_prompt: str, user_prompt: str) -> AsyncIterator[str]:
+        """
+        LLM 응답 텍스트를 생성되는 대로 조각(chunk) 단위로 내보냅니다.
+        실패 시 예외를 던지지 않고 스트림을 종료합니다.
+        스트리밍을 지원하지 않는 구현체는 complete() 결과를 한 번에 내보냅니다.
+        """
+        text = await self.complete(system_prompt, user_prompt)
+        if text:
+            yield text
+
+    def stats(self) -> dict:
+        """런타임 상태/카운터. 래퍼 클라이언트는 내부 클라이언트의 stats()를 포함해 확장합니다."""
+        return {"provider": self.provider, "model": self.model_name}
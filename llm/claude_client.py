@@ -1,6 +1,8 @@
 import logging
+from collections.abc import AsyncIterator
 import anthropic
 from .base import BaseLLMClient
+from .metrics import LLMCallRecorder
 from moodping.config.settings import get_settings
 
 logger = logging.getLogger(__name__)
@@ -9,8 +11,11 @@ logger = logging.getLogger(__name__)
 class ClaudeClient(BaseLLMClient):
     """claude-haiku-4-5-20251001 기반 Anthropic Claude 클라이언트."""
 
+    provider = "claude"
+
     def __init__(self):
         settings = get_settings()
+        self.model_name = settings.claude_model
         self._client = anthropic.AsyncAnthropic(
             api_key=settings.anthropic_api_key,
             timeout=settings.llm_timeout_seconds,
@@ -20,6 +25,7 @@ class ClaudeClient(BaseLLMClient):
         self._temperature = settings.llm_temperature
 
     async def complete(self, system_prompt: str, user_prompt: str) -> str | None:
+        recorder = LLMCallRecorder(self.provider, self._model)
         try:
             message = await self._client.messages.create(
                 model=self._model,
@@ -28,10 +34,54 @@ class ClaudeClient(BaseLLMClient):
                 system=system_prompt,
                 messages=[{"role": "user", "content": user_prompt}],
             )
-            return message.content[0].text
+            recorder.usage(
+                input_tokens=message.usage.input_tokens,
+                output_tokens=message.usage.output_tokens,
+                finish_reason=message.stop_reason,
+            )
+            text = message.content[0].text
+            recorder.success(bool(text))
+            return text
         except anthropic.APIError as e:
+            recorder.failure(e)
             logger.error("Claude API 오류: %s", e)
             return None
         except Exception as e:
+            recorder.failure(e)
             logger.error("Claude 호출 실패: %s", e)
             return None
+
+    async def complete_stream(self, system_prompt: str, user_prompt: str) -> AsyncIterator[str]:
+        recorder = LLMCallRecorder(self.provider, self._model, mode="stream")
+        try:
+            async with self._client.messages.stream(
+                model=self._model,
+                max_tokens=self._max_tokens,
+                temperature=self._temperature,
+                system=system_prompt,
+                messages=[{"role": "user", "content": user_prompt}],
+            ) as stream:
+                received = False
+                try:
+                    async for text in stream.text_stream:
+                        if text:
+                            received = True
+                            recorder.first_chunk()
+                            yield text
+                except GeneratorExit:
+                    # 소비자가 필요한 만큼 받고 스트림을 닫은 경우 (조기 종료 = 정상)
+                    recorder.success(received)
+                    raise
+                message = await stream.get_final_message()
+                recorder.usage(
+                    input_tokens=message.usage.input_tokens,
+                    output_tokens=message.usage.output_tokens,
+                    finish_reason=message.stop_reason,
+                )
+                recorder.success(received)
+        except anthropic.APIError as e:
+            recorder.failure(e)
+            logger.error("Claude 스트리밍 오류: %s", e)
+        except Exception as e:
+            recorder.failure(e)
+            logger.error("Claude 스트리밍 실패: %s", e)
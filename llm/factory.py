@@ -8,9 +8,27 @@ logger = logging.getLogger(__name__)
 
 @lru_cache(maxsize=1)
 def get_llm_client() -> BaseLLMClient:
-    provider = get_settings().llm_provider.lower().strip()
+    settings = get_settings()
+    providers = [p.lower().strip() for p in settings.llm_providers.split(",") if p.strip()]
+    if len(providers) > 1:
+        from .hedged_client import HedgedLLMClient
+        logger.info("LLM 제공자 (헤지/페일오버): %s", providers)
+        return HedgedLLMClient([_create_limited_client(p) for p in providers])
+
+    provider = providers[0] if providers else settings.llm_provider.lower().strip()
     logger.info("LLM 제공자: %s", provider)
+    return _create_limited_client(provider)
+
+
+def _create_limited_client(provider: str) -> BaseLLMClient:
+    client = _create_client(provider)
+    if not get_settings().llm_limiter_enabled:
+        return client
+    from .limited_client import LimitedLLMClient
+    return LimitedLLMClient(client)
+
 
+def _create_client(provider: str) -> BaseLLMClient:
     if provider == "openai":
         from .openai_client import OpenAIClient
         return OpenAIClient()
@@ -20,8 +38,11 @@ def get_llm_client() -> BaseLLMClient:
     elif provider == "claude":
         from .claude_client import ClaudeClient
         return ClaudeClient()
+    elif provider == "fake":
+        from .fake_client import FakeLLMClient
+        return FakeLLMClient()
     else:
         raise ValueError(
             f"지원하지 않는 LLM_PROVIDER: '{provider}'. "
-            f"openai | gemini | claude 중 하나를 선택하세요."
+            f"openai | gemini | claude | fake 중 하나를 선택하세요."
         )
@@ -0,0 +1,200 @@
+import asyncio
+import json
+import logging
+import math
+import random
+import re
+from collections.abc import AsyncIterator
+from pathlib import Path
+from .base import BaseLLMClient
+from .metrics import LLMCallRecorder
+from moodping.config.settings import get_settings
+
+logger = logging.getLogger(__name__)
+
+_SAMPLE_TEXTS = [
+    "😊 {emotion} 감정을 솔직하게 기록해 주셔서 고마워요. 오늘 느낀 마음을 그대로 바라본 것만으로도 의미 있는 한 걸음이에요.\n\n"
+    "🧠 감정은 상황에 대한 자연스러운 반응이에요. 지금의 기분이 나라는 사람 전체를 말해 주지는 않는다는 점을 기억해 보세요.\n\n"
+    "🌿 오늘은 5분만 창밖을 보며 천천히 숨을 쉬어 보는 건 어떨까요?",
+    "🌤️ {emotion} 상태를 알아차리고 적어 두셨네요. 그 자체로 자신을 돌보는 좋은 습관이에요.\n\n"
+    "💡 이 감정이 어떤 생각에서 시작됐는지 한 문장으로 적어 보면, \"항상 그렇다\"는 생각 대신 \"오늘은 그랬다\"로 바꿔 볼 수 있어요.\n\n"
+    "☕ 따뜻한 음료 한 잔을 천천히 마시며 오늘 잘한 일 하나를 떠올려 보세요.",
+    "✨ {emotion} 감정이 느껴지는 하루였군요. 이렇게 마음을 들여다보는 시간이 쌓이면 나를 더 잘 이해하게 돼요.\n\n"
+    "🔍 지금 떠오르는 걱정 중 내가 바꿀 수 있는 것과 없는 것을 나눠 보면 마음의 무게가 조금 가벼워질 거예요.\n\n"
+    "🚶 오늘 저녁 10분 산책으로 몸을 가볍게 움직여 보세요.",
+]
+
+# _parse_analysis_text 의 모든 분기를 통과하도록 설계한 응답 형태
+_WELL_FORMED_VARIANTS = ["clean", "escaped_quotes"]
+_MALFORMED_VARIANTS = [
+    "code_fence",           # ```json ... ``` (정규식 분기)
+    "prose_prefix",         # 설명 문구 + JSON (정규식 분기)
+    "truncated",            # 닫는 따옴표 없이 잘림 (잘린 정규식 분기)
+    "unicode_escaped_key",  # 키가 \u 이스케이프 → 정규식 실패, json.loads 분기 성공
+    "wrong_key",            # 다른 키 → json.loads 분기, 빈 텍스트
+    "empty_text",           # {"analysis_text": ""} → 빈 텍스트
+    "plain_text",           # JSON 아님 → 원문 fallback
+    "empty_response",       # 빈 응답
+]
+
+
+class FakeLLMClient(BaseLLMClient):
+    """
+    부하 테스트용 가짜 LLM 클라이언트 (네트워크 호출 없음).
+
+    지연 분포(fixed | lognormal | replay), 오류·타임아웃 비율, 비정상 응답 비율을
+    설정으로 조절해 외부 제공자 상태와 무관하게 우리 스택만 벤치마크할 수 있습니다.
+    """
+
+    provider = "fake"
+
+    def __init__(self):
+        settings = get_settings()
+        self.model_name = settings.fake_llm_model
+        self._distribution = settings.fake_llm_latency_distribution.lower().strip()
+        self._latency = settings.fake_llm_latency_seconds
+        self._sigma = settings.fake_llm_latency_sigma
+        self._error_rate = settings.fake_llm_error_rate
+        self._timeout_rate = settings.fake_llm_timeout_rate
+        self._malformed_rate = settings.fake_llm_malformed_rate
+        self._chunk_chars = max(1, settings.fake_llm_stream_chunk_chars)
+        self._first_chunk_ratio = settings.fake_llm_first_chunk_ratio
+        self._timeout = settings.llm_timeout_seconds
+        self._random = random.Random(settings.fake_llm_seed)
+        self._replay: list[float] = []
+        if self._distribution == "replay":
+            self._replay = self._load_replay(settings.fake_llm_latency_replay_file)
+        elif self._distribution not in ("fixed", "lognormal"):
+            raise ValueError(
+                f"지원하지 않는 FAKE_LLM_LATENCY_DISTRIBUTION: '{self._distribution}'. "
+                f"fixed | lognormal | replay 중 하나를 선택하세요."
+            )
+        logger.info(
+            "FakeLLMClient 초기화 — distribution=%s, latency=%.2fs, error=%.2f, timeout=%.2f, malformed=%.2f",
+            self._distribution, self._latency, self._error_rate, self._timeout_rate, self._malformed_rate,
+        )
+
+    async def complete(self, system_prompt: str, user_prompt: str) -> str | None:
+        recorder = LLMCallRecorder(self.provider, self.model_name)
+        failure = await self._maybe_fail()
+        if failure is not None:
+            recorder.failure(failure)
+            return None
+
+        await asyncio.sleep(self._sample_latency())
+        payload = self._build_payload(user_prompt)
+        self._record_usage(recorder, system_prompt, user_prompt, payload)
+        recorder.success(bool(payload))
+        return payload
+
+    async def complete_stream(self, system_prompt: str, user_prompt: str) -> AsyncIterator[str]:
+        recorder = LLMCallRecorder(self.provider, self.model_name, mode="stream")
+        failure = await self._maybe_fail()
+        if failure is not None:
+            recorder.failure(failure)
+            return
+
+        latency = self._sample_latency()
+        payload = self._build_payload(user_prompt)
+        chunks = [payload[i:i + self._chunk_chars] for i in range(0, len(payload), self._chunk_chars)]
+
+        # 전체 지연 중 일부를 첫 청크까지의 대기로, 나머지를 청크 사이에 고르게 나눕니다.
+        await asyncio.sleep(latency * self._first_chunk_ratio)
+        gap = latency * (1 - self._first_chunk_ratio) / max(1, len(chunks))
+        try:
+            for i, chunk in enumerate(chunks):
+                if i:
+                    await asyncio.sleep(gap)
+                recorder.first_chunk()
+                yield chunk
+        except GeneratorExit:
+            recorder.success(True)
+            raise
+
+        self._record_usage(recorder, system_prompt, user_prompt, payload)
+        recorder.success(bool(payload))
+
+    def stats(self) -> dict:
+        return {
+            "provider": self.provider,
+            "model": self.model_name,
+            "latency_distribution": self._distribution,
+            "replay_samples": len(self._replay),
+        }
+
+    async def _maybe_fail(self) -> Exception | None:
+        roll = self._random.random()
+        if roll < self._timeout_rate:
+            await asyncio.sleep(self._timeout)
+            logger.error("Fake LLM 호출 타임아웃 (%.1fs)", self._timeout)
+            return asyncio.TimeoutError()
+        if roll < self._timeout_rate + self._error_rate:
+            await asyncio.sleep(self._sample_latency() * 0.1)
+            logger.error("Fake LLM 호출 실패 (모의 오류)")
+            return RuntimeError("fake llm error")
+        return None
+
+    def _sample_latency(self) -> float:
+        if self._distribution == "fixed":
+            return self._latency
+        if self._distribution == "replay":
+            return self._random.choice(self._replay)
+        # lognormal: fake_llm_latency_seconds 를 중앙값으로 사용
+        return self._random.lognormvariate(math.log(max(self._latency, 1e-3)), self._sigma)
+
+    def _build_payload(self, user_prompt: str) -> str:
+        emotion_match = re.search(r"- 감정: (.+)", user_prompt)
+        emotion = emotion_match.group(1).strip() if emotion_match else "오늘의"
+        text = self._random.choice(_SAMPLE_TEXTS).format(emotion=emotion)
+
+        if self._random.random() < self._malformed_rate:
+            variant = self._random.choice(_MALFORMED_VARIANTS)
+        else:
+            variant = self._random.choice(_WELL_FORMED_VARIANTS)
+        return self._render(variant, text)
+
+    @staticmethod
+    def _render(variant: str, text: str) -> str:
+        encoded = json.dumps({"analysis_text": text}, ensure_ascii=False)
+        if variant == "clean":
+            return encoded
+        if variant == "escaped_quotes":
+            return json.dumps({"analysis_text": f"\"{text}\""}, ensure_ascii=False)
+        if variant == "code_fence":
+            return f"```json\n{encoded}\n```"
+        if variant == "prose_prefix":
+            return f"물론입니다. 요청하신 분석입니다.\n{encoded}"
+        if variant == "truncated":
+            return encoded[: max(20, len(encoded) * 2 // 3)]
+        if variant == "unicode_escaped_key":
+            return encoded.replace('"analysis_text"', '"analysis\\u005ftext"', 1)
+        if variant == "wrong_key":
+            return json.dumps({"result": text}, ensure_ascii=False)
+        if variant == "empty_text":
+            return '{"analysis_text": ""}'
+        if variant == "plain_text":
+            return text
+        return ""
+
+    @staticmethod
+    def _record_usage(recorder: LLMCallRecorder, system_prompt: str, user_prompt: str, payload: str) -> None:
+        # 한국어 기준 대략 2자 ≈ 1토큰으로 추정
+        recorder.usage(
+            input_tokens=(len(system_prompt) + len(user_prompt)) // 2,
+            output_tokens=len(payload) // 2,
+            finish_reason="stop",
+        )
+
+    @staticmethod
+    def _load_replay(path: str) -> list[float]:
+        """기록된 응답 지연(초)을 한 줄에 하나씩 읽습니다. '#' 으로 시작하는 줄은 무시합니다."""
+        if not path:
+            raise ValueError("FAKE_LLM_LATENCY_REPLAY_FILE 이 설정되지 않았습니다.")
+        samples = [
+            float(line.strip())
+            for line in Path(path).read_text(encoding="utf-8").splitlines()
+            if line.strip() and not line.lstrip().startswith("#")
+        ]
+        if not samples:
+            raise ValueError(f"지연 재생 파일이 비어 있습니다: {path}")
+        return samples
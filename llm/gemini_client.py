@@ -1,22 +1,41 @@
 import asyncio
 import logging
+from collections.abc import AsyncIterator
 import google.generativeai as genai
 from .base import BaseLLMClient
+from .metrics import LLMCallRecorder
 from moodping.config.settings import get_settings
 
 logger = logging.getLogger(__name__)
 
 
 class GeminiClient(BaseLLMClient):
-    """gemini-2.5-flash 기반 Google Gemini 클라이언트."""
+    """
+    gemini-2.5-flash 기반 Google Gemini 클라이언트.
+
+    GenerativeModel은 초기화 시 한 번만 만들어 재사용하고, SDK의 네이티브 async API
+    (generate_content_async, gRPC aio)를 사용합니다. 스레드 풀을 점유하지 않으므로
+    동시 분석 수는 네트워크에 의해서만 제한되며, 타임아웃 시 코루틴 취소가 실제 RPC까지 취소합니다.
+    """
+
+    provider = "gemini"
 
     def __init__(self):
         settings = get_settings()
+        self.model_name = settings.gemini_model
         genai.configure(api_key=settings.gemini_api_key)
         self._model_name  = settings.gemini_model
         self._max_tokens  = settings.llm_max_tokens
         self._temperature = settings.llm_temperature
         self._timeout     = settings.llm_timeout_seconds
+        self._model = genai.GenerativeModel(
+            model_name=self._model_name,
+            generation_config=genai.GenerationConfig(
+                max_output_tokens=self._max_tokens,
+                temperature=self._temperature,
+            ),
+        )
+        self._request_options = {"timeout": self._timeout}
         logger.info(
             "GeminiClient 초기화 — model=%s, max_tokens=%d, timeout=%.1fs",
             self._model_name, self._max_tokens, self._timeout,
@@ -24,19 +43,15 @@ class GeminiClient(BaseLLMClient):
 
     async def complete(self, system_prompt: str, user_prompt: str) -> str | None:
         combined_prompt = f"{system_prompt}\n\n{user_prompt}"
-
-        generation_config = genai.GenerationConfig(
-            max_output_tokens=self._max_tokens,
-            temperature=self._temperature,
-        )
-        model = genai.GenerativeModel(
-            model_name=self._model_name,
-            generation_config=generation_config,
-        )
+        recorder = LLMCallRecorder(self.provider, self._model_name)
 
         try:
+            # wait_for가 코루틴을 취소하면 gRPC aio 호출도 함께 취소됩니다.
             response = await asyncio.wait_for(
-                asyncio.to_thread(model.generate_content, combined_prompt),
+                self._model.generate_content_async(
+                    combined_prompt,
+                    request_options=self._request_options,
+                ),
                 timeout=self._timeout,
             )
 
@@ -45,14 +60,87 @@ class GeminiClient(BaseLLMClient):
                 finish_reason = candidate.finish_reason
                 usage = getattr(response, "usage_metadata", None)
                 logger.info("Gemini finish_reason=%s, usage=%s", finish_reason, usage)
+                self._record_usage(recorder, usage, finish_reason)
                 if str(finish_reason) not in ("FinishReason.STOP", "1", "STOP"):
                     logger.warning("Gemini 비정상 종료: finish_reason=%s", finish_reason)
 
-            return response.text
+            text = response.text
+            recorder.success(bool(text))
+            return text
 
-        except asyncio.TimeoutError:
+        except asyncio.TimeoutError as e:
+            recorder.failure(e)
             logger.error("Gemini 호출 타임아웃 (%.1fs)", self._timeout)
             return None
         except Exception as e:
+            recorder.failure(e)
             logger.error("Gemini 호출 실패: %s", e)
             return None
+
+    async def complete_stream(self, system_prompt: str, user_prompt: str) -> AsyncIterator[str]:
+        combined_prompt = f"{system_prompt}\n\n{user_prompt}"
+        recorder = LLMCallRecorder(self.provider, self._model_name, mode="stream")
+        received = False
+        chunks = None
+
+        try:
+            response = await asyncio.wait_for(
+                self._model.generate_content_async(
+                    combined_prompt,
+                    stream=True,
+                    request_options=self._request_options,
+                ),
+                timeout=self._timeout,
+            )
+            chunks = response.__aiter__()
+            last_chunk = None
+            while True:
+                # 청크 사이 대기 시간에도 타임아웃을 적용합니다 (idle timeout).
+                try:
+                    chunk = await asyncio.wait_for(anext(chunks), timeout=self._timeout)
+                except StopAsyncIteration:
+                    break
+                last_chunk = chunk
+                try:
+                    text = chunk.text
+                except ValueError:
+                    # 안전 필터 등으로 parts가 비어 있는 청크
+                    continue
+                if text:
+                    received = True
+                    recorder.first_chunk()
+                    yield text
+
+            if last_chunk is not None:
+                # usage_metadata / finish_reason 은 마지막 청크에 담겨 옵니다.
+                candidate = last_chunk.candidates[0] if last_chunk.candidates else None
+                self._record_usage(
+                    recorder,
+                    getattr(last_chunk, "usage_metadata", None),
+                    candidate.finish_reason if candidate else None,
+                )
+            recorder.success(received)
+
+        except GeneratorExit:
+            # 소비자가 필요한 만큼 받고 스트림을 닫은 경우 (조기 종료 = 정상)
+            recorder.success(received)
+            raise
+        except asyncio.TimeoutError as e:
+            recorder.failure(e)
+            logger.error("Gemini 스트리밍 타임아웃 (%.1fs)", self._timeout)
+        except Exception as e:
+            recorder.failure(e)
+            logger.error("Gemini 스트리밍 실패: %s", e)
+        finally:
+            # 조기 종료 시 gRPC 스트림을 닫아 남은 생성을 취소합니다.
+            aclose = getattr(chunks, "aclose", None)
+            if aclose is not None:
+                await aclose()
+
+    @staticmethod
+    def _record_usage(recorder: LLMCallRecorder, usage, finish_reason) -> None:
+        recorder.usage(
+            input_tokens=getattr(usage, "prompt_token_count", None),
+            output_tokens=getattr(usage, "candidates_token_count", None),
+            finish_reason=getattr(finish_reason, "name", finish_reason),
+        )
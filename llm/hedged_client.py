@@ -0,0 +1,211 @@
+import asyncio
+import logging
+import time
+from collections import deque
+from collections.abc import AsyncIterator
+from .base import BaseLLMClient
+from moodping.config.settings import get_settings
+
+logger = logging.getLogger(__name__)
+
+_MIN_SAMPLES_FOR_PERCENTILE = 20
+
+# 지연 표본 종류. 전체 응답 시간과 첫 청크 시간은 분포가 크게 달라 따로 모읍니다.
+MODE_COMPLETE = "complete"
+MODE_FIRST_CHUNK = "first_chunk"
+_MODES = (MODE_COMPLETE, MODE_FIRST_CHUNK)
+
+
+class HedgedLLMClient(BaseLLMClient):
+    """
+    여러 제공자를 우선순위 순서로 묶은 복합 클라이언트.
+
+    - 주 제공자가 지연 임계값(최근 응답 지연의 백분위수) 안에 응답하지 않으면
+      다음 제공자에게 헤지 요청을 보내고, 먼저 도착한 유효한 응답을 사용합니다.
+    - 진 쪽 요청은 즉시 취소합니다. 스트리밍은 첫 청크 도착 시점으로 같은 방식의 헤지를 합니다.
+    - 오류(None 응답)가 나면 지연을 기다리지 않고 바로 다음 제공자로 페일오버합니다.
+    """
+
+    provider = "hedged"
+
+    def __init__(self, clients: list[BaseLLMClient]):
+        if not clients:
+            raise ValueError("clients must not be empty")
+        settings = get_settings()
+        self._clients = clients
+        self.model_name = ",".join(f"{c.provider}:{c.model_name}" for c in clients)
+        self._percentile = settings.llm_hedge_percentile
+        self._initial_delay = settings.llm_hedge_initial_delay_seconds
+        self._min_delay = settings.llm_hedge_min_delay_seconds
+        self._latencies = {
+            (c.provider, mode): deque(maxlen=settings.llm_hedge_latency_window)
+            for c in clients for mode in _MODES
+        }
+        self._counters = {
+            c.provider: {"requests": 0, "hedges": 0, "wins": 0, "losses": 0, "cancels": 0, "errors": 0}
+            for c in clients
+        }
+        logger.info(
+            "HedgedLLMClient 초기화 — providers=%s, p%.0f 지연 후 헤지",
+            [c.provider for c in clients], self._percentile,
+        )
+
+    async def complete(self, system_prompt: str, user_prompt: str) -> str | None:
+        pending: dict[asyncio.Task, BaseLLMClient] = {}
+        next_index = 0
+
+        def launch(hedge: bool) -> BaseLLMClient:
+            nonlocal next_index
+            client = self._clients[next_index]
+            next_index += 1
+            self._count(client, "requests")
+            if hedge:
+                self._count(client, "hedges")
+            task = asyncio.create_task(self._timed_complete(client, system_prompt, user_prompt))
+            pending[task] = client
+            return client
+
+        last_launched = launch(hedge=False)
+        try:
+            while pending:
+                can_hedge = next_index < len(self._clients)
+                timeout = self.hedge_delay(last_launched, MODE_COMPLETE) if can_hedge else None
+                done, _ = await asyncio.wait(pending, timeout=timeout, return_when=asyncio.FIRST_COMPLETED)
+
+                if not done:
+                    logger.info("%s 응답 지연 → %s 헤지 요청", last_launched.provider, self._clients[next_index].provider)
+                    last_launched = launch(hedge=True)
+                    continue
+
+                winner: str | None = None
+                for task in done:
+                    client = pending.pop(task)
+                    result = task.result()
+                    if not result:
+                        self._count(client, "errors")
+                    elif winner is None:
+                        self._count(client, "wins")
+                        winner = result
+                    else:
+                        self._count(client, "losses")
+                if winner is not None:
+                    return winner
+
+                # 오류 → 지연 없이 다음 제공자로 페일오버
+                if next_index < len(self._clients):
+                    last_launched = launch(hedge=False)
+            return None
+        finally:
+            for task, client in pending.items():
+                task.cancel()
+                self._count(client, "cancels")
+
+    async def complete_stream(self, system_prompt: str, user_prompt: str) -> AsyncIterator[str]:
+        """
+        첫 청크를 기준으로 헤지합니다. 주 제공자의 첫 청크가 지연 임계값 안에 오지 않으면
+        다음 제공자 스트림을 함께 열고, 먼저 첫 청크를 보낸 스트림으로 확정한 뒤 나머지는 닫습니다.
+        첫 청크 전에 스트림이 끝나면(오류) 즉시 다음 제공자로 페일오버합니다.
+        """
+        pending: dict[asyncio.Task, tuple[BaseLLMClient, AsyncIterator[str]]] = {}
+        next_index = 0
+
+        def launch(hedge: bool) -> BaseLLMClient:
+            nonlocal next_index
+            client = self._clients[next_index]
+            next_index += 1
+            self._count(client, "requests")
+            if hedge:
+                self._count(client, "hedges")
+            stream = client.complete_stream(system_prompt, user_prompt)
+            pending[asyncio.create_task(self._timed_first_chunk(client, stream))] = (client, stream)
+            return client
+
+        winner: tuple[BaseLLMClient, AsyncIterator[str], str] | None = None
+        last_launched = launch(hedge=False)
+        try:
+            while pending and winner is None:
+                can_hedge = next_index < len(self._clients)
+                timeout = self.hedge_delay(last_launched, MODE_FIRST_CHUNK) if can_hedge else None
+                done, _ = await asyncio.wait(pending, timeout=timeout, return_when=asyncio.FIRST_COMPLETED)
+
+                if not done:
+                    logger.info("%s 첫 청크 지연 → %s 헤지 스트림", last_launched.provider, self._clients[next_index].provider)
+                    last_launched = launch(hedge=True)
+                    continue
+
+                for task in done:
+                    client, stream = pending.pop(task)
+                    first = task.result()
+                    if first is None:
+                        self._count(client, "errors")
+                        await stream.aclose()
+                    elif winner is None:
+                        self._count(client, "wins")
+                        winner = (client, stream, first)
+                    else:
+                        self._count(client, "losses")
+                        await stream.aclose()
+
+                if winner is None and next_index < len(self._clients):
+                    last_launched = launch(hedge=False)
+        finally:
+            for task, (client, stream) in pending.items():
+                task.cancel()
+                self._count(client, "cancels")
+            if pending:
+                await asyncio.gather(*pending, return_exceptions=True)
+                for client, stream in pending.values():
+                    await stream.aclose()
+
+        if winner is None:
+            return
+
+        _, stream, first = winner
+        try:
+            yield first
+            async for chunk in stream:
+                yield chunk
+        finally:
+            await stream.aclose()
+
+    def hedge_delay(self, client: BaseLLMClient, mode: str) -> float:
+        """mode(complete: 전체 응답 | first_chunk: 스트림 첫 청크)에 맞는 지연 표본의 백분위수."""
+        samples = self._latencies[(client.provider, mode)]
+        if len(samples) < _MIN_SAMPLES_FOR_PERCENTILE:
+            return self._initial_delay
+        ordered = sorted(samples)
+        index = min(len(ordered) - 1, int(len(ordered) * self._percentile / 100.0))
+        return max(self._min_delay, ordered[index])
+
+    def stats(self) -> dict:
+        return {
+            "provider": self.provider,
+            "model": self.model_name,
+            "hedge_percentile": self._percentile,
+            "providers": {
+                c.provider: {
+                    **self._counters[c.provider],
+                    "hedge_delay_seconds": {mode: round(self.hedge_delay(c, mode), 3) for mode in _MODES},
+                    "latency_samples": {mode: len(self._latencies[(c.provider, mode)]) for mode in _MODES},
+                    "inner": c.stats(),
+                }
+                for c in self._clients
+            },
+        }
+
+    async def _timed_complete(self, client: BaseLLMClient, system_prompt: str, user_prompt: str) -> str | None:
+        started = time.perf_counter()
+        result = await client.complete(system_prompt, user_prompt)
+        if result:
+            self._latencies[(client.provider, MODE_COMPLETE)].append(time.perf_counter() - started)
+        return result
+
+    async def _timed_first_chunk(self, client: BaseLLMClient, stream: AsyncIterator[str]) -> str | None:
+        started = time.perf_counter()
+        first = await anext(stream, None)
+        if first is not None:
+            self._latencies[(client.provider, MODE_FIRST_CHUNK)].append(time.perf_counter() - started)
+        return first
+
+    def _count(self, client: BaseLLMClient, key: str) -> None:
+        self._counters[client.provider][key] += 1
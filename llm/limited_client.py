@@ -0,0 +1,94 @@
+import asyncio
+import logging
+import time
+from collections.abc import AsyncIterator
+from .base import BaseLLMClient
+from .limiter import AdaptiveConcurrencyLimiter, CircuitBreaker, LimiterRejected, current_priority
+from moodping.config.settings import get_settings
+
+logger = logging.getLogger(__name__)
+
+
+class LimitedLLMClient(BaseLLMClient):
+    """
+    임의의 BaseLLMClient를 감싸 동시 호출 수를 적응적으로 제한하고,
+    제공자 장애 시 서킷 브레이커로 즉시 실패(None)시킵니다.
+    provider / model_name 은 내부 클라이언트 값을 그대로 노출합니다 (캐시 키·헤지 카운터 호환).
+    """
+
+    def __init__(self, inner: BaseLLMClient):
+        settings = get_settings()
+        self._inner = inner
+        self.provider = inner.provider
+        self.model_name = inner.model_name
+        self._limiter = AdaptiveConcurrencyLimiter(
+            initial_limit=settings.llm_limiter_initial_limit,
+            min_limit=settings.llm_limiter_min_limit,
+            max_limit=settings.llm_limiter_max_limit,
+            max_queue=settings.llm_limiter_max_queue,
+            queue_timeout_seconds=settings.llm_limiter_queue_timeout_seconds,
+            backoff_ratio=settings.llm_limiter_backoff_ratio,
+            slow_threshold_seconds=settings.llm_timeout_seconds * 0.8,
+        )
+        self._breaker = CircuitBreaker(
+            failure_threshold=settings.llm_breaker_failure_threshold,
+            recovery_seconds=settings.llm_breaker_recovery_seconds,
+        )
+
+    async def complete(self, system_prompt: str, user_prompt: str) -> str | None:
+        if not await self._enter():
+            return None
+
+        started = time.perf_counter()
+        try:
+            result = await self._inner.complete(system_prompt, user_prompt)
+        except asyncio.CancelledError:
+            self._exit(None, started)
+            raise
+        self._exit(bool(result), started)
+        return result
+
+    async def complete_stream(self, system_prompt: str, user_prompt: str) -> AsyncIterator[str]:
+        if not await self._enter():
+            return
+
+        started = time.perf_counter()
+        received = False
+        finished = False
+        try:
+            async for chunk in self._inner.complete_stream(system_prompt, user_prompt):
+                received = True
+                yield chunk
+            finished = True
+        finally:
+            # 소비자가 중간에 멈춘 경우(aclose)는 첫 청크 수신 여부로 성공을 판단합니다.
+            self._exit(received if (finished or received) else None, started)
+
+    def stats(self) -> dict:
+        return {
+            "provider": self.provider,
+            "model": self.model_name,
+            "limiter": self._limiter.stats(),
+            "breaker": self._breaker.stats(),
+        }
+
+    async def _enter(self) -> bool:
+        if not self._breaker.allow():
+            logger.warning("%s 서킷 브레이커 open — 호출 생략", self.provider)
+            return False
+        try:
+            await self._limiter.acquire(current_priority())
+            return True
+        except LimiterRejected as e:
+            self._breaker.record_ignored()
+            logger.warning("%s 동시성 제한으로 호출 거절: %s", self.provider, e)
+            return False
+
+    def _exit(self, success: bool | None, started: float) -> None:
+        self._limiter.release(success, time.perf_counter() - started)
+        if success is True:
+            self._breaker.record_success()
+        elif success is False:
+            self._breaker.record_failure()
+        else:
+            self._breaker.record_ignored()
@@ -0,0 +1,212 @@
+"""
+LLM 호출 보호 장치: 적응형 동시성 제한(AIMD) + 서킷 브레이커 + 우선순위.
+
+호출 우선순위는 contextvar 로 전달되므로 BaseLLMClient.complete() 시그니처를 바꾸지 않습니다.
+
+    with llm_priority(LLMPriority.MANUAL):
+        await service.analyze_and_save(record, db)
+"""
+import asyncio
+import heapq
+import itertools
+import time
+from collections.abc import Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from enum import IntEnum
+
+
+class LLMPriority(IntEnum):
+    INTERACTIVE = 0   # 기록 생성 직후 분석 (사용자가 기다리는 중)
+    MANUAL      = 1   # /mood-analysis/{id}/analyze 수동 재분석
+    BATCH       = 2   # 일괄 재분석 등 백그라운드 작업
+
+
+_current_priority: ContextVar[LLMPriority] = ContextVar("llm_priority", default=LLMPriority.INTERACTIVE)
+
+
+@contextmanager
+def llm_priority(priority: LLMPriority) -> Iterator[None]:
+    token = _current_priority.set(priority)
+    try:
+        yield
+    finally:
+        _current_priority.reset(token)
+
+
+def current_priority() -> LLMPriority:
+    return _current_priority.get()
+
+
+class LimiterRejected(Exception):
+    """대기열이 가득 찼거나 대기 시간이 초과되어 호출이 거절됨."""
+
+
+class AdaptiveConcurrencyLimiter:
+    """
+    AIMD(Additive Increase / Multiplicative Decrease) 동시성 제한기.
+    - 정상 응답: limit += 1 / limit  (대략 왕복 1회당 +1)
+    - 실패·느린 응답: limit *= backoff_ratio
+    limit 을 넘는 요청은 우선순위 대기열에서 기다리며, 대기열이 가득 차면
+    더 낮은 우선순위의 대기자를 밀어내거나 새 요청을 거절합니다.
+    """
+
+    def __init__(
+        self,
+        initial_limit: int,
+        min_limit: int,
+        max_limit: int,
+        max_queue: int,
+        queue_timeout_seconds: float,
+        backoff_ratio: float,
+        slow_threshold_seconds: float,
+    ):
+        self._limit = float(initial_limit)
+        self._min_limit = min_limit
+        self._max_limit = max_limit
+        self._max_queue = max_queue
+        self._queue_timeout = queue_timeout_seconds
+        self._backoff_ratio = backoff_ratio
+        self._slow_threshold = slow_threshold_seconds
+        self._in_flight = 0
+        self._waiters: list[tuple[int, int, asyncio.Future]] = []
+        self._seq = itertools.count()
+        self._rejected = {p.name.lower(): 0 for p in LLMPriority}
+
+    @property
+    def limit(self) -> int:
+        return max(self._min_limit, int(self._limit))
+
+    async def acquire(self, priority: LLMPriority) -> None:
+        if self._in_flight < self.limit and not self._waiters:
+            self._in_flight += 1
+            return
+
+        if len(self._waiters) >= self._max_queue and not self._evict_lower_than(priority):
+            self._rejected[priority.name.lower()] += 1
+            raise LimiterRejected(f"queue full (limit={self.limit}, queued={len(self._waiters)})")
+
+        future = asyncio.get_running_loop().create_future()
+        entry = (int(priority), next(self._seq), future)
+        heapq.heappush(self._waiters, entry)
+        try:
+            await asyncio.wait_for(asyncio.shield(future), timeout=self._queue_timeout)
+        except asyncio.TimeoutError:
+            self._remove_waiter(entry)
+            if future.done() and not future.cancelled() and future.exception() is None:
+                # 타임아웃 직전에 슬롯을 받은 경우 되돌려 줍니다.
+                self._in_flight -= 1
+                self._wake()
+            self._rejected[priority.name.lower()] += 1
+            raise LimiterRejected(f"queue timeout ({self._queue_timeout:.1f}s)")
+        except asyncio.CancelledError:
+            self._remove_waiter(entry)
+            if future.done() and not future.cancelled() and future.exception() is None:
+                self._in_flight -= 1
+                self._wake()
+            raise
+
+    def release(self, success: bool | None, latency_seconds: float = 0.0) -> None:
+        """success=None 은 취소 등 판단 불가 → limit 을 조정하지 않습니다."""
+        self._in_flight -= 1
+        if success is True and latency_seconds < self._slow_threshold:
+            if self._in_flight + 1 >= self.limit:
+                self._limit = min(self._max_limit, self._limit + 1.0 / self._limit)
+        elif success is not None:
+            self._limit = max(self._min_limit, self._limit * self._backoff_ratio)
+        self._wake()
+
+    def stats(self) -> dict:
+        queued = {p.name.lower(): 0 for p in LLMPriority}
+        for priority, _, _ in self._waiters:
+            queued[LLMPriority(priority).name.lower()] += 1
+        return {
+            "limit": self.limit,
+            "in_flight": self._in_flight,
+            "queued": queued,
+            "rejected": dict(self._rejected),
+        }
+
+    def _wake(self) -> None:
+        while self._waiters and self._in_flight < self.limit:
+            _, _, future = heapq.heappop(self._waiters)
+            if future.done():
+                continue
+            self._in_flight += 1
+            future.set_result(None)
+
+    def _evict_lower_than(self, priority: LLMPriority) -> bool:
+        victim = max(self._waiters, key=lambda e: (e[0], e[1]), default=None)
+        if victim is None or victim[0] <= int(priority):
+            return False
+        self._remove_waiter(victim)
+        self._rejected[LLMPriority(victim[0]).name.lower()] += 1
+        if not victim[2].done():
+            victim[2].set_exception(LimiterRejected("evicted by higher priority request"))
+        return True
+
+    def _remove_waiter(self, entry: tuple[int, int, asyncio.Future]) -> None:
+        try:
+            self._waiters.remove(entry)
+            heapq.heapify(self._waiters)
+        except ValueError:
+            pass
+
+
+class CircuitBreaker:
+    """
+    연속 실패가 임계값을 넘으면 open 상태로 전환해 recovery_seconds 동안 즉시 실패시키고,
+    이후 half_open 상태에서 시험 호출 1건의 결과로 closed/open 을 결정합니다.
+    """
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+    def __init__(self, failure_threshold: int, recovery_seconds: float):
+        self._failure_threshold = failure_threshold
+        self._recovery_seconds = recovery_seconds
+        self._state = self.CLOSED
+        self._consecutive_failures = 0
+        self._opened_at = 0.0
+        self._probe_in_flight = False
+        self._short_circuited = 0
+
+    @property
+    def state(self) -> str:
+        if self._state == self.OPEN and time.monotonic() - self._opened_at >= self._recovery_seconds:
+            self._state = self.HALF_OPEN
+        return self._state
+
+    def allow(self) -> bool:
+        state = self.state
+        if state == self.CLOSED:
+            return True
+        if state == self.HALF_OPEN and not self._probe_in_flight:
+            self._probe_in_flight = True
+            return True
+        self._short_circuited += 1
+        return False
+
+    def record_success(self) -> None:
+        self._consecutive_failures = 0
+        self._probe_in_flight = False
+        self._state = self.CLOSED
+
+    def record_failure(self) -> None:
+        self._consecutive_failures += 1
+        if self._state == self.HALF_OPEN or self._consecutive_failures >= self._failure_threshold:
+            self._state = self.OPEN
+            self._opened_at = time.monotonic()
+        self._probe_in_flight = False
+
+    def record_ignored(self) -> None:
+        """취소된 호출: 시험 호출 자리만 반납합니다."""
+        self._probe_in_flight = False
+
+    def stats(self) -> dict:
+        return {
+            "state": self.state,
+            "consecutive_failures": self._consecutive_failures,
+            "short_circuited": self._short_circuited,
+        }
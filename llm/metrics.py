@@ -0,0 +1,107 @@
+"""
+LLM 호출 지표 (Prometheus).
+
+각 BaseLLMClient 구현체는 호출마다 LLMCallRecorder 를 만들어 결과를 기록합니다.
+수집된 지표는 GET /metrics 에서 Prometheus 텍스트 형식으로 노출됩니다.
+"""
+import asyncio
+import time
+from prometheus_client import Counter, Histogram
+
+_LATENCY_BUCKETS = (0.1, 0.25, 0.5, 0.75, 1.0, 1.5, 2.0, 3.0, 4.0, 5.0, 7.5, 10.0, 15.0, 30.0)
+
+LLM_REQUEST_DURATION = Histogram(
+    "moodping_llm_request_duration_seconds",
+    "LLM 호출 전체 소요 시간",
+    ["provider", "model", "mode", "outcome"],
+    buckets=_LATENCY_BUCKETS,
+)
+LLM_TIME_TO_FIRST_CHUNK = Histogram(
+    "moodping_llm_time_to_first_chunk_seconds",
+    "스트리밍 호출의 첫 청크 도착 시간",
+    ["provider", "model"],
+    buckets=_LATENCY_BUCKETS,
+)
+LLM_REQUESTS = Counter(
+    "moodping_llm_requests_total",
+    "LLM 호출 수 (outcome: success | empty | timeout | error)",
+    ["provider", "model", "mode", "outcome"],
+)
+LLM_ERRORS = Counter(
+    "moodping_llm_errors_total",
+    "LLM 호출 오류 수 (예외 타입별)",
+    ["provider", "model", "error_type"],
+)
+LLM_TOKENS = Counter(
+    "moodping_llm_tokens_total",
+    "LLM 토큰 사용량 (direction: input | output)",
+    ["provider", "model", "direction"],
+)
+LLM_OUTPUT_TOKENS = Histogram(
+    "moodping_llm_output_tokens",
+    "호출당 출력 토큰 수 (llm_max_tokens 조정용)",
+    ["provider", "model"],
+    buckets=(50, 100, 200, 300, 400, 500, 600, 800, 1000, 1500, 2000),
+)
+LLM_FINISH_REASONS = Counter(
+    "moodping_llm_finish_reason_total",
+    "LLM 응답 종료 사유",
+    ["provider", "model", "finish_reason"],
+)
+ANALYSIS_PARSE_RESULTS = Counter(
+    "moodping_analysis_parse_total",
+    "_parse_analysis_text 파싱 경로별 결과",
+    ["result"],
+)
+
+
+class LLMCallRecorder:
+    """LLM 호출 1건의 지연·토큰·종료 사유·오류를 기록합니다."""
+
+    def __init__(self, provider: str, model: str, mode: str = "complete"):
+        self._provider = provider
+        self._model = model
+        self._mode = mode
+        self._started = time.perf_counter()
+        self._first_chunk_seen = False
+
+    def first_chunk(self) -> None:
+        if self._first_chunk_seen:
+            return
+        self._first_chunk_seen = True
+        LLM_TIME_TO_FIRST_CHUNK.labels(self._provider, self._model).observe(time.perf_counter() - self._started)
+
+    def usage(
+        self,
+        input_tokens: int | None = None,
+        output_tokens: int | None = None,
+        finish_reason: str | None = None,
+    ) -> None:
+        if input_tokens:
+            LLM_TOKENS.labels(self._provider, self._model, "input").inc(input_tokens)
+        if output_tokens:
+            LLM_TOKENS.labels(self._provider, self._model, "output").inc(output_tokens)
+            LLM_OUTPUT_TOKENS.labels(self._provider, self._model).observe(output_tokens)
+        if finish_reason:
+            LLM_FINISH_REASONS.labels(self._provider, self._model, str(finish_reason).lower()).inc()
+
+    def success(self, has_text: bool = True) -> None:
+        self._finish("success" if has_text else "empty")
+
+    def failure(self, error: BaseException) -> None:
+        outcome = "timeout" if _is_timeout(error) else "error"
+        LLM_ERRORS.labels(self._provider, self._model, type(error).__name__).inc()
+        self._finish(outcome)
+
+    def _finish(self, outcome: str) -> None:
+        elapsed = time.perf_counter() - self._started
+        LLM_REQUEST_DURATION.labels(self._provider, self._model, self._mode, outcome).observe(elapsed)
+        LLM_REQUESTS.labels(self._provider, self._model, self._mode, outcome).inc()
+
+
+def record_parse_result(result: str) -> None:
+    ANALYSIS_PARSE_RESULTS.labels(result).inc()
+
+
+def _is_timeout(error: BaseException) -> bool:
+    return isinstance(error, (asyncio.TimeoutError, TimeoutError)) or "Timeout" in type(error).__name__
@@ -1,6 +1,8 @@
 import logging
+from collections.abc import AsyncIterator
 from openai import AsyncOpenAI, APIError
 from .base import BaseLLMClient
+from .metrics import LLMCallRecorder
 from moodping.config.settings import get_settings
 
 logger = logging.getLogger(__name__)
@@ -9,8 +11,11 @@ logger = logging.getLogger(__name__)
 class OpenAIClient(BaseLLMClient):
     """gpt-4.1-mini 기반 OpenAI 클라이언트."""
 
+    provider = "openai"
+
     def __init__(self):
         settings = get_settings()
+        self.model_name = settings.openai_model
         self._client = AsyncOpenAI(
             api_key=settings.openai_api_key,
             timeout=settings.llm_timeout_seconds,
@@ -20,6 +25,7 @@ class OpenAIClient(BaseLLMClient):
         self._temperature = settings.llm_temperature
 
     async def complete(self, system_prompt: str, user_prompt: str) -> str | None:
+        recorder = LLMCallRecorder(self.provider, self._model)
         try:
             response = await self._client.chat.completions.create(
                 model=self._model,
@@ -30,10 +36,76 @@ class OpenAIClient(BaseLLMClient):
                 max_tokens=self._max_tokens,
                 temperature=self._temperature,
             )
-            return response.choices[0].message.content
+            usage = response.usage
+            recorder.usage(
+                input_tokens=usage.prompt_tokens if usage else None,
+                output_tokens=usage.completion_tokens if usage else None,
+                finish_reason=response.choices[0].finish_reason,
+            )
+            content = response.choices[0].message.content
+            recorder.success(bool(content))
+            return content
         except APIError as e:
+            recorder.failure(e)
             logger.error("OpenAI API 오류: %s", e)
             return None
         except Exception as e:
+            recorder.failure(e)
             logger.error("OpenAI 호출 실패: %s", e)
             return None
+
+    async def complete_stream(self, system_prompt: str, user_prompt: str) -> AsyncIterator[str]:
+        recorder = LLMCallRecorder(self.provider, self._model, mode="stream")
+        try:
+            stream = await self._client.chat.completions.create(
+                model=self._model,
+                messages=[
+                    {"role": "system", "content": system_prompt},
+                    {"role": "user", "content": user_prompt},
+                ],
+                max_tokens=self._max_tokens,
+                temperature=self._temperature,
+                stream=True,
+                stream_options={"include_usage": True},
+            )
+        except APIError as e:
+            recorder.failure(e)
+            logger.error("OpenAI API 오류: %s", e)
+            return
+        except Exception as e:
+            recorder.failure(e)
+            logger.error("OpenAI 호출 실패: %s", e)
+            return
+
+        received = False
+        finish_reason = None
+        try:
+            async for chunk in stream:
+                if chunk.usage:
+                    recorder.usage(
+                        input_tokens=chunk.usage.prompt_tokens,
+                        output_tokens=chunk.usage.completion_tokens,
+                    )
+                if not chunk.choices:
+                    continue
+                finish_reason = chunk.choices[0].finish_reason or finish_reason
+                delta = chunk.choices[0].delta.content
+                if delta:
+                    received = True
+                    recorder.first_chunk()
+                    yield delta
+            recorder.usage(finish_reason=finish_reason)
+            recorder.success(received)
+        except GeneratorExit:
+            # 소비자가 필요한 만큼 받고 스트림을 닫은 경우 (조기 종료 = 정상)
+            recorder.success(received)
+            raise
+        except APIError as e:
+            recorder.failure(e)
+            logger.error("OpenAI 스트리밍 오류: %s", e)
+        except Exception as e:
+            recorder.failure(e)
+            logger.error("OpenAI 스트리밍 실패: %s", e)
+        finally:
+            # 소비자가 중간에 멈춰도 HTTP 스트림을 닫아 생성을 중단시킵니다.
+            await stream.close()
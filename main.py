@@ -2,12 +2,16 @@ import logging
 from contextlib import asynccontextmanager
 from pathlib import Path
 
-from fastapi import FastAPI
+import time
+
+from fastapi import FastAPI, Request
 from fastapi.staticfiles import StaticFiles
-from fastapi.responses import FileResponse
+from fastapi.responses import FileResponse, Response
+from prometheus_client import CONTENT_TYPE_LATEST, generate_latest
 
 from moodping.config.settings import get_settings
-from moodping.config.mysql_config import engine, Base
+from moodping.config.mysql_config import engine, async_engine, replica_async_engine, Base
+from moodping.config.read_replica import READ_YOUR_WRITES_COOKIE, ReplicaLagMonitor, read_your_writes_scope
 
 from moodping.kakao_authentication.controller.kakao_authentication_controller import (
     router as kakao_auth_router,
@@ -19,12 +23,21 @@ from moodping.mood_record.controller.mood_record_controller import mood_record_r
 from moodping.mood_analysis.controller.mood_analysis_controller import mood_analysis_router
 from moodping.weekly_report.controller.weekly_report_controller import weekly_report_router
 from moodping.event_log.controller.event_log_controller import event_log_router
+from moodping.event_log.spool.event_spool import EventSpool
+from moodping.event_log.live.live_feed_hub import LiveFeedHub
+from moodping.event_log.maintenance.event_log_partition_maintenance import EventLogPartitionMaintenance
+from moodping.mood_analysis.worker.mood_analysis_worker import MoodAnalysisWorkerPool
 
 import moodping.account.domain.entity.account         # noqa: F401
 import moodping.mood_record.domain.entity.mood_record  # noqa: F401
+import moodping.mood_record.domain.entity.user_daily_mood  # noqa: F401
 import moodping.mood_analysis.domain.entity.mood_analysis  # noqa: F401
+import moodping.mood_analysis.domain.entity.mood_analysis_job  # noqa: F401
 import moodping.weekly_report.domain.entity.weekly_report  # noqa: F401
 import moodping.event_log.domain.entity.event_log      # noqa: F401
+import moodping.event_log.domain.entity.session_summary  # noqa: F401
+import moodping.event_log.domain.entity.event_log_dedup  # noqa: F401
+import moodping.event_log.domain.entity.identifier_activity  # noqa: F401
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
@@ -37,7 +50,25 @@ async def lifespan(app: FastAPI):
     settings = get_settings()
     logger.info("MoodPing FastAPI 시작. LLM_PROVIDER=%s", settings.llm_provider)
     Base.metadata.create_all(bind=engine)
+    live_feed_hub = LiveFeedHub.get_instance()
+    live_feed_hub.start()
+    analysis_worker_pool = MoodAnalysisWorkerPool.get_instance()
+    analysis_worker_pool.start()
+    replica_lag_monitor = ReplicaLagMonitor.get_instance()
+    replica_lag_monitor.start(replica_async_engine)
+    event_spool = EventSpool.get_instance()
+    event_spool.start()
+    partition_maintenance = EventLogPartitionMaintenance.get_instance()
+    partition_maintenance.start()
     yield
+    await analysis_worker_pool.stop()
+    await replica_lag_monitor.stop()
+    await event_spool.stop()
+    await partition_maintenance.stop()
+    live_feed_hub.stop()
+    await async_engine.dispose()
+    if replica_async_engine is not None:
+        await replica_async_engine.dispose()
     logger.info("MoodPing FastAPI 종료.")
 
 
@@ -48,6 +79,26 @@ app = FastAPI(
     lifespan=lifespan,
 )
 
+@app.middleware("http")
+async def read_your_writes(request: Request, call_next):
+    """
+    사용자가 쓰기를 한 요청의 응답에 만료 시각 쿠키를 실어, 이후 읽기가 복제 지연과 무관하게
+    DB_READ_YOUR_WRITES_SECONDS 동안 primary 로 가게 합니다.
+    """
+    with read_your_writes_scope(request.cookies.get(READ_YOUR_WRITES_COOKIE)) as state:
+        response = await call_next(request)
+    if state.wrote:
+        window = get_settings().db_read_your_writes_seconds
+        response.set_cookie(
+            READ_YOUR_WRITES_COOKIE,
+            f"{time.time() + window:.3f}",
+            max_age=int(window) + 1,
+            httponly=True,
+            samesite="lax",
+        )
+    return response
+
+
 app.include_router(kakao_auth_router)
 app.include_router(kakao_redirect_router)
 app.include_router(auth_router)
@@ -82,3 +133,9 @@ def record_legacy():
 @app.get("/report", include_in_schema=False)
 def report():
     return FileResponse(STATIC_DIR / "report.html")
+
+
+@app.get("/metrics", include_in_schema=False)
+def metrics():
+    """Prometheus 텍스트 형식 지표 (LLM 지연·토큰·오류, 분석 파싱 결과, DB 풀 등). 워커 프로세스별 값입니다."""
+    return Response(content=generate_latest(), media_type=CONTENT_TYPE_LATEST)
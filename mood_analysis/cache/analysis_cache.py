@@ -0,0 +1,74 @@
+"""
+LLM 분석 결과 정확 일치(exact-match) 캐시.
+
+키 = provider + model + 생성 설정 + SYSTEM_PROMPT 해시 + 사용자 프롬프트 해시.
+프롬프트 템플릿이나 모델 설정이 바뀌면 키가 달라지므로 이전 항목은 자연히 적중하지 않고
+LRU/TTL 로 밀려납니다 (별도 무효화 불필요).
+"""
+import hashlib
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Callable
+
+class AnalysisCache:
+    def __init__(self, max_entries: int, ttl_seconds: float, clock: Callable[[], float] = time.monotonic):
+        if max_entries <= 0:
+            raise ValueError("max_entries must be positive")
+        self._max_entries = max_entries
+        self._ttl_seconds = ttl_seconds
+        self._clock = clock
+        self._entries: OrderedDict[str, tuple[float, str]] = OrderedDict()
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._expirations = 0
+
+    @staticmethod
+    def make_key(provider: str, model: str, generation: str, system_prompt: str, user_prompt: str) -> str:
+        system_hash = hashlib.sha256(system_prompt.encode("utf-8")).hexdigest()
+        raw = "\x1f".join([provider, model, generation, system_hash, user_prompt])
+        return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+    def get(self, key: str) -> str | None:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self._misses += 1
+                return None
+            expires_at, value = entry
+            if expires_at <= self._clock():
+                del self._entries[key]
+                self._expirations += 1
+                self._misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self._hits += 1
+            return value
+
+    def put(self, key: str, value: str) -> None:
+        with self._lock:
+            self._entries[key] = (self._clock() + self._ttl_seconds, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self._max_entries:
+                self._entries.popitem(last=False)
+                self._evictions += 1
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> dict:
+        with self._lock:
+            lookups = self._hits + self._misses
+            return {
+                "size": len(self._entries),
+                "max_entries": self._max_entries,
+                "ttl_seconds": self._ttl_seconds,
+                "hits": self._hits,
+                "misses": self._misses,
+                "hit_rate": round(self._hits / lookups, 4) if lookups else 0.0,
+                "evictions": self._evictions,
+                "expirations": self._expirations,
+            }
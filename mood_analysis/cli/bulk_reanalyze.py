@@ -0,0 +1,237 @@
+"""
+일괄 (재)분석 CLI.
+
+장애나 프롬프트 변경으로 분석이 없거나 오래된 기록을 한꺼번에 다시 분석합니다.
+- 후보 기록 ID를 id keyset 으로 페이지 단위 스트리밍
+- 제한된 동시성(--concurrency) + 초당 호출 상한(--rate). CLI 는 별도 프로세스라 자체 LLM 리미터를 쓰므로
+  API 서버의 실시간 트래픽을 보호하는 것은 이 두 상한뿐입니다 (LLM 공급자 쿼터를 함께 쓰는 점을 고려해 정하세요)
+- 대기·실행 중인 분석 작업(mood_analysis_job)이 있는 기록은 워커 몫이므로 건너뜀 → 같은 기록에 분석이 겹쳐 저장되지 않음
+- 페이지마다 한 트랜잭션으로 묶어 저장하고 체크포인트 파일에 진행 위치 기록 → 중단 후 이어서 실행
+- 실패한 기록은 건너뛰고 진행하며, --restart 로 다시 실행하면 아직 대상인 기록만 재시도됩니다
+
+사용 예:
+    python -m moodping.mood_analysis.cli.bulk_reanalyze --mode missing
+    python -m moodping.mood_analysis.cli.bulk_reanalyze --mode before --analyzed-before 2026-10-01T00:00:00
+"""
+import argparse
+import asyncio
+import json
+import logging
+import os
+import time
+from datetime import datetime
+from pathlib import Path
+
+from moodping.config.mysql_config import SessionLocal
+from moodping.llm.limiter import LLMPriority, llm_priority
+from moodping.mood_analysis.domain.entity.mood_analysis import MoodAnalysis
+from moodping.mood_analysis.repository.mood_analysis_repository_impl import MoodAnalysisRepositoryImpl
+from moodping.mood_analysis.service.mood_analysis_service_impl import MoodAnalysisServiceImpl
+from moodping.mood_record.domain.entity.mood_record import MoodRecord
+from moodping.mood_record.repository.mood_record_repository_impl import MoodRecordRepositoryImpl
+
+logger = logging.getLogger("moodping.bulk_reanalyze")
+
+MODE_MISSING = "missing"
+MODE_BEFORE = "before"
+
+
+class _RateLimiter:
+    """초당 rate 회를 넘지 않도록 호출 시작 시각을 일정 간격으로 벌립니다."""
+
+    def __init__(self, rate_per_second: float):
+        self._interval = 1.0 / rate_per_second if rate_per_second > 0 else 0.0
+        self._next_at = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    async def wait(self) -> None:
+        if self._interval <= 0:
+            return
+        async with self._lock:
+            now = time.monotonic()
+            if self._next_at > now:
+                await asyncio.sleep(self._next_at - now)
+            self._next_at = max(now, self._next_at) + self._interval
+
+
+class _Checkpoint:
+    def __init__(self, path: Path, mode: str, analyzed_before: str | None):
+        self.path = path
+        self.mode = mode
+        self.analyzed_before = analyzed_before
+        self.last_record_id = 0
+        self.succeeded = 0
+        self.failed = 0
+
+    def load(self) -> None:
+        if not self.path.exists():
+            return
+        data = json.loads(self.path.read_text(encoding="utf-8"))
+        if data.get("mode") != self.mode or data.get("analyzed_before") != self.analyzed_before:
+            raise SystemExit(
+                f"체크포인트({self.path})의 실행 조건이 다릅니다. "
+                f"같은 조건으로 실행하거나 --restart 를 사용하세요."
+            )
+        self.last_record_id = int(data.get("last_record_id", 0))
+        self.succeeded = int(data.get("succeeded", 0))
+        self.failed = int(data.get("failed", 0))
+
+    def save(self) -> None:
+        data = {
+            "mode": self.mode,
+            "analyzed_before": self.analyzed_before,
+            "last_record_id": self.last_record_id,
+            "succeeded": self.succeeded,
+            "failed": self.failed,
+            "updated_at": datetime.now().isoformat(timespec="seconds"),
+        }
+        tmp = self.path.with_suffix(self.path.suffix + ".tmp")
+        tmp.write_text(json.dumps(data, ensure_ascii=False, indent=2), encoding="utf-8")
+        os.replace(tmp, self.path)
+
+
+class BulkReanalyzer:
+    def __init__(self, args: argparse.Namespace):
+        self.args = args
+        self.analysis_service = MoodAnalysisServiceImpl.get_instance()
+        self.mood_analysis_repository = MoodAnalysisRepositoryImpl.get_instance()
+        self.mood_record_repository = MoodRecordRepositoryImpl.get_instance()
+        self.analyzed_before = datetime.fromisoformat(args.analyzed_before) if args.analyzed_before else None
+        self.checkpoint = _Checkpoint(Path(args.checkpoint), args.mode, args.analyzed_before)
+        self.rate_limiter = _RateLimiter(args.rate)
+        self.semaphore = asyncio.Semaphore(args.concurrency)
+
+    async def run(self) -> None:
+        if not self.args.restart:
+            self.checkpoint.load()
+        if self.checkpoint.last_record_id:
+            logger.info("체크포인트에서 재개: last_record_id=%d", self.checkpoint.last_record_id)
+
+        started = time.monotonic()
+        processed = 0
+        while self.args.limit is None or processed < self.args.limit:
+            page_size = self.args.batch_size
+            if self.args.limit is not None:
+                page_size = min(page_size, self.args.limit - processed)
+
+            records = self._load_page(page_size)
+            if not records:
+                break
+
+            results = await asyncio.gather(*(self._analyze(record) for record in records))
+            succeeded = self._save_page(records, results)
+
+            processed += len(records)
+            self.checkpoint.last_record_id = records[-1].id
+            self.checkpoint.succeeded += succeeded
+            self.checkpoint.failed += len(records) - succeeded
+            self.checkpoint.save()
+
+            elapsed = time.monotonic() - started
+            logger.info(
+                "진행: last_record_id=%d, 이번 실행 %d건 (%.1f건/s), 누적 성공 %d / 실패 %d",
+                self.checkpoint.last_record_id, processed, processed / elapsed if elapsed else 0.0,
+                self.checkpoint.succeeded, self.checkpoint.failed,
+            )
+
+        logger.info("완료: 누적 성공 %d / 실패 %d", self.checkpoint.succeeded, self.checkpoint.failed)
+
+    def _load_page(self, page_size: int) -> list[MoodRecord]:
+        session = SessionLocal()
+        try:
+            after_id = self.checkpoint.last_record_id
+            if self.args.mode == MODE_MISSING:
+                ids = self.mood_analysis_repository.find_record_ids_missing_analysis(session, after_id, page_size)
+            else:
+                ids = self.mood_analysis_repository.find_record_ids_analyzed_before(
+                    session, self.analyzed_before, after_id, page_size,
+                )
+            records = self.mood_record_repository.find_all_by_ids(session, ids)
+            # 세션을 닫은 뒤에도 속성을 읽을 수 있도록 분리합니다.
+            session.expunge_all()
+            return records
+        finally:
+            session.close()
+
+    async def _analyze(self, record: MoodRecord) -> str | None:
+        async with self.semaphore:
+            await self.rate_limiter.wait()
+            try:
+                return await self.analysis_service.analyze(record)
+            except Exception as e:
+                logger.error("분석 실패 (record_id=%s): %s", record.id, e)
+                return None
+
+    def _save_page(self, records: list[MoodRecord], results: list[str | None]) -> int:
+        """
+        페이지 결과를 한 트랜잭션으로 저장합니다. 기존 분석이 있으면 본문만 교체합니다.
+        분석하는 동안 워커가 맡게 된 기록(대기·실행 중 작업)은 작업 행을 잠근 채 확인해 저장하지 않습니다.
+        """
+        analyzed = [(record, text) for record, text in zip(records, results) if text]
+        if not analyzed:
+            return 0
+
+        session = SessionLocal()
+        try:
+            owned_by_worker = self.mood_analysis_repository.lock_record_ids_with_active_job(
+                session, [record.id for record, _ in analyzed],
+            )
+            if owned_by_worker:
+                logger.info("분석 작업이 진행 중인 기록 %d건은 저장하지 않음: %s", len(owned_by_worker), sorted(owned_by_worker))
+                analyzed = [(record, text) for record, text in analyzed if record.id not in owned_by_worker]
+            existing = {
+                analysis.record_id: analysis
+                for analysis in self.mood_analysis_repository.find_all_by_record_ids(
+                    session, [record.id for record, _ in analyzed],
+                )
+            }
+            for record, analysis_text in analyzed:
+                analysis = existing.get(record.id)
+                if analysis is not None:
+                    analysis.analysis_text = analysis_text.strip()
+                    analysis.updated_at = datetime.now()
+                else:
+                    self.mood_analysis_repository.save(session, MoodAnalysis.create(
+                        record_id=record.id,
+                        user_id=record.user_id or record.anon_id,
+                        analysis_text=analysis_text,
+                    ))
+            session.commit()
+            return len(analyzed)
+        except Exception:
+            session.rollback()
+            raise
+        finally:
+            session.close()
+
+
+def _parse_args(argv: list[str] | None = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="분석이 없거나 오래된 mood_record 를 일괄 (재)분석합니다.")
+    parser.add_argument("--mode", choices=[MODE_MISSING, MODE_BEFORE], default=MODE_MISSING,
+                        help="missing: 분석 없는 기록 / before: --analyzed-before 이전 분석만 있는 기록")
+    parser.add_argument("--analyzed-before", default=None, help="ISO 일시 (--mode before 에서 필수)")
+    parser.add_argument("--checkpoint", default=".bulk_reanalyze.checkpoint.json", help="체크포인트 파일 경로")
+    parser.add_argument("--restart", action="store_true", help="체크포인트를 무시하고 처음부터 실행")
+    parser.add_argument("--concurrency", type=int, default=8, help="동시 LLM 호출 수")
+    parser.add_argument("--rate", type=float, default=5.0, help="초당 LLM 호출 상한 (0 이면 무제한)")
+    parser.add_argument("--batch-size", type=int, default=200, help="페이지(커밋) 단위 기록 수")
+    parser.add_argument("--limit", type=int, default=None, help="이번 실행에서 처리할 최대 기록 수")
+    args = parser.parse_args(argv)
+    if args.mode == MODE_BEFORE and not args.analyzed_before:
+        parser.error("--mode before 에는 --analyzed-before 가 필요합니다.")
+    return args
+
+
+async def _main(args: argparse.Namespace) -> None:
+    # 이 프로세스 안의 리미터 대기열에서만 의미가 있습니다 (API 서버의 대기열과 경쟁하지 않음).
+    with llm_priority(LLMPriority.BATCH):
+        await BulkReanalyzer(args).run()
+
+
+def main(argv: list[str] | None = None) -> None:
+    logging.basicConfig(level=logging.INFO)
+    asyncio.run(_main(_parse_args(argv)))
+
+
+if __name__ == "__main__":
+    main()
@@ -2,50 +2,91 @@
 MoodAnalysisController — FastAPI 라우터.
 """
 from fastapi import APIRouter, Depends, HTTPException
-from sqlalchemy.orm import Session
 
-from moodping.config.mysql_config import get_db
+from moodping.config.unit_of_work import AsyncUnitOfWork, get_unit_of_work
+from moodping.event_log.live.live_feed_hub import LiveFeedHub
+from moodping.llm.factory import get_llm_client
+from moodping.llm.limiter import LLMPriority, llm_priority
 # authentication에서 구현할 get_current_user_payload
 # from moodping.authentication.controller.authentication_controller import get_current_user_payload
 from moodping.mood_record.domain.entity.mood_record import MoodRecord
+from moodping.mood_record.service.mood_record_async_service_impl import MoodRecordAsyncServiceImpl
 from moodping.mood_analysis.service.mood_analysis_service_impl import MoodAnalysisServiceImpl
+from moodping.mood_analysis.service.mood_analysis_job_service_impl import MoodAnalysisJobServiceImpl
 
 mood_analysis_router = APIRouter(prefix="/mood-analysis", tags=["mood-analysis"])
 
 def inject_mood_analysis_service() -> MoodAnalysisServiceImpl:
     return MoodAnalysisServiceImpl.get_instance()
 
+def inject_mood_analysis_job_service() -> MoodAnalysisJobServiceImpl:
+    return MoodAnalysisJobServiceImpl.get_instance()
+
+def inject_mood_record_service() -> MoodRecordAsyncServiceImpl:
+    return MoodRecordAsyncServiceImpl.get_instance()
+
 @mood_analysis_router.post("/{record_id}/analyze")
 async def analyze_record(
     record_id: int,
-    db: Session = Depends(get_db),
+    uow: AsyncUnitOfWork = Depends(get_unit_of_work),
     # current_user_payload: dict = Depends(get_current_user_payload),
     service: MoodAnalysisServiceImpl = Depends(inject_mood_analysis_service),
+    mood_record_service: MoodRecordAsyncServiceImpl = Depends(inject_mood_record_service),
 ):
-    record: MoodRecord | None = db.get(MoodRecord, record_id)
+    record: MoodRecord | None = await mood_record_service.find_by_id(record_id, uow)
     if not record:
         raise HTTPException(status_code=404, detail=f"MoodRecord(id={record_id})를 찾을 수 없습니다.")
 
-    result = await service.analyze_and_save(record=record, db=db)
+    # 수동 재분석은 기록 직후 분석보다 낮은 우선순위로 LLM 호출 슬롯을 받고,
+    # 같은 결과를 새 행으로 다시 저장하지 않도록 캐시를 건너뜁니다.
+    with llm_priority(LLMPriority.MANUAL):
+        result = await service.analyze_and_save(record=record, uow=uow, use_cache=False)
     if result is None:
         raise HTTPException(status_code=502, detail="LLM 분석에 실패했습니다. 잠시 후 다시 시도해 주세요.")
+    await uow.commit()
+    LiveFeedHub.get_instance().publish_analysis(record_id, result.analysis_text)
 
     return {
         "record_id": record_id,
         "analysis_text": result.analysis_text,
     }
 
+@mood_analysis_router.get("/cache/stats", tags=["debug"])
+def get_cache_stats(
+    service: MoodAnalysisServiceImpl = Depends(inject_mood_analysis_service),
+):
+    return service.get_cache_stats()
+
+@mood_analysis_router.get("/llm/stats", tags=["debug"])
+def get_llm_stats():
+    return get_llm_client().stats()
+
 @mood_analysis_router.get("/{record_id}")
 async def get_analysis(
     record_id: int,
-    db: Session = Depends(get_db),
+    uow: AsyncUnitOfWork = Depends(get_unit_of_work),
     service: MoodAnalysisServiceImpl = Depends(inject_mood_analysis_service),
+    job_service: MoodAnalysisJobServiceImpl = Depends(inject_mood_analysis_job_service),
 ):
-    result = await service.get_analysis_by_record_id(record_id=record_id, db=db)
-    if result is None:
+    """
+    분석 결과 또는 진행 상황을 조회합니다.
+    analysis_status: pending | running | success | failed
+    """
+    result = await service.get_analysis_by_record_id(record_id=record_id, uow=uow)
+    if result is not None:
+        return {
+            "record_id": record_id,
+            "analysis_status": "success",
+            "analysis_text": result.analysis_text,
+        }
+
+    job = await job_service.get_status(record_id=record_id, uow=uow)
+    if job is None:
         raise HTTPException(status_code=404, detail=f"record_id={record_id} 에 대한 분석 결과가 없습니다.")
 
     return {
         "record_id": record_id,
-        "analysis_text": result.analysis_text,
+        "analysis_status": job.status,
+        "analysis_text": None,
+        "attempts": job.attempts,
     }
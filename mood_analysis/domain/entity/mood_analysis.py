@@ -14,6 +14,7 @@ class MoodAnalysis(Base):
     user_id       = Column(String(100), nullable=True)
     analysis_text = Column(Text, nullable=True)
     created_at    = Column(DateTime, nullable=False, server_default=func.now())
+    updated_at    = Column(DateTime, nullable=True)  # 일괄 재분석으로 본문을 교체한 시각 (created_at 은 최초 분석 시각 유지)
 
     @classmethod
     def create(
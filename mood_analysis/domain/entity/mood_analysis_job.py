@@ -0,0 +1,42 @@
+"""
+MoodAnalysisJob 도메인 엔터티.
+감정 기록 1건에 대한 LLM 분석 작업 (DB 기반 작업 큐).
+"""
+from datetime import datetime
+from sqlalchemy import BigInteger, Column, String, DateTime, SmallInteger, Index
+from sqlalchemy.sql import func
+from moodping.config.mysql_config import Base
+
+STATUS_PENDING = "pending"
+STATUS_RUNNING = "running"
+STATUS_SUCCESS = "success"
+STATUS_FAILED  = "failed"
+
+class MoodAnalysisJob(Base):
+    __tablename__ = "mood_analysis_job"
+    __table_args__ = (
+        Index("idx_mood_analysis_job_status_next_run_at", "status", "next_run_at"),
+        {"extend_existing": True},
+    )
+
+    id          = Column(BigInteger, primary_key=True, autoincrement=True)
+    record_id   = Column(BigInteger, nullable=False, unique=True)
+    status      = Column(String(20), nullable=False, default=STATUS_PENDING)
+    attempts    = Column(SmallInteger, nullable=False, default=0)
+    next_run_at = Column(DateTime, nullable=False)
+    locked_at   = Column(DateTime, nullable=True)
+    last_error  = Column(String(500), nullable=True)
+    created_at  = Column(DateTime, nullable=False, server_default=func.now())
+    updated_at  = Column(DateTime, nullable=False, server_default=func.now(), onupdate=func.now())
+
+    @classmethod
+    def create(cls, record_id: int, run_at: datetime | None = None) -> "MoodAnalysisJob":
+        if record_id is None:
+            raise ValueError("record_id must not be empty")
+
+        return cls(
+            record_id=record_id,
+            status=STATUS_PENDING,
+            attempts=0,
+            next_run_at=run_at or datetime.now(),
+        )
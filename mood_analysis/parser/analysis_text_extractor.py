@@ -0,0 +1,125 @@
+"""
+LLM 스트리밍 출력에서 {"analysis_text": "..."} 값을 한 번의 순회로 꺼내는 증분 추출기.
+
+청크가 들어오는 대로 JSON 문자열 이스케이프(\\n, \\", \\uXXXX 등, 청크 경계에서 잘린 경우 포함)를
+풀어 새로 확정된 본문을 돌려줍니다. 짝이 맞지 않는 서로게이트(\\uD83D 단독 등)는 버립니다. 닫는 따옴표를 만나거나 max_chars 에 도달하면 done 이 되며,
+호출 측은 그 즉시 스트림을 닫아 남은 생성을 취소할 수 있습니다.
+코드 블록(```json)이나 앞뒤 설명 문구는 키를 찾을 때 자연히 건너뜁니다.
+"""
+import re
+
+_KEY_PATTERN = re.compile(r'"analysis_text"\s*:\s*"')
+_KEY_LOOKBEHIND = 64  # 청크 경계에 걸친 키를 찾기 위해 다시 훑는 길이
+_SIMPLE_ESCAPES = {'"': '"', "\\": "\\", "/": "/", "b": "\b", "f": "\f", "n": "\n", "r": "\r", "t": "\t"}
+
+
+class AnalysisTextExtractor:
+    def __init__(self, max_chars: int):
+        self._max_chars = max_chars
+        self._raw: list[str] = []
+        self._seek_buffer = ""
+        self._found = False
+        self._done = False
+        self._truncated = False
+        self._escape = ""          # 처리 중인 이스케이프 시퀀스 ("\\" 또는 "\\uXX" 등)
+        self._high_surrogate = ""  # \uD83D 처럼 짝을 기다리는 상위 서로게이트
+        self._parts: list[str] = []
+        self._length = 0
+
+    @property
+    def found(self) -> bool:
+        return self._found
+
+    @property
+    def done(self) -> bool:
+        return self._done
+
+    @property
+    def truncated(self) -> bool:
+        return self._truncated
+
+    @property
+    def raw(self) -> str:
+        return "".join(self._raw)
+
+    @property
+    def text(self) -> str:
+        return "".join(self._parts)
+
+    def feed(self, chunk: str) -> str:
+        """청크를 받아 이번에 새로 확정된 analysis_text 조각을 반환합니다."""
+        self._raw.append(chunk)
+        if self._done or not chunk:
+            return ""
+
+        if not self._found:
+            self._seek_buffer += chunk
+            match = _KEY_PATTERN.search(self._seek_buffer)
+            if not match:
+                self._seek_buffer = self._seek_buffer[-_KEY_LOOKBEHIND:]
+                return ""
+            self._found = True
+            chunk = self._seek_buffer[match.end():]
+            self._seek_buffer = ""
+
+        out: list[str] = []
+        for ch in chunk:
+            if self._done:
+                break
+            if self._escape:
+                self._consume_escape(ch, out)
+            elif ch == "\\":
+                self._escape = ch
+            elif ch == '"':
+                self._done = True
+            else:
+                self._emit(ch, out)
+        return "".join(out)
+
+    def result(self) -> str | None:
+        """키를 찾았고 본문이 비어 있지 않으면 추출한 본문, 아니면 None."""
+        if not self._found:
+            return None
+        text = self.text
+        return text if text.strip() else None
+
+    def _consume_escape(self, ch: str, out: list[str]) -> None:
+        self._escape += ch
+        if self._escape[1] == "u":
+            if len(self._escape) < 6:
+                return
+            try:
+                code = int(self._escape[2:], 16)
+            except ValueError:
+                self._emit(self._escape, out)
+                self._escape = ""
+                return
+            self._escape = ""
+            if 0xD800 <= code <= 0xDBFF:
+                self._high_surrogate = chr(code)
+                return
+            if 0xDC00 <= code <= 0xDFFF:
+                # 짝이 맞지 않는 서로게이트는 UTF-8 로 저장할 수 없으므로 버립니다.
+                if self._high_surrogate:
+                    pair = (self._high_surrogate + chr(code)).encode("utf-16", "surrogatepass").decode("utf-16")
+                    self._emit(pair, out)
+                self._high_surrogate = ""
+                return
+            self._emit(chr(code), out)
+            return
+
+        self._emit(_SIMPLE_ESCAPES.get(ch, ch), out)
+        self._escape = ""
+
+    def _emit(self, text: str, out: list[str]) -> None:
+        # 상위 서로게이트 바로 뒤에 하위 서로게이트가 아닌 글자가 오면 그 상위 서로게이트는 버립니다.
+        self._high_surrogate = ""
+        remaining = self._max_chars - self._length
+        if len(text) > remaining:
+            text = text[:remaining]
+        out.append(text)
+        self._parts.append(text)
+        self._length += len(text)
+        if self._length >= self._max_chars:
+            self._truncated = True
+            self._done = True
@@ -0,0 +1,16 @@
+from abc import ABC, abstractmethod
+from sqlalchemy.ext.asyncio import AsyncSession
+from moodping.mood_analysis.domain.entity.mood_analysis import MoodAnalysis
+
+class MoodAnalysisAsyncRepository(ABC):
+    @abstractmethod
+    async def save(self, session: AsyncSession, analysis: MoodAnalysis) -> MoodAnalysis:
+        pass
+
+    @abstractmethod
+    async def find_by_record_id(self, session: AsyncSession, record_id: int) -> MoodAnalysis | None:
+        pass
+
+    @abstractmethod
+    async def exists_by_record_id(self, session: AsyncSession, record_id: int) -> bool:
+        pass
@@ -0,0 +1,34 @@
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+from moodping.mood_analysis.domain.entity.mood_analysis import MoodAnalysis
+from moodping.mood_analysis.repository.mood_analysis_async_repository import MoodAnalysisAsyncRepository
+
+class MoodAnalysisAsyncRepositoryImpl(MoodAnalysisAsyncRepository):
+    __instance = None
+
+    def __new__(cls):
+        if cls.__instance is None:
+            cls.__instance = super().__new__(cls)
+        return cls.__instance
+
+    @classmethod
+    def get_instance(cls) -> "MoodAnalysisAsyncRepositoryImpl":
+        if cls.__instance is None:
+            cls.__instance = cls()
+        return cls.__instance
+
+    async def save(self, session: AsyncSession, analysis: MoodAnalysis) -> MoodAnalysis:
+        session.add(analysis)
+        return analysis
+
+    async def find_by_record_id(self, session: AsyncSession, record_id: int) -> MoodAnalysis | None:
+        result = await session.execute(
+            select(MoodAnalysis).where(MoodAnalysis.record_id == record_id).limit(1)
+        )
+        return result.scalars().first()
+
+    async def exists_by_record_id(self, session: AsyncSession, record_id: int) -> bool:
+        result = await session.execute(
+            select(MoodAnalysis.id).where(MoodAnalysis.record_id == record_id).limit(1)
+        )
+        return result.first() is not None
@@ -0,0 +1,21 @@
+from abc import ABC, abstractmethod
+from datetime import datetime
+from sqlalchemy.ext.asyncio import AsyncSession
+from moodping.mood_analysis.domain.entity.mood_analysis_job import MoodAnalysisJob
+
+class MoodAnalysisJobRepository(ABC):
+    @abstractmethod
+    async def save(self, session: AsyncSession, job: MoodAnalysisJob) -> MoodAnalysisJob:
+        pass
+
+    @abstractmethod
+    async def find_by_id(self, session: AsyncSession, job_id: int) -> MoodAnalysisJob | None:
+        pass
+
+    @abstractmethod
+    async def find_by_record_id(self, session: AsyncSession, record_id: int) -> MoodAnalysisJob | None:
+        pass
+
+    @abstractmethod
+    async def lock_next_runnable(self, session: AsyncSession, now: datetime, stale_before: datetime) -> MoodAnalysisJob | None:
+        pass
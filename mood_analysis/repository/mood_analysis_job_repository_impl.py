@@ -0,0 +1,56 @@
+from datetime import datetime
+from sqlalchemy import and_, or_, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from moodping.mood_analysis.domain.entity.mood_analysis_job import (
+    MoodAnalysisJob,
+    STATUS_PENDING,
+    STATUS_RUNNING,
+)
+from moodping.mood_analysis.repository.mood_analysis_job_repository import MoodAnalysisJobRepository
+
+class MoodAnalysisJobRepositoryImpl(MoodAnalysisJobRepository):
+    __instance = None
+
+    def __new__(cls):
+        if cls.__instance is None:
+            cls.__instance = super().__new__(cls)
+        return cls.__instance
+
+    @classmethod
+    def get_instance(cls) -> "MoodAnalysisJobRepositoryImpl":
+        if cls.__instance is None:
+            cls.__instance = cls()
+        return cls.__instance
+
+    async def save(self, session: AsyncSession, job: MoodAnalysisJob) -> MoodAnalysisJob:
+        session.add(job)
+        await session.flush()
+        return job
+
+    async def find_by_id(self, session: AsyncSession, job_id: int) -> MoodAnalysisJob | None:
+        return await session.get(MoodAnalysisJob, job_id)
+
+    async def find_by_record_id(self, session: AsyncSession, record_id: int) -> MoodAnalysisJob | None:
+        result = await session.execute(
+            select(MoodAnalysisJob).where(MoodAnalysisJob.record_id == record_id).limit(1)
+        )
+        return result.scalars().first()
+
+    async def lock_next_runnable(self, session: AsyncSession, now: datetime, stale_before: datetime) -> MoodAnalysisJob | None:
+        """
+        실행 가능한 작업 1건을 SELECT ... FOR UPDATE SKIP LOCKED 로 잠급니다.
+        - pending 이고 next_run_at 이 지난 작업
+        - running 이지만 locked_at 이 stale_before 이전인 작업 (워커 비정상 종료 후 재시작 복구)
+        다른 워커가 잠근 행은 건너뛰므로 워커끼리 같은 작업을 집지 않습니다.
+        """
+        result = await session.execute(
+            select(MoodAnalysisJob)
+            .where(or_(
+                and_(MoodAnalysisJob.status == STATUS_PENDING, MoodAnalysisJob.next_run_at <= now),
+                and_(MoodAnalysisJob.status == STATUS_RUNNING, MoodAnalysisJob.locked_at < stale_before),
+            ))
+            .order_by(MoodAnalysisJob.next_run_at.asc(), MoodAnalysisJob.id.asc())
+            .limit(1)
+            .with_for_update(skip_locked=True)
+        )
+        return result.scalars().first()
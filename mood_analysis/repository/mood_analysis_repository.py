@@ -1,4 +1,5 @@
 from abc import ABC, abstractmethod
+from datetime import datetime
 from sqlalchemy.orm import Session
 from moodping.mood_analysis.domain.entity.mood_analysis import MoodAnalysis
 
@@ -18,3 +19,19 @@ class MoodAnalysisRepository(ABC):
     @abstractmethod
     def exists_by_record_id(self, session: Session, record_id: int) -> bool:
         pass
+
+    @abstractmethod
+    def find_record_ids_missing_analysis(self, session: Session, after_id: int, limit: int) -> list[int]:
+        pass
+
+    @abstractmethod
+    def find_record_ids_analyzed_before(self, session: Session, before: datetime, after_id: int, limit: int) -> list[int]:
+        pass
+
+    @abstractmethod
+    def find_all_by_record_ids(self, session: Session, record_ids: list[int]) -> list[MoodAnalysis]:
+        pass
+
+    @abstractmethod
+    def lock_record_ids_with_active_job(self, session: Session, record_ids: list[int]) -> set[int]:
+        pass
@@ -1,7 +1,22 @@
+from datetime import datetime
+from sqlalchemy import exists, func
 from sqlalchemy.orm import Session
+from moodping.mood_record.domain.entity.mood_record import MoodRecord
 from moodping.mood_analysis.domain.entity.mood_analysis import MoodAnalysis
+from moodping.mood_analysis.domain.entity.mood_analysis_job import MoodAnalysisJob, STATUS_PENDING, STATUS_RUNNING
 from moodping.mood_analysis.repository.mood_analysis_repository import MoodAnalysisRepository
 
+# 분석 작업 큐(워커)가 맡고 있는 기록. 일괄 재분석은 이 기록을 건드리지 않습니다.
+_ACTIVE_JOB_STATUSES = (STATUS_PENDING, STATUS_RUNNING)
+
+
+def _has_active_job(record_id_column):
+    return exists().where(
+        MoodAnalysisJob.record_id == record_id_column,
+        MoodAnalysisJob.status.in_(_ACTIVE_JOB_STATUSES),
+    )
+
+
 class MoodAnalysisRepositoryImpl(MoodAnalysisRepository):
     __instance = None
 
@@ -28,3 +43,57 @@ class MoodAnalysisRepositoryImpl(MoodAnalysisRepository):
 
     def exists_by_record_id(self, session: Session, record_id: int) -> bool:
         return session.query(MoodAnalysis).filter(MoodAnalysis.record_id == record_id).count() > 0
+
+    def find_record_ids_missing_analysis(self, session: Session, after_id: int, limit: int) -> list[int]:
+        """
+        분석이 없는 기록 ID를 id 오름차순 keyset 으로 조회합니다 (PK 범위 스캔 + 안티 조인).
+        대기·실행 중인 분석 작업이 있는 기록은 워커가 처리하므로 제외합니다.
+        """
+        rows = (
+            session.query(MoodRecord.id)
+            .filter(
+                MoodRecord.id > after_id,
+                ~exists().where(MoodAnalysis.record_id == MoodRecord.id),
+                ~_has_active_job(MoodRecord.id),
+            )
+            .order_by(MoodRecord.id.asc())
+            .limit(limit)
+            .all()
+        )
+        return [row.id for row in rows]
+
+    def find_record_ids_analyzed_before(self, session: Session, before: datetime, after_id: int, limit: int) -> list[int]:
+        """
+        before 이전에 생성(재분석이면 교체)된 분석만 가진 기록 ID를 keyset 으로 조회합니다 (프롬프트 변경 후 재분석용).
+        대기·실행 중인 분석 작업이 있는 기록은 제외합니다.
+        """
+        rows = (
+            session.query(MoodAnalysis.record_id)
+            .filter(MoodAnalysis.record_id > after_id, ~_has_active_job(MoodAnalysis.record_id))
+            .group_by(MoodAnalysis.record_id)
+            .having(func.max(func.coalesce(MoodAnalysis.updated_at, MoodAnalysis.created_at)) < before)
+            .order_by(MoodAnalysis.record_id.asc())
+            .limit(limit)
+            .all()
+        )
+        return [row.record_id for row in rows]
+
+    def find_all_by_record_ids(self, session: Session, record_ids: list[int]) -> list[MoodAnalysis]:
+        if not record_ids:
+            return []
+        return session.query(MoodAnalysis).filter(MoodAnalysis.record_id.in_(record_ids)).all()
+
+    def lock_record_ids_with_active_job(self, session: Session, record_ids: list[int]) -> set[int]:
+        """
+        record_ids 의 분석 작업 행을 SELECT ... FOR UPDATE 로 잠그고, 대기·실행 중인 작업이 있는 기록 ID를 돌려줍니다.
+        트랜잭션이 끝날 때까지 워커는 이 작업들을 가져가지 못하므로(SKIP LOCKED), 그 사이 같은 기록에 분석이 겹쳐 저장되지 않습니다.
+        """
+        if not record_ids:
+            return set()
+        jobs = (
+            session.query(MoodAnalysisJob.record_id, MoodAnalysisJob.status)
+            .filter(MoodAnalysisJob.record_id.in_(record_ids))
+            .with_for_update()
+            .all()
+        )
+        return {job.record_id for job in jobs if job.status in _ACTIVE_JOB_STATUSES}
@@ -0,0 +1,44 @@
+"""
+MoodAnalysisJobService — 추상 베이스 클래스 (ABC).
+변경은 전달받은 AsyncUnitOfWork 에 쌓기만 하며 commit 은 작업 단위를 소유한 호출자가 합니다.
+"""
+from abc import ABC, abstractmethod
+from moodping.config.unit_of_work import AsyncUnitOfWork
+
+class AnalysisJobStatus:
+    def __init__(self, record_id: int, status: str, attempts: int, last_error: str | None = None):
+        self.record_id = record_id
+        self.status = status
+        self.attempts = attempts
+        self.last_error = last_error
+
+class ClaimedAnalysisJob:
+    def __init__(self, job_id: int, record_id: int, attempts: int):
+        self.job_id = job_id
+        self.record_id = record_id
+        self.attempts = attempts
+
+class MoodAnalysisJobService(ABC):
+    @abstractmethod
+    async def enqueue(self, record_id: int, uow: AsyncUnitOfWork, delay_seconds: float = 0.0) -> AnalysisJobStatus:
+        pass
+
+    @abstractmethod
+    async def claim_next(self, uow: AsyncUnitOfWork) -> ClaimedAnalysisJob | None:
+        pass
+
+    @abstractmethod
+    async def mark_success(self, job_id: int, uow: AsyncUnitOfWork) -> None:
+        pass
+
+    @abstractmethod
+    async def mark_success_by_record_id(self, record_id: int, uow: AsyncUnitOfWork) -> None:
+        pass
+
+    @abstractmethod
+    async def mark_failure(self, job_id: int, error: str, uow: AsyncUnitOfWork) -> AnalysisJobStatus | None:
+        pass
+
+    @abstractmethod
+    async def get_status(self, record_id: int, uow: AsyncUnitOfWork) -> AnalysisJobStatus | None:
+        pass
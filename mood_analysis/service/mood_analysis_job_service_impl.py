@@ -0,0 +1,126 @@
+import logging
+from datetime import datetime, timedelta
+
+from moodping.config.read_replica import replica_read
+from moodping.config.settings import get_settings
+from moodping.config.unit_of_work import AsyncUnitOfWork
+from moodping.mood_analysis.domain.entity.mood_analysis_job import (
+    MoodAnalysisJob,
+    STATUS_RUNNING,
+    STATUS_SUCCESS,
+    STATUS_PENDING,
+    STATUS_FAILED,
+)
+from moodping.mood_analysis.repository.mood_analysis_job_repository_impl import MoodAnalysisJobRepositoryImpl
+from moodping.mood_analysis.service.mood_analysis_job_service import (
+    MoodAnalysisJobService,
+    AnalysisJobStatus,
+    ClaimedAnalysisJob,
+)
+
+logger = logging.getLogger(__name__)
+_MAX_ERROR_CHARS = 500
+
+class MoodAnalysisJobServiceImpl(MoodAnalysisJobService):
+    __instance = None
+
+    def __new__(cls):
+        if cls.__instance is None:
+            cls.__instance = super().__new__(cls)
+        return cls.__instance
+
+    @classmethod
+    def get_instance(cls) -> "MoodAnalysisJobServiceImpl":
+        if cls.__instance is None:
+            cls.__instance = cls()
+        return cls.__instance
+
+    def __init__(self) -> None:
+        if hasattr(self, "_initialized"):
+            return
+        self._initialized = True
+        self.mood_analysis_job_repository = MoodAnalysisJobRepositoryImpl.get_instance()
+
+    async def enqueue(self, record_id: int, uow: AsyncUnitOfWork, delay_seconds: float = 0.0) -> AnalysisJobStatus:
+        """delay_seconds 동안은 워커가 가져가지 않습니다 (요청 안에서 직접 분석하는 경로의 안전망용)."""
+        run_at = datetime.now() + timedelta(seconds=delay_seconds) if delay_seconds > 0 else None
+        job = MoodAnalysisJob.create(record_id=record_id, run_at=run_at)
+        await self.mood_analysis_job_repository.save(uow.session, job)
+        return self._to_status(job)
+
+    async def claim_next(self, uow: AsyncUnitOfWork) -> ClaimedAnalysisJob | None:
+        """다른 워커가 같은 작업을 집지 않도록 호출자는 곧바로 commit 해 잠금을 풀어야 합니다."""
+        settings = get_settings()
+        now = datetime.now()
+        stale_before = now - timedelta(seconds=settings.analysis_job_stale_seconds)
+        while True:
+            job = await self.mood_analysis_job_repository.lock_next_runnable(uow.session, now, stale_before)
+            if job is None:
+                return None
+            if job.status != STATUS_RUNNING:
+                break
+            # 처리 중 워커가 죽은 작업. 매번 워커를 죽이는 작업이 끝없이 재개되지 않도록 시도 횟수를 여기서도 셉니다.
+            if (job.attempts or 0) >= settings.analysis_job_max_attempts:
+                logger.error("중단이 반복된 분석 작업 종료 (job_id=%s, record_id=%s, attempts=%s)", job.id, job.record_id, job.attempts)
+                job.status = STATUS_FAILED
+                job.locked_at = None
+                job.last_error = "처리 중 워커 중단이 최대 시도 횟수만큼 반복됨"
+                continue
+            logger.warning("중단된 분석 작업 재개 (job_id=%s, record_id=%s)", job.id, job.record_id)
+            break
+        job.status = STATUS_RUNNING
+        job.attempts = (job.attempts or 0) + 1
+        job.locked_at = now
+        return ClaimedAnalysisJob(job_id=job.id, record_id=job.record_id, attempts=job.attempts)
+
+    async def mark_success(self, job_id: int, uow: AsyncUnitOfWork) -> None:
+        job = await self.mood_analysis_job_repository.find_by_id(uow.session, job_id)
+        if job is None:
+            return
+        job.status = STATUS_SUCCESS
+        job.locked_at = None
+        job.last_error = None
+
+    async def mark_success_by_record_id(self, record_id: int, uow: AsyncUnitOfWork) -> None:
+        """요청 안에서 분석을 저장한 경로(SSE)가 안전망으로 등록해 둔 작업을 끝냅니다."""
+        job = await self.mood_analysis_job_repository.find_by_record_id(uow.session, record_id)
+        if job is None or job.status == STATUS_SUCCESS:
+            return
+        job.status = STATUS_SUCCESS
+        job.locked_at = None
+        job.last_error = None
+
+    async def mark_failure(self, job_id: int, error: str, uow: AsyncUnitOfWork) -> AnalysisJobStatus | None:
+        """
+        실패한 작업을 지수 백오프로 재시도 대기시키고,
+        최대 시도 횟수를 넘기면 failed 로 종료합니다.
+        """
+        settings = get_settings()
+        job = await self.mood_analysis_job_repository.find_by_id(uow.session, job_id)
+        if job is None:
+            return None
+        job.locked_at = None
+        job.last_error = (error or "")[:_MAX_ERROR_CHARS]
+        if job.attempts >= settings.analysis_job_max_attempts:
+            job.status = STATUS_FAILED
+        else:
+            delay = settings.analysis_job_retry_base_seconds * (2 ** (job.attempts - 1))
+            job.status = STATUS_PENDING
+            job.next_run_at = datetime.now() + timedelta(seconds=delay)
+        return self._to_status(job)
+
+    @replica_read
+    async def get_status(self, record_id: int, uow: AsyncUnitOfWork) -> AnalysisJobStatus | None:
+        job = await self.mood_analysis_job_repository.find_by_record_id(uow.session, record_id)
+        if job is None:
+            return None
+        return self._to_status(job)
+
+    @staticmethod
+    def _to_status(job: MoodAnalysisJob) -> AnalysisJobStatus:
+        return AnalysisJobStatus(
+            record_id=job.record_id,
+            status=job.status,
+            attempts=job.attempts or 0,
+            last_error=job.last_error,
+        )
@@ -2,7 +2,8 @@
 MoodAnalysisService — 추상 베이스 클래스 (ABC).
 """
 from abc import ABC, abstractmethod
-from sqlalchemy.orm import Session
+from collections.abc import AsyncIterator
+from moodping.config.unit_of_work import AsyncUnitOfWork
 
 from moodping.mood_record.domain.entity.mood_record import MoodRecord
 
@@ -10,19 +11,46 @@ class AnalysisResult:
     def __init__(self, analysis_text: str):
         self.analysis_text = analysis_text
 
+class AnalysisStreamEvent:
+    """
+    스트리밍 분석 중 발생하는 이벤트.
+    delta: 새로 생성된 텍스트 조각 / done=True: 스트림 종료 (result가 None이면 실패)
+    """
+    def __init__(self, delta: str | None = None, result: AnalysisResult | None = None, done: bool = False):
+        self.delta = delta
+        self.result = result
+        self.done = done
+
 class MoodAnalysisService(ABC):
     @abstractmethod
     async def analyze_and_save(
         self,
         record: MoodRecord,
-        db: Session,
+        uow: AsyncUnitOfWork,
+        use_cache: bool = True,
     ) -> AnalysisResult | None:
         pass
 
+    @abstractmethod
+    async def analyze(
+        self,
+        record: MoodRecord,
+        use_cache: bool = True,
+    ) -> str | None:
+        pass
+
+    @abstractmethod
+    def analyze_stream(
+        self,
+        record: MoodRecord,
+        use_cache: bool = True,
+    ) -> AsyncIterator[AnalysisStreamEvent]:
+        pass
+
     @abstractmethod
     async def get_analysis_by_record_id(
         self,
         record_id: int,
-        db: Session,
+        uow: AsyncUnitOfWork,
     ) -> AnalysisResult | None:
         pass
@@ -1,15 +1,28 @@
 import json
 import logging
 import re
-from sqlalchemy.orm import Session
+from collections.abc import AsyncIterator
 
 from moodping.mood_record.domain.entity.mood_record import MoodRecord
-from moodping.mood_analysis.service.mood_analysis_service import MoodAnalysisService, AnalysisResult
+from moodping.config.read_replica import mark_write, replica_read
+from moodping.config.unit_of_work import AsyncUnitOfWork
+from moodping.config.settings import get_settings
+from moodping.event_log.live.live_feed_hub import LiveFeedHub
+from moodping.mood_analysis.service.mood_analysis_service import (
+    MoodAnalysisService,
+    AnalysisResult,
+    AnalysisStreamEvent,
+)
 # llm client
+from moodping.llm.base import BaseLLMClient
 from moodping.llm.factory import get_llm_client
+from moodping.llm.metrics import record_parse_result
 from moodping.mood_analysis.domain.entity.mood_analysis import MoodAnalysis
 from moodping.mood_analysis.prompt import mood_analysis_prompt
-from moodping.mood_analysis.repository.mood_analysis_repository_impl import MoodAnalysisRepositoryImpl
+from moodping.mood_analysis.cache.analysis_cache import AnalysisCache
+from moodping.mood_analysis.parser.analysis_text_extractor import AnalysisTextExtractor
+from moodping.mood_analysis.repository.mood_analysis_async_repository_impl import MoodAnalysisAsyncRepositoryImpl
+from moodping.mood_analysis.service.mood_analysis_job_service_impl import MoodAnalysisJobServiceImpl
 
 logger = logging.getLogger(__name__)
 _MAX_ANALYSIS_CHARS = 1500
@@ -32,52 +45,172 @@ class MoodAnalysisServiceImpl(MoodAnalysisService):
         if hasattr(self, "_initialized"):
             return
         self._initialized = True
-        self.mood_analysis_repository = MoodAnalysisRepositoryImpl.get_instance()
+        self.mood_analysis_repository = MoodAnalysisAsyncRepositoryImpl.get_instance()
+        self.job_service = MoodAnalysisJobServiceImpl.get_instance()
+        settings = get_settings()
+        self.analysis_cache = (
+            AnalysisCache(
+                max_entries=settings.analysis_cache_max_entries,
+                ttl_seconds=settings.analysis_cache_ttl_seconds,
+            )
+            if settings.analysis_cache_enabled else None
+        )
+
+    async def analyze_and_save(self, record: MoodRecord, uow: AsyncUnitOfWork, use_cache: bool = True) -> AnalysisResult | None:
+        """
+        분석 결과를 uow 에 쌓습니다. commit 은 호출자가 다른 쓰기(작업 상태 등)와 묶어서 합니다.
+        롤백된 분석이 대시보드에 보이지 않도록 실시간 피드 발행(LiveFeedHub.publish_analysis)도 호출자가 커밋 뒤에 합니다.
+        use_cache=False 는 사용자가 요청한 재분석용으로, 캐시를 읽지 않고 LLM 을 다시 호출합니다 (새 결과는 캐시에 씀).
+        """
+        # LLM 을 기다리는 동안 커넥션을 풀에 돌려둡니다.
+        await uow.release()
+        analysis_text = await self.analyze(record, use_cache=use_cache)
+        if not analysis_text:
+            return None
 
-    async def analyze_and_save(self, record: MoodRecord, db: Session) -> AnalysisResult | None:
+        return await self._save(uow, record, analysis_text)
+
+    async def analyze(self, record: MoodRecord, use_cache: bool = True) -> str | None:
+        """LLM 분석만 수행하고 저장하지 않습니다 (일괄 재분석처럼 저장을 묶어서 할 때 사용)."""
         llm = get_llm_client()
         system_prompt = mood_analysis_prompt.SYSTEM_PROMPT
         user_prompt   = mood_analysis_prompt.build(record)
 
-        raw = await llm.complete(system_prompt, user_prompt)
-        if not raw:
-            return None
+        cache_key = self._cache_key(llm, system_prompt, user_prompt)
+        analysis_text = self._cache_get(cache_key) if use_cache else None
+        if analysis_text is not None:
+            return analysis_text
+
+        extractor = AnalysisTextExtractor(max_chars=_MAX_ANALYSIS_CHARS)
+        async for _ in self._generate(llm, system_prompt, user_prompt, extractor):
+            pass
 
-        analysis_text = self._parse_analysis_text(raw)
+        analysis_text = self._finish_extraction(extractor)
         if not analysis_text:
             return None
+        self._cache_put(cache_key, analysis_text)
+        return analysis_text
 
-        owner_id = record.user_id or record.anon_id
+    async def analyze_stream(self, record: MoodRecord, use_cache: bool = True) -> AsyncIterator[AnalysisStreamEvent]:
+        """
+        LLM 응답에서 추출한 analysis_text 를 생성되는 대로 delta 이벤트로 흘려보내고,
+        생성이 끝나면 저장한 뒤 done 이벤트를 내보냅니다.
+        스트리밍 응답은 요청 스코프 작업 단위보다 오래 살아 있으므로 저장은 자체 AsyncUnitOfWork 로 합니다.
+        호출자가 안전망으로 등록해 둔 분석 작업은 저장과 같은 트랜잭션에서 success 로 끝냅니다.
+        use_cache=False 면 캐시를 읽지 않습니다 (analyze_and_save 와 같음).
+        """
+        llm = get_llm_client()
+        system_prompt = mood_analysis_prompt.SYSTEM_PROMPT
+        user_prompt   = mood_analysis_prompt.build(record)
+
+        cache_key = self._cache_key(llm, system_prompt, user_prompt)
+        analysis_text = self._cache_get(cache_key) if use_cache else None
+        if analysis_text is not None:
+            yield AnalysisStreamEvent(delta=analysis_text)
+        else:
+            extractor = AnalysisTextExtractor(max_chars=_MAX_ANALYSIS_CHARS)
+            async for delta in self._generate(llm, system_prompt, user_prompt, extractor):
+                yield AnalysisStreamEvent(delta=delta)
+
+            analysis_text = self._finish_extraction(extractor)
+            if not analysis_text:
+                yield AnalysisStreamEvent(done=True)
+                return
+            self._cache_put(cache_key, analysis_text)
 
         try:
-            analysis = MoodAnalysis.create(
-                record_id=record.id,
-                user_id=owner_id,
-                analysis_text=analysis_text,
-            )
-            self.mood_analysis_repository.save(db, analysis)
-            db.commit()
-            return AnalysisResult(analysis_text=analysis_text)
+            async with AsyncUnitOfWork() as uow:
+                result = await self._save(uow, record, analysis_text)
+                await self.job_service.mark_success_by_record_id(record.id, uow)
+                await uow.commit()
+            LiveFeedHub.get_instance().publish_analysis(record.id, analysis_text)
         except Exception as exc:
-            db.rollback()
-            return None
+            logger.error("MoodAnalysis 저장 실패 (record_id=%s): %s", record.id, exc)
+            result = None
+        yield AnalysisStreamEvent(result=result, done=True)
+
+    @staticmethod
+    async def _generate(
+        llm: BaseLLMClient,
+        system_prompt: str,
+        user_prompt: str,
+        extractor: AnalysisTextExtractor,
+    ) -> AsyncIterator[str]:
+        """
+        LLM 출력 청크를 추출기에 흘려 넣으며 새로 확정된 본문 조각을 내보냅니다.
+        닫는 따옴표나 글자 수 상한에 도달하면 스트림을 닫아 남은 출력 토큰 생성을 취소합니다.
+        """
+        stream = llm.complete_stream(system_prompt, user_prompt)
+        try:
+            async for chunk in stream:
+                delta = extractor.feed(chunk)
+                if delta:
+                    yield delta
+                if extractor.done:
+                    break
+        finally:
+            await stream.aclose()
+
+    def _finish_extraction(self, extractor: AnalysisTextExtractor) -> str | None:
+        analysis_text = extractor.result()
+        if analysis_text is not None:
+            record_parse_result("stream_capped" if extractor.truncated else "stream")
+            return analysis_text
+        # 키를 찾지 못한 응답(평문, 이스케이프된 키 등)은 기존 파서로 처리합니다.
+        return self._parse_analysis_text(extractor.raw)
+
+    async def _save(self, uow: AsyncUnitOfWork, record: MoodRecord, analysis_text: str) -> AnalysisResult:
+        analysis = MoodAnalysis.create(
+            record_id=record.id,
+            user_id=record.user_id or record.anon_id,
+            analysis_text=analysis_text,
+        )
+        await self.mood_analysis_repository.save(uow.session, analysis)
+        mark_write()
+        return AnalysisResult(analysis_text=analysis_text)
 
-    async def get_analysis_by_record_id(self, record_id: int, db: Session) -> AnalysisResult | None:
-        analysis = self.mood_analysis_repository.find_by_record_id(db, record_id)
+    @replica_read
+    async def get_analysis_by_record_id(self, record_id: int, uow: AsyncUnitOfWork) -> AnalysisResult | None:
+        analysis = await self.mood_analysis_repository.find_by_record_id(uow.session, record_id)
         if not analysis or not analysis.analysis_text:
             return None
         return AnalysisResult(analysis_text=analysis.analysis_text)
 
+    def get_cache_stats(self) -> dict:
+        if self.analysis_cache is None:
+            return {"enabled": False}
+        return {"enabled": True, **self.analysis_cache.stats()}
+
+    def _cache_key(self, llm: BaseLLMClient, system_prompt: str, user_prompt: str) -> str | None:
+        if self.analysis_cache is None:
+            return None
+        settings = get_settings()
+        generation = f"max_tokens={settings.llm_max_tokens};temperature={settings.llm_temperature}"
+        return AnalysisCache.make_key(llm.provider, llm.model_name, generation, system_prompt, user_prompt)
+
+    def _cache_get(self, cache_key: str | None) -> str | None:
+        if cache_key is None:
+            return None
+        return self.analysis_cache.get(cache_key)
+
+    def _cache_put(self, cache_key: str | None, analysis_text: str) -> None:
+        if cache_key is not None:
+            self.analysis_cache.put(cache_key, analysis_text)
+
     @staticmethod
     def _parse_analysis_text(content: str) -> str | None:
         if not content:
+            record_parse_result("empty")
             return None
         match = re.search(r'"analysis_text"\s*:\s*"((?:[^"\\]|\\.)*)"', content, re.DOTALL)
+        result = "regex"
         if not match:
             match = re.search(r'"analysis_text"\s*:\s*"((?:[^"\\]|\\.)*)', content, re.DOTALL)
+            result = "regex_truncated"
         if match:
             raw = match.group(1)
             text = raw.replace("\\n", "\n").replace('\\"', '"').replace("\\\\", "\\")
+            record_parse_result(result if text.strip() else "empty_text")
             return text[:_MAX_ANALYSIS_CHARS] if text.strip() else None
 
         try:
@@ -85,6 +218,8 @@ class MoodAnalysisServiceImpl(MoodAnalysisService):
             cleaned = re.sub(r"```\s*$", "", cleaned, flags=re.MULTILINE).strip()
             data = json.loads(cleaned)
             text = data.get("analysis_text", "")
+            record_parse_result("json" if text.strip() else "empty_text")
             return text[:_MAX_ANALYSIS_CHARS] if text.strip() else None
         except (json.JSONDecodeError, AttributeError):
+            record_parse_result("raw_fallback")
             return content[:_MAX_ANALYSIS_CHARS]
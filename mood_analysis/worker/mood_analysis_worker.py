@@ -0,0 +1,134 @@
+"""
+MoodAnalysisWorkerPool — 인프로세스 비동기 분석 워커 풀.
+
+mood_analysis_job 테이블에서 작업을 SKIP LOCKED 로 하나씩 가져와 LLM 분석을 수행합니다.
+HTTP 요청은 작업을 등록만 하고 즉시 응답하므로, 분석 처리량은 열린 HTTP 연결 수가 아니라
+워커 수(ANALYSIS_WORKER_CONCURRENCY)로 제한됩니다.
+"""
+import asyncio
+import logging
+
+from moodping.config.settings import get_settings
+from moodping.config.unit_of_work import AsyncUnitOfWork
+from moodping.event_log.live.live_feed_hub import LiveFeedHub
+from moodping.mood_record.service.mood_record_async_service_impl import MoodRecordAsyncServiceImpl
+from moodping.mood_analysis.service.mood_analysis_job_service import ClaimedAnalysisJob
+from moodping.mood_analysis.service.mood_analysis_job_service_impl import MoodAnalysisJobServiceImpl
+from moodping.mood_analysis.service.mood_analysis_service_impl import MoodAnalysisServiceImpl
+
+logger = logging.getLogger(__name__)
+
+class MoodAnalysisWorkerPool:
+    __instance = None
+
+    def __new__(cls):
+        if cls.__instance is None:
+            cls.__instance = super().__new__(cls)
+        return cls.__instance
+
+    @classmethod
+    def get_instance(cls) -> "MoodAnalysisWorkerPool":
+        if cls.__instance is None:
+            cls.__instance = cls()
+        return cls.__instance
+
+    def __init__(self) -> None:
+        if hasattr(self, "_initialized"):
+            return
+        self._initialized = True
+        self._tasks: list[asyncio.Task] = []
+        self._wakeup: asyncio.Event | None = None
+        self._stopping = False
+        self.job_service = MoodAnalysisJobServiceImpl.get_instance()
+        self.analysis_service = MoodAnalysisServiceImpl.get_instance()
+        self.mood_record_service = MoodRecordAsyncServiceImpl.get_instance()
+
+    def start(self) -> None:
+        if self._tasks:
+            return
+        settings = get_settings()
+        self._stopping = False
+        self._wakeup = asyncio.Event()
+        self._tasks = [
+            asyncio.create_task(self._run(i), name=f"mood-analysis-worker-{i}")
+            for i in range(settings.analysis_worker_concurrency)
+        ]
+        logger.info("분석 워커 풀 시작 (workers=%d)", len(self._tasks))
+
+    async def stop(self) -> None:
+        self._stopping = True
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._tasks = []
+        logger.info("분석 워커 풀 종료")
+
+    def notify(self) -> None:
+        """새 작업이 등록되었음을 알려 폴링 대기 없이 바로 가져가게 합니다."""
+        if self._wakeup is not None:
+            self._wakeup.set()
+
+    async def _run(self, worker_no: int) -> None:
+        poll_interval = get_settings().analysis_job_poll_interval_seconds
+        while not self._stopping:
+            try:
+                claimed = await self._claim()
+            except Exception as e:
+                logger.error("분석 작업 조회 실패 (worker=%d): %s", worker_no, e)
+                claimed = None
+
+            if claimed is None:
+                try:
+                    await asyncio.wait_for(self._wakeup.wait(), timeout=poll_interval)
+                except asyncio.TimeoutError:
+                    pass
+                self._wakeup.clear()
+                continue
+
+            await self._process(claimed)
+
+    async def _claim(self) -> ClaimedAnalysisJob | None:
+        async with AsyncUnitOfWork() as uow:
+            claimed = await self.job_service.claim_next(uow)
+            await uow.commit()
+            return claimed
+
+    async def _process(self, claimed: ClaimedAnalysisJob) -> None:
+        """분석 결과 저장과 작업 상태 갱신을 한 트랜잭션으로 커밋합니다."""
+        async with AsyncUnitOfWork() as uow:
+            try:
+                record = await self.mood_record_service.find_by_id(claimed.record_id, uow)
+                if record is None:
+                    await self.job_service.mark_failure(claimed.job_id, "mood_record 없음", uow)
+                    await uow.commit()
+                    return
+
+                # 저장 직후 재시작된 경우 중복 분석하지 않습니다.
+                if await self.analysis_service.mood_analysis_repository.exists_by_record_id(uow.session, record.id):
+                    await self.job_service.mark_success(claimed.job_id, uow)
+                    await uow.commit()
+                    return
+
+                result = await self.analysis_service.analyze_and_save(record=record, uow=uow)
+                if result is not None:
+                    await self.job_service.mark_success(claimed.job_id, uow)
+                    await uow.commit()
+                    LiveFeedHub.get_instance().publish_analysis(record.id, result.analysis_text)
+                else:
+                    status = await self.job_service.mark_failure(claimed.job_id, "LLM 분석 실패", uow)
+                    await uow.commit()
+                    logger.warning(
+                        "분석 작업 실패 (record_id=%s, attempts=%d, status=%s)",
+                        claimed.record_id, claimed.attempts, status.status if status else None,
+                    )
+            except asyncio.CancelledError:
+                # 종료 중 취소된 작업은 running 상태로 남아 stale 복구 대상이 됩니다.
+                raise
+            except Exception as e:
+                logger.error("분석 작업 처리 오류 (record_id=%s): %s", claimed.record_id, e)
+                try:
+                    await uow.rollback()
+                    await self.job_service.mark_failure(claimed.job_id, str(e), uow)
+                    await uow.commit()
+                except Exception as mark_error:
+                    logger.error("분석 작업 실패 기록 오류 (job_id=%s): %s", claimed.job_id, mark_error)
@@ -0,0 +1,52 @@
+"""
+user_daily_mood 백필/재구성 CLI.
+
+user_daily_mood 도입 이전의 기록(또는 요약이 어긋난 사용자)을 mood_record 에서 다시 계산합니다.
+- user_id keyset 으로 --batch-size 명씩 처리하고 배치마다 커밋 (사용자 단위로 지우고 다시 넣음)
+- 중단 후 --after 로 이어서 실행
+
+사용 예:
+    python -m moodping.mood_record.cli.rebuild_user_daily_mood
+    python -m moodping.mood_record.cli.rebuild_user_daily_mood --after 12345 --batch-size 200
+"""
+import argparse
+import logging
+
+from moodping.config.unit_of_work import UnitOfWork
+from moodping.mood_record.repository.user_daily_mood_repository_impl import UserDailyMoodRepositoryImpl
+
+logger = logging.getLogger("moodping.rebuild_user_daily_mood")
+
+
+def rebuild(after_user_id: str, batch_size: int) -> int:
+    repository = UserDailyMoodRepositoryImpl.get_instance()
+    batches = 0
+    last_user_id = after_user_id
+    while True:
+        with UnitOfWork() as uow:
+            processed_until = repository.rebuild_users(uow.session, last_user_id, batch_size)
+            uow.commit()
+        if processed_until is None:
+            break
+        last_user_id = processed_until
+        batches += 1
+        logger.info("배치 %d 완료 (마지막 user_id=%s)", batches, last_user_id)
+    return batches
+
+
+def _parse_args(argv: list[str] | None = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="mood_record 로부터 user_daily_mood 를 다시 만듭니다.")
+    parser.add_argument("--after", default="", help="이 user_id 다음부터 처리 (중단 후 이어서 실행)")
+    parser.add_argument("--batch-size", type=int, default=500, help="한 트랜잭션에서 처리할 사용자 수")
+    return parser.parse_args(argv)
+
+
+def main(argv: list[str] | None = None) -> None:
+    logging.basicConfig(level=logging.INFO)
+    args = _parse_args(argv)
+    batches = rebuild(args.after, args.batch_size)
+    logger.info("user_daily_mood 재구성 완료 (배치 %d개)", batches)
+
+
+if __name__ == "__main__":
+    main()
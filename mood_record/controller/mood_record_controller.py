@@ -1,19 +1,33 @@
+import json
 import logging
+from datetime import date
 from fastapi import APIRouter, Depends, HTTPException, Query
-from sqlalchemy.orm import Session
+from fastapi.responses import StreamingResponse
 
 from moodping.mood_record.controller.request.create_mood_record_request import CreateMoodRecordRequest
-from moodping.mood_record.service.mood_record_service_impl import MoodRecordServiceImpl
+from moodping.mood_record.service.mood_record_async_service_impl import MoodRecordAsyncServiceImpl
+from moodping.mood_record.service.mood_record_service_impl import STATS_PERIOD_WEEK, MoodRecordServiceImpl
 from moodping.mood_analysis.service.mood_analysis_service_impl import MoodAnalysisServiceImpl
-from moodping.authentication.controller.authentication_controller import get_current_user_payload_optional
-from moodping.config.mysql_config import get_db
+from moodping.mood_analysis.service.mood_analysis_job_service_impl import MoodAnalysisJobServiceImpl
+from moodping.mood_analysis.worker.mood_analysis_worker import MoodAnalysisWorkerPool
+from moodping.authentication.controller.authentication_controller import (
+    get_current_user_payload,
+    get_current_user_payload_optional,
+)
+from moodping.config.settings import get_settings
+from moodping.config.unit_of_work import AsyncUnitOfWork, get_unit_of_work
+from moodping.event_log.live.live_feed_hub import LiveFeedHub
 
 logger = logging.getLogger(__name__)
 
 mood_record_router = APIRouter(tags=["mood-records"])
 
 
-def inject_mood_record_service() -> MoodRecordServiceImpl:
+def inject_mood_record_service() -> MoodRecordAsyncServiceImpl:
+    return MoodRecordAsyncServiceImpl.get_instance()
+
+
+def inject_mood_record_stats_service() -> MoodRecordServiceImpl:
     return MoodRecordServiceImpl.get_instance()
 
 
@@ -21,34 +35,149 @@ def inject_mood_analysis_service() -> MoodAnalysisServiceImpl:
     return MoodAnalysisServiceImpl.get_instance()
 
 
+def inject_mood_analysis_job_service() -> MoodAnalysisJobServiceImpl:
+    return MoodAnalysisJobServiceImpl.get_instance()
+
+
 @mood_record_router.post("/mood-records")
 async def create_mood_record(
     request: CreateMoodRecordRequest,
-    db: Session = Depends(get_db),
-    mood_record_service: MoodRecordServiceImpl = Depends(inject_mood_record_service),
-    mood_analysis_service: MoodAnalysisServiceImpl = Depends(inject_mood_analysis_service),
+    uow: AsyncUnitOfWork = Depends(get_unit_of_work),
+    mood_record_service: MoodRecordAsyncServiceImpl = Depends(inject_mood_record_service),
+    mood_analysis_job_service: MoodAnalysisJobServiceImpl = Depends(inject_mood_analysis_job_service),
     payload: dict | None = Depends(get_current_user_payload_optional),
 ):
+    """
+    감정 기록을 저장하고 LLM 분석 작업을 큐에 등록한 뒤 즉시 응답합니다.
+    기록과 작업 등록은 한 트랜잭션으로 커밋됩니다.
+    분석 진행 상황은 GET /mood-analysis/{record_id} 로 조회합니다.
+    """
     try:
         user_id = payload.get("sub") if payload else None
-        record = mood_record_service.create(
+        record = await mood_record_service.create(
             mood_emoji=request.mood_emoji,
             intensity=request.intensity,
             mood_text=request.mood_text,
+            uow=uow,
             user_id=user_id,
             anon_id=request.anon_id if not user_id else None,
         )
 
-        analysis_result = await mood_analysis_service.analyze_and_save(record=record, db=db)
-        analysis_text = analysis_result.analysis_text if analysis_result else None
-        analysis_status = "success" if analysis_result else "failed"
+        job = await mood_analysis_job_service.enqueue(record_id=record.id, uow=uow)
+        await uow.commit()
+        MoodAnalysisWorkerPool.get_instance().notify()
+        LiveFeedHub.get_instance().publish_record(record)
 
         return {
             "record_id": record.id,
             "record_date": record.record_date.isoformat(),
             "saved": True,
-            "analysis": {"analysis_text": analysis_text} if analysis_text else None,
-            "analysis_status": analysis_status,
+            "analysis": None,
+            "analysis_status": job.status,
         }
     except ValueError as e:
         raise HTTPException(status_code=400, detail=str(e))
+
+
+@mood_record_router.get("/mood-records")
+async def list_mood_records(
+    cursor: str | None = Query(None, description="이전 응답의 next_cursor (첫 페이지는 생략)"),
+    limit: int = Query(20, ge=1, le=100),
+    uow: AsyncUnitOfWork = Depends(get_unit_of_work),
+    mood_record_service: MoodRecordAsyncServiceImpl = Depends(inject_mood_record_service),
+    payload: dict = Depends(get_current_user_payload),
+):
+    """
+    로그인 사용자의 감정 기록을 최신순으로 분석 결과와 함께 조회합니다 (keyset 페이지네이션).
+    응답의 next_cursor 를 cursor 로 넘기면 다음 페이지를 받으며, has_more 가 false 면 마지막 페이지입니다.
+    익명 ID 는 서버가 발급·검증하는 값이 아니고 디버그 대시보드에도 노출되므로, 익명 ID 로는 기록을 조회할 수 없습니다.
+    """
+    try:
+        return await mood_record_service.find_page(
+            uow=uow,
+            user_id=payload.get("sub"),
+            cursor=cursor,
+            limit=limit,
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+
+@mood_record_router.get("/mood-records/stats")
+def get_mood_stats(
+    period: str = Query(STATS_PERIOD_WEEK, description="week | month | year"),
+    on_date: date | None = Query(None, alias="date", description="기준일 (기본 오늘, YYYY-MM-DD)"),
+    mood_record_service: MoodRecordServiceImpl = Depends(inject_mood_record_stats_service),
+    payload: dict = Depends(get_current_user_payload),
+):
+    """로그인 사용자의 주간·월간·연간 감정 통계 (기록 수, 평균·최소·최대 강도, 이모지 분포)."""
+    try:
+        return mood_record_service.get_stats(user_id=payload.get("sub"), period=period, on_date=on_date)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+
+def _sse(event: str, data: dict) -> str:
+    return f"event: {event}\ndata: {json.dumps(data, ensure_ascii=False)}\n\n"
+
+
+@mood_record_router.post("/mood-records/stream")
+async def create_mood_record_stream(
+    request: CreateMoodRecordRequest,
+    uow: AsyncUnitOfWork = Depends(get_unit_of_work),
+    mood_record_service: MoodRecordAsyncServiceImpl = Depends(inject_mood_record_service),
+    mood_analysis_service: MoodAnalysisServiceImpl = Depends(inject_mood_analysis_service),
+    mood_analysis_job_service: MoodAnalysisJobServiceImpl = Depends(inject_mood_analysis_job_service),
+    payload: dict | None = Depends(get_current_user_payload_optional),
+):
+    """
+    감정 기록을 저장한 뒤 LLM 분석 결과를 SSE(text/event-stream)로 토큰 단위 전송합니다.
+    기록과 함께 ANALYSIS_STREAM_JOB_DELAY_SECONDS 뒤에 실행될 분석 작업을 등록해 두므로,
+    연결이 끊기거나 스트림 분석이 실패해도 워커가 이어서 분석·재시도합니다 (스트림이 저장하면 작업은 success).
+    - record: 저장된 기록 정보 (즉시 전송)
+    - delta:  LLM이 생성한 텍스트 조각
+    - done:   최종 분석 결과 및 analysis_status (분석은 스트림 종료 시 저장됨, 실패 시 pending)
+    """
+    try:
+        user_id = payload.get("sub") if payload else None
+        record = await mood_record_service.create(
+            mood_emoji=request.mood_emoji,
+            intensity=request.intensity,
+            mood_text=request.mood_text,
+            uow=uow,
+            user_id=user_id,
+            anon_id=request.anon_id if not user_id else None,
+        )
+        await mood_analysis_job_service.enqueue(
+            record_id=record.id,
+            uow=uow,
+            delay_seconds=get_settings().analysis_stream_job_delay_seconds,
+        )
+        await uow.commit()
+        LiveFeedHub.get_instance().publish_record(record)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+    async def event_stream():
+        yield _sse("record", {
+            "record_id": record.id,
+            "record_date": record.record_date.isoformat(),
+            "saved": True,
+        })
+        async for event in mood_analysis_service.analyze_stream(record):
+            if event.delta:
+                yield _sse("delta", {"text": event.delta})
+            if event.done:
+                analysis_text = event.result.analysis_text if event.result else None
+                yield _sse("done", {
+                    "record_id": record.id,
+                    "analysis": {"analysis_text": analysis_text} if analysis_text else None,
+                    # 실패해도 등록해 둔 작업을 워커가 이어받으므로 GET /mood-analysis/{record_id} 로 이어서 조회합니다.
+                    "analysis_status": "success" if analysis_text else "pending",
+                })
+
+    return StreamingResponse(
+        event_stream(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
@@ -1,15 +1,20 @@
 from datetime import datetime, date
-from sqlalchemy import BigInteger, Column, String, DateTime, Date, SmallInteger
+from sqlalchemy import BigInteger, Column, String, DateTime, Date, SmallInteger, Index
 from sqlalchemy.sql import func
 from moodping.config.mysql_config import Base
 
 class MoodRecord(Base):
     __tablename__ = "mood_record"
-    __table_args__ = {"extend_existing": True}
+    __table_args__ = (
+        # 기록 목록 keyset 페이지네이션용 (user_id / anon_id 단일 인덱스를 대체)
+        Index("idx_mood_record_user_recorded_at", "user_id", "recorded_at", "id"),
+        Index("idx_mood_record_anon_recorded_at", "anon_id", "recorded_at", "id"),
+        {"extend_existing": True},
+    )
 
     id = Column(BigInteger, primary_key=True, autoincrement=True)
-    user_id = Column(String(100), nullable=True, index=True)
-    anon_id = Column(String(100), nullable=True, index=True)
+    user_id = Column(String(100), nullable=True)
+    anon_id = Column(String(100), nullable=True)
     record_date = Column(Date, nullable=False)
     recorded_at = Column(DateTime, nullable=False)
     mood_emoji = Column(String(20), nullable=False)
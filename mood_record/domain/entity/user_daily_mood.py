@@ -0,0 +1,23 @@
+"""
+UserDailyMood 도메인 엔터티.
+로그인 사용자의 하루치 감정 기록 요약 (기록 저장·익명 기록 연결과 같은 트랜잭션에서 갱신).
+
+주간·월간·연간 통계는 mood_record 대신 이 테이블의 하루 한 행씩만 읽습니다.
+익명 기록(user_id 없음)은 요약하지 않고, 로그인 후 연결될 때 해당 날짜를 다시 계산합니다.
+"""
+from sqlalchemy import Column, String, Date, DateTime, Integer, SmallInteger, JSON
+from sqlalchemy.sql import func
+from moodping.config.mysql_config import Base
+
+class UserDailyMood(Base):
+    __tablename__ = "user_daily_mood"
+    __table_args__ = {"extend_existing": True}
+
+    user_id       = Column(String(100), primary_key=True)
+    record_date   = Column(Date, primary_key=True)
+    record_count  = Column(Integer, nullable=False, default=0)
+    intensity_sum = Column(Integer, nullable=False, default=0)
+    intensity_min = Column(SmallInteger, nullable=False)
+    intensity_max = Column(SmallInteger, nullable=False)
+    emoji_counts  = Column(JSON, nullable=False)  # {"😊": 2, "😢": 1}
+    updated_at    = Column(DateTime, nullable=False, server_default=func.now(), onupdate=func.now())
@@ -0,0 +1,23 @@
+from abc import ABC, abstractmethod
+from datetime import datetime
+from sqlalchemy.ext.asyncio import AsyncSession
+from moodping.mood_record.domain.entity.mood_record import MoodRecord
+
+class MoodRecordAsyncRepository(ABC):
+    @abstractmethod
+    async def save(self, session: AsyncSession, record: MoodRecord) -> MoodRecord:
+        pass
+
+    @abstractmethod
+    async def find_by_id(self, session: AsyncSession, record_id: int) -> MoodRecord | None:
+        pass
+
+    @abstractmethod
+    async def find_page_by_user(
+        self,
+        session: AsyncSession,
+        user_id: str,
+        before: tuple[datetime, int] | None,
+        limit: int,
+    ) -> list[dict]:
+        pass
@@ -0,0 +1,74 @@
+from datetime import datetime
+from sqlalchemy import and_, or_, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from moodping.mood_record.domain.entity.mood_record import MoodRecord
+from moodping.mood_record.repository.mood_record_async_repository import MoodRecordAsyncRepository
+from moodping.mood_analysis.domain.entity.mood_analysis import MoodAnalysis
+from moodping.mood_analysis.domain.entity.mood_analysis_job import MoodAnalysisJob
+
+class MoodRecordAsyncRepositoryImpl(MoodRecordAsyncRepository):
+    __instance = None
+
+    def __new__(cls):
+        if cls.__instance is None:
+            cls.__instance = super().__new__(cls)
+        return cls.__instance
+
+    @classmethod
+    def get_instance(cls) -> "MoodRecordAsyncRepositoryImpl":
+        if cls.__instance is None:
+            cls.__instance = cls()
+        return cls.__instance
+
+    async def save(self, session: AsyncSession, record: MoodRecord) -> MoodRecord:
+        session.add(record)
+        await session.flush()
+        return record
+
+    async def find_by_id(self, session: AsyncSession, record_id: int) -> MoodRecord | None:
+        return await session.get(MoodRecord, record_id)
+
+    async def find_page_by_user(
+        self,
+        session: AsyncSession,
+        user_id: str,
+        before: tuple[datetime, int] | None,
+        limit: int,
+    ) -> list[dict]:
+        """
+        (recorded_at, id) 내림차순으로 before 다음 limit 개를 분석 결과와 함께 한 쿼리로 조회합니다.
+        (user_id, recorded_at, id) 인덱스를 before 위치부터 읽으므로 몇 번째 페이지든 비용이 같습니다.
+        ORM 엔터티 대신 필요한 컬럼만 읽고, 분석은 기록마다 최신 1건(record_id 인덱스 역순 1행)만 붙입니다.
+        """
+        latest_analysis = (
+            select(MoodAnalysis.analysis_text)
+            .where(MoodAnalysis.record_id == MoodRecord.id)
+            .order_by(MoodAnalysis.id.desc())
+            .limit(1)
+            .correlate(MoodRecord)
+            .scalar_subquery()
+        )
+        stmt = (
+            select(
+                MoodRecord.id.label("record_id"),
+                MoodRecord.record_date,
+                MoodRecord.recorded_at,
+                MoodRecord.mood_emoji,
+                MoodRecord.intensity,
+                MoodRecord.mood_text,
+                latest_analysis.label("analysis_text"),
+                MoodAnalysisJob.status.label("job_status"),
+            )
+            .outerjoin(MoodAnalysisJob, MoodAnalysisJob.record_id == MoodRecord.id)
+            .where(MoodRecord.user_id == user_id)
+            .order_by(MoodRecord.recorded_at.desc(), MoodRecord.id.desc())
+            .limit(limit)
+        )
+        if before is not None:
+            before_recorded_at, before_id = before
+            stmt = stmt.where(or_(
+                MoodRecord.recorded_at < before_recorded_at,
+                and_(MoodRecord.recorded_at == before_recorded_at, MoodRecord.id < before_id),
+            ))
+        result = await session.execute(stmt)
+        return [dict(row) for row in result.mappings()]
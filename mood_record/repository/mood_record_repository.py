@@ -12,6 +12,10 @@ class MoodRecordRepository(ABC):
     def find_by_id(self, session: Session, record_id: int) -> MoodRecord | None:
         pass
 
+    @abstractmethod
+    def find_all_by_ids(self, session: Session, record_ids: list[int]) -> list[MoodRecord]:
+        pass
+
     @abstractmethod
     def find_by_user(self, session: Session, user_id: str, limit: int | None = None) -> list[MoodRecord]:
         pass
@@ -20,6 +24,10 @@ class MoodRecordRepository(ABC):
     def find_7days_by_user(self, session: Session, user_id: str, end_date: date | None = None) -> list[MoodRecord]:
         pass
 
+    @abstractmethod
+    def find_anon_record_dates(self, session: Session, anon_id: str) -> list[date]:
+        pass
+
     @abstractmethod
     def link_anon_to_user(self, session: Session, user_id: str, anon_id: str) -> int:
         pass
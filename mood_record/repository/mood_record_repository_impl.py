@@ -25,6 +25,11 @@ class MoodRecordRepositoryImpl(MoodRecordRepository):
     def find_by_id(self, session: Session, record_id: int) -> MoodRecord | None:
         return session.get(MoodRecord, record_id)
 
+    def find_all_by_ids(self, session: Session, record_ids: list[int]) -> list[MoodRecord]:
+        if not record_ids:
+            return []
+        return session.query(MoodRecord).filter(MoodRecord.id.in_(record_ids)).order_by(MoodRecord.id.asc()).all()
+
     def find_by_user(self, session: Session, user_id: str, limit: int | None = None) -> list[MoodRecord]:
         q = session.query(MoodRecord).filter(MoodRecord.user_id == user_id).order_by(MoodRecord.recorded_at.desc())
         if limit is not None:
@@ -40,6 +45,14 @@ class MoodRecordRepositoryImpl(MoodRecordRepository):
             MoodRecord.record_date <= end,
         ).order_by(MoodRecord.record_date.asc(), MoodRecord.recorded_at.asc()).all()
 
+    def find_anon_record_dates(self, session: Session, anon_id: str) -> list[date]:
+        """아직 사용자에 연결되지 않은 익명 기록의 날짜 목록."""
+        rows = session.query(MoodRecord.record_date).filter(
+            MoodRecord.anon_id == anon_id,
+            MoodRecord.user_id.is_(None),
+        ).distinct().all()
+        return [row.record_date for row in rows]
+
     def link_anon_to_user(self, session: Session, user_id: str, anon_id: str) -> int:
         updated = session.query(MoodRecord).filter(
             MoodRecord.anon_id == anon_id,
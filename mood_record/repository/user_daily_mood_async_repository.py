@@ -0,0 +1,8 @@
+from abc import ABC, abstractmethod
+from sqlalchemy.ext.asyncio import AsyncSession
+from moodping.mood_record.domain.entity.mood_record import MoodRecord
+
+class UserDailyMoodAsyncRepository(ABC):
+    @abstractmethod
+    async def add_record(self, session: AsyncSession, record: MoodRecord) -> None:
+        pass
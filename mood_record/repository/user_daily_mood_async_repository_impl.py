@@ -0,0 +1,24 @@
+from sqlalchemy.ext.asyncio import AsyncSession
+from moodping.mood_record.domain.entity.mood_record import MoodRecord
+from moodping.mood_record.repository.user_daily_mood_async_repository import UserDailyMoodAsyncRepository
+from moodping.mood_record.repository.user_daily_mood_repository_impl import ADD_RECORD_SQL, add_record_params
+
+class UserDailyMoodAsyncRepositoryImpl(UserDailyMoodAsyncRepository):
+    __instance = None
+
+    def __new__(cls):
+        if cls.__instance is None:
+            cls.__instance = super().__new__(cls)
+        return cls.__instance
+
+    @classmethod
+    def get_instance(cls) -> "UserDailyMoodAsyncRepositoryImpl":
+        if cls.__instance is None:
+            cls.__instance = cls()
+        return cls.__instance
+
+    async def add_record(self, session: AsyncSession, record: MoodRecord) -> None:
+        """기록 저장과 같은 트랜잭션에서 호출합니다. 익명 기록은 건너뜁니다."""
+        if record.user_id is None:
+            return
+        await session.execute(ADD_RECORD_SQL, add_record_params(record))
@@ -0,0 +1,22 @@
+from abc import ABC, abstractmethod
+from datetime import date
+from sqlalchemy.orm import Session
+from moodping.mood_record.domain.entity.mood_record import MoodRecord
+from moodping.mood_record.domain.entity.user_daily_mood import UserDailyMood
+
+class UserDailyMoodRepository(ABC):
+    @abstractmethod
+    def add_record(self, session: Session, record: MoodRecord) -> None:
+        pass
+
+    @abstractmethod
+    def rebuild_days(self, session: Session, user_id: str, record_dates: list[date]) -> None:
+        pass
+
+    @abstractmethod
+    def rebuild_users(self, session: Session, after_user_id: str, limit: int) -> str | None:
+        pass
+
+    @abstractmethod
+    def find_range(self, session: Session, user_id: str, start: date, end: date) -> list[UserDailyMood]:
+        pass
@@ -0,0 +1,119 @@
+from datetime import date
+from sqlalchemy import bindparam, text
+from sqlalchemy.orm import Session
+from moodping.mood_record.domain.entity.mood_record import MoodRecord
+from moodping.mood_record.domain.entity.user_daily_mood import UserDailyMood
+from moodping.mood_record.repository.user_daily_mood_repository import UserDailyMoodRepository
+
+# 기록 한 건을 그날 요약에 더합니다 (동기·async 저장소 공용). 이모지 키는 JSON_QUOTE 로 감싸 경로를 만듭니다.
+ADD_RECORD_SQL = text("""
+    INSERT INTO user_daily_mood
+        (user_id, record_date, record_count, intensity_sum, intensity_min, intensity_max, emoji_counts)
+    VALUES (:user_id, :record_date, 1, :intensity, :intensity, :intensity, JSON_OBJECT(:emoji, 1))
+    ON DUPLICATE KEY UPDATE
+        record_count = record_count + 1,
+        intensity_sum = intensity_sum + VALUES(intensity_sum),
+        intensity_min = LEAST(intensity_min, VALUES(intensity_min)),
+        intensity_max = GREATEST(intensity_max, VALUES(intensity_max)),
+        emoji_counts = JSON_SET(
+            emoji_counts,
+            CONCAT('$.', JSON_QUOTE(:emoji)),
+            COALESCE(JSON_EXTRACT(emoji_counts, CONCAT('$.', JSON_QUOTE(:emoji))), 0) + 1
+        )
+""")
+
+# mood_record 에서 조건에 맞는 (user_id, record_date) 요약을 다시 만듭니다. 호출 전에 같은 범위를 지워야 합니다.
+_REBUILD_SQL = """
+    INSERT INTO user_daily_mood
+        (user_id, record_date, record_count, intensity_sum, intensity_min, intensity_max, emoji_counts)
+    SELECT
+        user_id, record_date, SUM(emoji_count), SUM(intensity_sum), MIN(intensity_min), MAX(intensity_max),
+        JSON_OBJECTAGG(mood_emoji, emoji_count)
+    FROM (
+        SELECT
+            user_id, record_date, mood_emoji, COUNT(*) AS emoji_count,
+            SUM(intensity) AS intensity_sum, MIN(intensity) AS intensity_min, MAX(intensity) AS intensity_max
+        FROM mood_record
+        WHERE {where}
+        GROUP BY user_id, record_date, mood_emoji
+    ) per_emoji
+    GROUP BY user_id, record_date
+"""
+
+
+def add_record_params(record: MoodRecord) -> dict:
+    return {
+        "user_id": record.user_id,
+        "record_date": record.record_date,
+        "intensity": record.intensity,
+        "emoji": record.mood_emoji,
+    }
+
+
+class UserDailyMoodRepositoryImpl(UserDailyMoodRepository):
+    __instance = None
+
+    def __new__(cls):
+        if cls.__instance is None:
+            cls.__instance = super().__new__(cls)
+        return cls.__instance
+
+    @classmethod
+    def get_instance(cls) -> "UserDailyMoodRepositoryImpl":
+        if cls.__instance is None:
+            cls.__instance = cls()
+        return cls.__instance
+
+    def add_record(self, session: Session, record: MoodRecord) -> None:
+        """기록 저장과 같은 트랜잭션에서 호출합니다. 익명 기록은 건너뜁니다."""
+        if record.user_id is None:
+            return
+        session.execute(ADD_RECORD_SQL, add_record_params(record))
+
+    def rebuild_days(self, session: Session, user_id: str, record_dates: list[date]) -> None:
+        """user_id 의 record_dates 요약을 mood_record 에서 다시 계산합니다 (익명 기록 연결 직후 등)."""
+        if not record_dates:
+            return
+        params = {"user_id": user_id, "record_dates": sorted(set(record_dates))}
+        where = "user_id = :user_id AND record_date IN :record_dates"
+        session.execute(
+            text(f"DELETE FROM user_daily_mood WHERE {where}").bindparams(bindparam("record_dates", expanding=True)),
+            params,
+        )
+        session.execute(
+            text(_REBUILD_SQL.format(where=where)).bindparams(bindparam("record_dates", expanding=True)),
+            params,
+        )
+
+    def rebuild_users(self, session: Session, after_user_id: str, limit: int) -> str | None:
+        """
+        user_id 가 after_user_id 보다 큰 사용자 limit 명의 요약 전체를 다시 만듭니다.
+        처리한 마지막 user_id 를 반환합니다 (없으면 None).
+        """
+        user_ids = session.execute(
+            text("""
+                SELECT DISTINCT user_id FROM mood_record
+                WHERE user_id > :after ORDER BY user_id LIMIT :limit
+            """),
+            {"after": after_user_id, "limit": limit},
+        ).scalars().all()
+        if not user_ids:
+            return None
+        params = {"user_ids": list(user_ids)}
+        where = "user_id IN :user_ids"
+        session.execute(
+            text(f"DELETE FROM user_daily_mood WHERE {where}").bindparams(bindparam("user_ids", expanding=True)),
+            params,
+        )
+        session.execute(
+            text(_REBUILD_SQL.format(where=where)).bindparams(bindparam("user_ids", expanding=True)),
+            params,
+        )
+        return user_ids[-1]
+
+    def find_range(self, session: Session, user_id: str, start: date, end: date) -> list[UserDailyMood]:
+        return session.query(UserDailyMood).filter(
+            UserDailyMood.user_id == user_id,
+            UserDailyMood.record_date >= start,
+            UserDailyMood.record_date <= end,
+        ).order_by(UserDailyMood.record_date.asc()).all()
@@ -0,0 +1,18 @@
+from abc import ABC, abstractmethod
+from moodping.config.unit_of_work import AsyncUnitOfWork
+from moodping.mood_record.domain.entity.mood_record import MoodRecord
+
+class MoodRecordAsyncService(ABC):
+    """async 라우트용 MoodRecordService. 요청의 AsyncUnitOfWork 에 변경을 쌓고 commit 은 호출자가 합니다."""
+
+    @abstractmethod
+    async def create(self, mood_emoji: str, intensity: int, mood_text: str | None, uow: AsyncUnitOfWork, user_id: str | None = None, anon_id: str | None = None) -> MoodRecord:
+        pass
+
+    @abstractmethod
+    async def find_by_id(self, record_id: int, uow: AsyncUnitOfWork) -> MoodRecord | None:
+        pass
+
+    @abstractmethod
+    async def find_page(self, uow: AsyncUnitOfWork, user_id: str, cursor: str | None, limit: int) -> dict:
+        pass
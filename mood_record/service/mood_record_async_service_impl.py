@@ -0,0 +1,92 @@
+import base64
+import binascii
+from datetime import datetime
+from moodping.config.read_replica import mark_write, replica_read
+from moodping.config.unit_of_work import AsyncUnitOfWork
+from moodping.mood_record.domain.entity.mood_record import MoodRecord
+from moodping.mood_record.repository.mood_record_async_repository_impl import MoodRecordAsyncRepositoryImpl
+from moodping.mood_record.repository.user_daily_mood_async_repository_impl import UserDailyMoodAsyncRepositoryImpl
+from moodping.mood_record.service.mood_record_async_service import MoodRecordAsyncService
+
+def encode_cursor(recorded_at: datetime, record_id: int) -> str:
+    """마지막 행의 (recorded_at, id) 를 불투명한 커서 문자열로 만듭니다."""
+    raw = f"{recorded_at.isoformat()}|{record_id}".encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> tuple[datetime, int]:
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4)).decode()
+        recorded_at, record_id = raw.rsplit("|", 1)
+        return datetime.fromisoformat(recorded_at), int(record_id)
+    except (binascii.Error, UnicodeDecodeError, ValueError) as e:
+        raise ValueError("invalid cursor") from e
+
+
+class MoodRecordAsyncServiceImpl(MoodRecordAsyncService):
+    __instance = None
+
+    def __new__(cls):
+        if cls.__instance is None:
+            cls.__instance = super().__new__(cls)
+        return cls.__instance
+
+    @classmethod
+    def get_instance(cls) -> "MoodRecordAsyncServiceImpl":
+        if cls.__instance is None:
+            cls.__instance = cls()
+        return cls.__instance
+
+    def __init__(self):
+        self._repository = MoodRecordAsyncRepositoryImpl.get_instance()
+        self._daily_repository = UserDailyMoodAsyncRepositoryImpl.get_instance()
+
+    async def create(self, mood_emoji: str, intensity: int, mood_text: str | None, uow: AsyncUnitOfWork, user_id: str | None = None, anon_id: str | None = None) -> MoodRecord:
+        record = MoodRecord.create(
+            mood_emoji=mood_emoji,
+            intensity=intensity,
+            mood_text=mood_text,
+            user_id=user_id,
+            anon_id=anon_id,
+        )
+        # flush 로 id 만 받아 둡니다. 응답에 쓰는 값은 모두 애플리케이션에서 채우므로 refresh 하지 않습니다.
+        await self._repository.save(uow.session, record)
+        # 같은 트랜잭션에서 그날 요약도 갱신합니다 (commit 은 호출자).
+        await self._daily_repository.add_record(uow.session, record)
+        mark_write()
+        return record
+
+    async def find_by_id(self, record_id: int, uow: AsyncUnitOfWork) -> MoodRecord | None:
+        return await self._repository.find_by_id(uow.session, record_id)
+
+    @replica_read
+    async def find_page(self, uow: AsyncUnitOfWork, user_id: str, cursor: str | None, limit: int) -> dict:
+        """
+        로그인 사용자의 기록을 최신순으로 limit 개씩 반환합니다. next_cursor 를 다음 요청의 cursor 로 넘기면 이어서 조회합니다.
+        """
+        if not user_id:
+            raise ValueError("user_id is required")
+        before = decode_cursor(cursor) if cursor else None
+        # 한 행 더 읽어 다음 페이지가 있는지 판단합니다.
+        rows = await self._repository.find_page_by_user(uow.session, user_id, before, limit + 1)
+        has_more = len(rows) > limit
+        rows = rows[:limit]
+        records = [
+            {
+                "record_id": row["record_id"],
+                "record_date": row["record_date"].isoformat(),
+                "recorded_at": row["recorded_at"].isoformat(),
+                "mood_emoji": row["mood_emoji"],
+                "intensity": row["intensity"],
+                "mood_text": row["mood_text"],
+                "analysis_text": row["analysis_text"],
+                "analysis_status": "success" if row["analysis_text"] else row["job_status"],
+            }
+            for row in rows
+        ]
+        last = rows[-1] if rows else None
+        return {
+            "records": records,
+            "has_more": has_more,
+            "next_cursor": encode_cursor(last["recorded_at"], last["record_id"]) if has_more else None,
+        }
@@ -22,3 +22,7 @@ class MoodRecordService(ABC):
     @abstractmethod
     def link_anon_to_user(self, user_id: str, anon_id: str) -> int:
         pass
+
+    @abstractmethod
+    def get_stats(self, user_id: str, period: str, on_date: date | None = None) -> dict:
+        pass
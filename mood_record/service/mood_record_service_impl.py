@@ -1,8 +1,46 @@
-from datetime import date
+from collections import Counter
+from datetime import date, timedelta
 from moodping.mood_record.domain.entity.mood_record import MoodRecord
+from moodping.mood_record.domain.entity.user_daily_mood import UserDailyMood
 from moodping.mood_record.repository.mood_record_repository_impl import MoodRecordRepositoryImpl
+from moodping.mood_record.repository.user_daily_mood_repository_impl import UserDailyMoodRepositoryImpl
 from moodping.mood_record.service.mood_record_service import MoodRecordService
-from moodping.config.mysql_config import SessionLocal
+from moodping.config.read_replica import mark_write, replica_read
+from moodping.config.unit_of_work import UnitOfWork
+
+STATS_PERIOD_WEEK = "week"
+STATS_PERIOD_MONTH = "month"
+STATS_PERIOD_YEAR = "year"
+STATS_PERIODS = (STATS_PERIOD_WEEK, STATS_PERIOD_MONTH, STATS_PERIOD_YEAR)
+
+
+def _period_range(period: str, on_date: date) -> tuple[date, date]:
+    """on_date 가 속한 주(월요일 시작)·월·연도의 [시작일, 종료일]."""
+    if period == STATS_PERIOD_WEEK:
+        start = on_date - timedelta(days=on_date.weekday())
+        return start, start + timedelta(days=6)
+    if period == STATS_PERIOD_MONTH:
+        start = on_date.replace(day=1)
+        next_month = (start + timedelta(days=32)).replace(day=1)
+        return start, next_month - timedelta(days=1)
+    if period == STATS_PERIOD_YEAR:
+        return on_date.replace(month=1, day=1), on_date.replace(month=12, day=31)
+    raise ValueError(f"period must be one of {', '.join(STATS_PERIODS)}")
+
+
+def _summarize(days: list[UserDailyMood]) -> dict:
+    record_count = sum(day.record_count for day in days)
+    emoji_counts: Counter[str] = Counter()
+    for day in days:
+        emoji_counts.update(day.emoji_counts or {})
+    return {
+        "record_count": record_count,
+        "avg_intensity": round(sum(day.intensity_sum for day in days) / record_count, 1) if record_count else None,
+        "min_intensity": min((day.intensity_min for day in days), default=None),
+        "max_intensity": max((day.intensity_max for day in days), default=None),
+        "emoji_counts": dict(emoji_counts.most_common()),
+    }
+
 
 class MoodRecordServiceImpl(MoodRecordService):
     __instance = None
@@ -20,6 +58,7 @@ class MoodRecordServiceImpl(MoodRecordService):
 
     def __init__(self):
         self._repository = MoodRecordRepositoryImpl.get_instance()
+        self._daily_repository = UserDailyMoodRepositoryImpl.get_instance()
 
     def create(self, mood_emoji: str, intensity: int, mood_text: str | None, user_id: str | None = None, anon_id: str | None = None) -> MoodRecord:
         record = MoodRecord.create(
@@ -29,47 +68,57 @@ class MoodRecordServiceImpl(MoodRecordService):
             user_id=user_id,
             anon_id=anon_id,
         )
-        session = SessionLocal()
-        try:
-            self._repository.save(session, record)
-            session.commit()
-            session.refresh(record)
+        with UnitOfWork() as uow:
+            self._repository.save(uow.session, record)
+            self._daily_repository.add_record(uow.session, record)
+            uow.commit()
+            mark_write()
             return record
-        except Exception:
-            session.rollback()
-            raise
-        finally:
-            session.close()
 
     def find_by_id(self, record_id: int) -> MoodRecord | None:
-        session = SessionLocal()
-        try:
-            return self._repository.find_by_id(session, record_id)
-        finally:
-            session.close()
+        with UnitOfWork() as uow:
+            return self._repository.find_by_id(uow.session, record_id)
 
+    @replica_read
     def find_by_user(self, user_id: str, limit: int | None = None) -> list[MoodRecord]:
-        session = SessionLocal()
-        try:
-            return self._repository.find_by_user(session, user_id, limit=limit)
-        finally:
-            session.close()
+        with UnitOfWork() as uow:
+            return self._repository.find_by_user(uow.session, user_id, limit=limit)
 
+    @replica_read
     def find_7days_by_user(self, user_id: str, end_date: date | None = None) -> list[MoodRecord]:
-        session = SessionLocal()
-        try:
-            return self._repository.find_7days_by_user(session, user_id, end_date=end_date)
-        finally:
-            session.close()
+        with UnitOfWork() as uow:
+            return self._repository.find_7days_by_user(uow.session, user_id, end_date=end_date)
 
     def link_anon_to_user(self, user_id: str, anon_id: str) -> int:
-        session = SessionLocal()
-        try:
-            updated = self._repository.link_anon_to_user(session, user_id, anon_id)
-            session.commit()
+        with UnitOfWork() as uow:
+            record_dates = self._repository.find_anon_record_dates(uow.session, anon_id)
+            updated = self._repository.link_anon_to_user(uow.session, user_id, anon_id)
+            if updated:
+                self._daily_repository.rebuild_days(uow.session, user_id, record_dates)
+            uow.commit()
+            mark_write()
             return updated
-        except Exception:
-            session.rollback()
-            raise
-        finally:
-            session.close()
+
+    @replica_read
+    def get_stats(self, user_id: str, period: str, on_date: date | None = None) -> dict:
+        """
+        on_date(기본 오늘)가 속한 주·월·연도의 감정 통계. user_daily_mood 의 하루 한 행만 읽습니다.
+        주·월은 날짜별, 연도는 월별 구간을 함께 반환합니다.
+        """
+        start, end = _period_range(period, on_date or date.today())
+        with UnitOfWork() as uow:
+            days = self._daily_repository.find_range(uow.session, user_id, start, end)
+        if period == STATS_PERIOD_YEAR:
+            months: dict[str, list[UserDailyMood]] = {}
+            for day in days:
+                months.setdefault(day.record_date.strftime("%Y-%m"), []).append(day)
+            buckets = [{"month": month, **_summarize(month_days)} for month, month_days in months.items()]
+        else:
+            buckets = [{"date": day.record_date.isoformat(), **_summarize([day])} for day in days]
+        return {
+            "period": period,
+            "start": start.isoformat(),
+            "end": end.isoformat(),
+            **_summarize(days),
+            "buckets": buckets,
+        }
@@ -33,14 +33,30 @@ CREATE TABLE IF NOT EXISTS mood_record
     created_at  DATETIME     NOT NULL DEFAULT CURRENT_TIMESTAMP,
     updated_at  DATETIME     NOT NULL DEFAULT CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP,
     PRIMARY KEY (id),
-    INDEX idx_mood_record_user_id (user_id),
-    INDEX idx_mood_record_anon_id (anon_id),
+    INDEX idx_mood_record_user_recorded_at (user_id, recorded_at, id),
+    INDEX idx_mood_record_anon_recorded_at (anon_id, recorded_at, id),
     INDEX idx_mood_record_recorded_at (recorded_at),
     CONSTRAINT chk_intensity CHECK (intensity >= 0 AND intensity <= 10)
 ) ENGINE = InnoDB
   DEFAULT CHARSET = utf8mb4
   COLLATE = utf8mb4_unicode_ci;
 
+-- 1-1. 사용자별 하루 감정 요약 (기록 저장·익명 기록 연결과 같은 트랜잭션에서 갱신, 주간·월간·연간 통계용)
+CREATE TABLE IF NOT EXISTS user_daily_mood
+(
+    user_id       VARCHAR(100) NOT NULL COMMENT '로그인 사용자 ID',
+    record_date   DATE         NOT NULL COMMENT '기록 날짜 (서버 기준)',
+    record_count  INT          NOT NULL DEFAULT 0,
+    intensity_sum INT          NOT NULL DEFAULT 0,
+    intensity_min SMALLINT     NOT NULL,
+    intensity_max SMALLINT     NOT NULL,
+    emoji_counts  JSON         NOT NULL COMMENT '이모지별 기록 수 JSON',
+    updated_at    DATETIME     NOT NULL DEFAULT CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP,
+    PRIMARY KEY (user_id, record_date)
+) ENGINE = InnoDB
+  DEFAULT CHARSET = utf8mb4
+  COLLATE = utf8mb4_unicode_ci;
+
 -- 2. AI 감정 분석 결과 테이블
 CREATE TABLE IF NOT EXISTS mood_analysis
 (
@@ -49,6 +65,7 @@ CREATE TABLE IF NOT EXISTS mood_analysis
     user_id       VARCHAR(100) NULL     COMMENT '분석 요청 사용자 ID',
     analysis_text TEXT         NULL     COMMENT 'LLM이 생성한 분석 문단',
     created_at    DATETIME     NOT NULL DEFAULT CURRENT_TIMESTAMP,
+    updated_at    DATETIME     NULL     COMMENT '일괄 재분석으로 본문을 교체한 시각',
     PRIMARY KEY (id),
     INDEX idx_mood_analysis_record_id (record_id),
     CONSTRAINT fk_mood_analysis_record FOREIGN KEY (record_id) REFERENCES mood_record (id) ON DELETE CASCADE
@@ -56,7 +73,28 @@ CREATE TABLE IF NOT EXISTS mood_analysis
   DEFAULT CHARSET = utf8mb4
   COLLATE = utf8mb4_unicode_ci;
 
--- 3. 유저 퍼널 이벤트 로그 테이블
+-- 2-1. AI 감정 분석 작업 큐 테이블 (백그라운드 워커가 SKIP LOCKED 로 가져감)
+CREATE TABLE IF NOT EXISTS mood_analysis_job
+(
+    id          BIGINT       NOT NULL AUTO_INCREMENT,
+    record_id   BIGINT       NOT NULL COMMENT 'mood_record.id FK',
+    status      VARCHAR(20)  NOT NULL DEFAULT 'pending' COMMENT 'pending | running | success | failed',
+    attempts    SMALLINT     NOT NULL DEFAULT 0 COMMENT '시도 횟수',
+    next_run_at DATETIME     NOT NULL COMMENT '다음 실행 가능 일시 (재시도 백오프)',
+    locked_at   DATETIME     NULL     COMMENT '워커가 작업을 가져간 일시',
+    last_error  VARCHAR(500) NULL     COMMENT '마지막 실패 사유',
+    created_at  DATETIME     NOT NULL DEFAULT CURRENT_TIMESTAMP,
+    updated_at  DATETIME     NOT NULL DEFAULT CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP,
+    PRIMARY KEY (id),
+    UNIQUE KEY uk_mood_analysis_job_record_id (record_id),
+    INDEX idx_mood_analysis_job_status_next_run_at (status, next_run_at),
+    CONSTRAINT fk_mood_analysis_job_record FOREIGN KEY (record_id) REFERENCES mood_record (id) ON DELETE CASCADE
+) ENGINE = InnoDB
+  DEFAULT CHARSET = utf8mb4
+  COLLATE = utf8mb4_unicode_ci;
+
+-- 3. 유저 퍼널 이벤트 로그 테이블 (occurred_at 월 단위 RANGE 파티션, 유지보수 작업이 다음 달 파티션 생성·만료 파티션 보관 후 삭제)
+--    파티션 테이블은 모든 유니크 키에 파티션 컬럼이 있어야 하므로 PK 는 (id, occurred_at), event_id 중복 제거는 event_log_dedup 이 담당
 CREATE TABLE IF NOT EXISTS event_log
 (
     id          BIGINT       NOT NULL AUTO_INCREMENT,
@@ -67,13 +105,64 @@ CREATE TABLE IF NOT EXISTS event_log
     event_name  VARCHAR(50)  NOT NULL COMMENT '이벤트 이름',
     occurred_at DATETIME     NOT NULL COMMENT '이벤트 발생 일시',
     extra_data  JSON         NULL     COMMENT '이벤트 추가 데이터',
-    PRIMARY KEY (id),
-    UNIQUE KEY uk_event_id (event_id),
-    INDEX idx_event_log_session_id (session_id),
-    INDEX idx_event_log_event_name (event_name),
+    PRIMARY KEY (id, occurred_at),
+    INDEX idx_event_log_name_session_time (event_name, session_id, occurred_at),
+    INDEX idx_event_log_session_time_name (session_id, occurred_at, event_name),
     INDEX idx_event_log_occurred_at (occurred_at),
     INDEX idx_event_log_user_id (user_id),
     INDEX idx_event_log_anon_id (anon_id)
+) ENGINE = InnoDB
+  DEFAULT CHARSET = utf8mb4
+  COLLATE = utf8mb4_unicode_ci
+  PARTITION BY RANGE COLUMNS (occurred_at) (
+    PARTITION pmax VALUES LESS THAN (MAXVALUE)
+  );
+
+-- 3-0. 최근 event_id (재전송·스풀 재적재 중복 제거, EVENT_DEDUP_RETENTION_DAYS 지나면 정리)
+CREATE TABLE IF NOT EXISTS event_log_dedup
+(
+    event_id    VARCHAR(100) NOT NULL COMMENT '프론트에서 생성한 이벤트 고유 UUID',
+    write_token VARCHAR(32)  NOT NULL COMMENT '이 행을 처음 넣은 쓰기 묶음 토큰',
+    created_at  DATETIME     NOT NULL DEFAULT CURRENT_TIMESTAMP,
+    PRIMARY KEY (event_id),
+    INDEX idx_event_log_dedup_created_at (created_at)
+) ENGINE = InnoDB
+  DEFAULT CHARSET = utf8mb4
+  COLLATE = utf8mb4_unicode_ci;
+
+-- 3-1. 세션별 이벤트 요약 (적재 시점 갱신, 퍼널 지표 집계용)
+CREATE TABLE IF NOT EXISTS session_summary
+(
+    session_id            VARCHAR(100) NOT NULL COMMENT '세션 고유 UUID',
+    first_event_at        DATETIME     NOT NULL COMMENT '세션 첫 이벤트 일시',
+    last_event_at         DATETIME     NOT NULL COMMENT '세션 마지막 이벤트 일시',
+    steps_mask            INT          NOT NULL DEFAULT 0 COMMENT '도달한 FUNNEL_STEPS 비트마스크',
+    record_screen_view_at DATETIME     NULL     COMMENT '첫 record_screen_view 일시',
+    record_complete_at    DATETIME     NULL     COMMENT '첫 record_complete 일시',
+    analysis_view_at      DATETIME     NULL     COMMENT '첫 analysis_view 일시',
+    record_pairs          INT          NOT NULL DEFAULT 0 COMMENT '임계값 안의 (record_screen_view, record_complete) 짝 수',
+    record_pair_seconds   BIGINT       NOT NULL DEFAULT 0 COMMENT '그 짝들의 소요 초 합',
+    analysis_pairs        INT          NOT NULL DEFAULT 0 COMMENT '임계값 안의 (record_complete, analysis_view) 짝 수',
+    analysis_pair_seconds BIGINT       NOT NULL DEFAULT 0 COMMENT '그 짝들의 소요 초 합',
+    updated_at            DATETIME     NOT NULL DEFAULT CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP,
+    PRIMARY KEY (session_id),
+    INDEX idx_session_summary_last_event_at (last_event_at)
+) ENGINE = InnoDB
+  DEFAULT CHARSET = utf8mb4
+  COLLATE = utf8mb4_unicode_ci;
+
+-- 3-2. 식별자별 최초 활동일 + 날짜별 활동 비트맵 (적재 시점 갱신, 리텐션 지표용)
+CREATE TABLE IF NOT EXISTS identifier_activity
+(
+    identifier      VARCHAR(100) NOT NULL COMMENT 'COALESCE(user_id, anon_id)',
+    first_seen_date DATE         NOT NULL COMMENT '최초 analysis_view 날짜 (UTC)',
+    last_seen_date  DATE         NOT NULL COMMENT '마지막 analysis_view 날짜 (UTC)',
+    activity_bitmap BIGINT       NOT NULL DEFAULT 0 COMMENT 'd번째 비트 = first_seen_date + d 일 활동 (0~62일)',
+    first_seen_at          DATETIME NULL COMMENT '최초 analysis_view 시각',
+    first_day_last_seen_at DATETIME NULL COMMENT '최초 활동일의 마지막 analysis_view 시각 (당일 재방문 판단)',
+    updated_at      DATETIME     NOT NULL DEFAULT CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP,
+    PRIMARY KEY (identifier),
+    INDEX idx_identifier_activity_first_seen_date (first_seen_date)
 ) ENGINE = InnoDB
   DEFAULT CHARSET = utf8mb4
   COLLATE = utf8mb4_unicode_ci;
@@ -83,28 +83,87 @@ function handleTokenFromUrl() {
     }
 }
 
-async function logEvent(eventName, extraData = {}) {
-    const anonId = getAnonId();
-    const sessionId = getSessionId();
+// 이벤트는 모아서 POST /api/events/batch 로 보냅니다.
+// 개수(EVENT_BATCH_SIZE)가 차거나, EVENT_FLUSH_INTERVAL_MS 가 지나거나, 페이지가 숨겨질 때 전송합니다.
+const EVENT_BATCH_SIZE = 20;
+const EVENT_FLUSH_INTERVAL_MS = 5000;
+const EVENT_BUFFER_LIMIT = 200;
+const eventBuffer = [];
+let eventFlushTimer = null;
+
+function logEvent(eventName, extraData = {}) {
+    eventBuffer.push({
+        event_id: generateUUID(),
+        session_id: getSessionId(),
+        user_id: null,
+        anon_id: getAnonId(),
+        event_name: eventName,
+        extra_data: extraData,
+        client_ts: Date.now()
+    });
+
+    if (eventBuffer.length >= EVENT_BATCH_SIZE) {
+        flushEvents();
+    } else if (!eventFlushTimer) {
+        eventFlushTimer = setTimeout(flushEvents, EVENT_FLUSH_INTERVAL_MS);
+    }
+    // 호출부가 .then() 으로 이어서 이동할 수 있도록 Promise 를 돌려줍니다 (이동 시 pagehide 에서 전송).
+    return Promise.resolve();
+}
+
+function takeEventBatch() {
+    if (eventFlushTimer) {
+        clearTimeout(eventFlushTimer);
+        eventFlushTimer = null;
+    }
+    const events = eventBuffer.splice(0, eventBuffer.length);
+    return events.length ? events : null;
+}
+
+// 보내지 못한 이벤트를 버퍼 앞에 되돌립니다. 버퍼가 EVENT_BUFFER_LIMIT 를 넘지 않도록 최근 이벤트만 남깁니다.
+function requeueEvents(events) {
+    const room = Math.max(0, EVENT_BUFFER_LIMIT - eventBuffer.length);
+    eventBuffer.unshift(...(room ? events.slice(-room) : []));
+}
+
+async function flushEvents() {
+    const events = takeEventBatch();
+    if (!events) return;
 
     try {
-        await fetch('/api/events', {
+        const res = await fetch('/api/events/batch', {
             method: 'POST',
-            headers: getAuthHeaders(),
-            body: JSON.stringify({
-                event_id: generateUUID(),
-                session_id: sessionId,
-                user_id: null,
-                anon_id: anonId,
-                event_name: eventName,
-                extra_data: extraData
-            })
+            headers: {'Content-Type': 'application/json'},
+            body: JSON.stringify({sent_at: Date.now(), events: events}),
+            keepalive: true
         });
+        if (!res.ok && res.status >= 500) throw new Error(`HTTP ${res.status}`);
     } catch (error) {
         console.error('이벤트 로깅 실패:', error);
+        // 서버가 event_id 로 중복을 걸러내므로 다음 전송에 다시 실어 보냅니다.
+        requeueEvents(events);
+        if (!eventFlushTimer) eventFlushTimer = setTimeout(flushEvents, EVENT_FLUSH_INTERVAL_MS);
+    }
+}
+
+// 페이지 이동·탭 전환 시에는 응답을 기다릴 수 없으므로 sendBeacon 으로 보냅니다.
+function beaconEvents() {
+    const events = takeEventBatch();
+    if (!events) return;
+
+    // application/json Blob 은 일부 브라우저의 sendBeacon 에서 거부되므로 text/plain 으로 보냅니다.
+    const body = new Blob([JSON.stringify({sent_at: Date.now(), events: events})], {type: 'text/plain'});
+    if (!navigator.sendBeacon || !navigator.sendBeacon('/api/events/batch', body)) {
+        requeueEvents(events);
+        flushEvents();
     }
 }
 
+document.addEventListener('visibilitychange', () => {
+    if (document.visibilityState === 'hidden') beaconEvents();
+});
+window.addEventListener('pagehide', beaconEvents);
+
 function renderNavAuth(navActionsEl) {
     if (!navActionsEl) return;
 
@@ -79,7 +79,7 @@ document.addEventListener('DOMContentLoaded', () => {
         submitBtn.disabled = true;
 
         try {
-            const res = await fetch('/mood-records', {
+            const res = await fetch('/mood-records/stream', {
                 method: 'POST',
                 headers: getAuthHeaders(),
                 body: JSON.stringify({
@@ -90,16 +90,36 @@ document.addEventListener('DOMContentLoaded', () => {
                 })
             });
 
-            if (!res.ok) throw new Error(`HTTP ${res.status}`);
-
-            const result = await res.json();
+            if (!res.ok || !res.body) throw new Error(`HTTP ${res.status}`);
+
+            const feedbackEl = document.getElementById('feedback-text');
+            let recordId = null;
+            let streamedText = '';
+            let result = null;
+
+            await readEventStream(res, (event, data) => {
+                if (event === 'record') {
+                    recordId = data.record_id;
+                    logEvent('record_complete', {record_id: recordId});
+                } else if (event === 'delta') {
+                    if (!streamedText) {
+                        document.getElementById('loading-spinner').style.display = 'none';
+                        document.getElementById('result-content').style.display = 'block';
+                    }
+                    // delta 는 서버가 analysis_text 에서 이미 추출·디코딩한 본문 조각입니다.
+                    streamedText += data.text;
+                    feedbackEl.innerHTML = escapeHtml(streamedText).replace(/\n/g, '<br>');
+                } else if (event === 'done') {
+                    result = data;
+                }
+            });
 
-            logEvent('record_complete', {record_id: result.record_id});
+            if (!result) throw new Error('분석 스트림이 비정상 종료되었습니다.');
 
             document.getElementById('loading-spinner').style.display = 'none';
             document.getElementById('result-content').style.display = 'block';
 
-            logEvent('analysis_view', {record_id: result.record_id, status: result.analysis_status});
+            logEvent('analysis_view', {record_id: recordId, status: result.analysis_status});
 
             if (result.analysis_status === 'success' && result.analysis) {
                 let text = result.analysis.analysis_text || '';
@@ -112,9 +132,9 @@ document.addEventListener('DOMContentLoaded', () => {
                 }
 
                 const formatted = text.replace(/\n/g, '<br>');
-                document.getElementById('feedback-text').innerHTML = formatted;
+                feedbackEl.innerHTML = formatted;
             } else {
-                document.getElementById('feedback-text').textContent =
+                feedbackEl.textContent =
                     '기록은 정상적으로 저장되었으나 AI 분석을 불러오지 못했습니다.';
             }
 
@@ -139,4 +159,38 @@ document.addEventListener('DOMContentLoaded', () => {
             setTimeout(() => element.scrollIntoView({behavior: 'smooth', block: 'center'}), 100);
         }
     }
-});
\ No newline at end of file
+});
+// SSE(text/event-stream) 응답을 읽어 이벤트 단위로 콜백을 호출합니다.
+// POST 요청이라 EventSource 대신 fetch 스트림을 직접 파싱합니다.
+async function readEventStream(res, onEvent) {
+    const reader = res.body.getReader();
+    const decoder = new TextDecoder();
+    let buffer = '';
+
+    while (true) {
+        const {value, done} = await reader.read();
+        if (done) break;
+        buffer += decoder.decode(value, {stream: true});
+
+        let sep;
+        while ((sep = buffer.indexOf('\n\n')) !== -1) {
+            const frame = buffer.slice(0, sep);
+            buffer = buffer.slice(sep + 2);
+
+            let event = 'message';
+            let data = '';
+            frame.split('\n').forEach(line => {
+                if (line.startsWith('event:')) event = line.slice(6).trim();
+                else if (line.startsWith('data:')) data += line.slice(5).trim();
+            });
+            if (data) onEvent(event, JSON.parse(data));
+        }
+    }
+}
+
+function escapeHtml(text) {
+    return text
+        .replace(/&/g, '&amp;')
+        .replace(/</g, '&lt;')
+        .replace(/>/g, '&gt;');
+}
@@ -0,0 +1,8 @@
+"""
+저장소 디렉터리가 moodping 패키지 자체이므로, 그 상위 디렉터리를 import 경로에 넣어 `moodping.` 절대 import 를 씁니다.
+체크아웃 디렉터리 이름이 moodping 이어야 합니다 (심볼릭 링크도 됨).
+"""
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).absolute().parents[2]))
@@ -0,0 +1,176 @@
+"""
+EventSpool 동시성 테스트. DB 대신 _flush_segment 를 세그먼트 내용을 모으는 함수로 바꿔 확인합니다.
+
+- 여러 스레드가 append 하는 동안 세그먼트가 회전·적재되어도, stop() 뒤에는 모든 이벤트가 정확히 한 번 적재됩니다.
+- fsync 중에 들어온 append 들은 다음 fsync 한 번에 함께 확정되고(group commit), 그 전에는 반환하지 않습니다.
+- start() 는 자기 슬롯에 남은 세그먼트를, 플러셔는 잠금이 풀린 다른 슬롯의 세그먼트를 적재합니다.
+"""
+import asyncio
+import json
+import os
+import threading
+import time
+from pathlib import Path
+
+import pytest
+
+from moodping.config.settings import get_settings
+from moodping.event_log.spool.event_spool import EventSpool, _list_segments, _segment_path, _segment_seq
+
+
+@pytest.fixture
+def spool_settings(tmp_path, monkeypatch):
+    def configure(**values):
+        values = {"event_spool_dir": str(tmp_path), "event_spool_flush_interval_seconds": 0.02, **values}
+        for key, value in values.items():
+            monkeypatch.setenv(key.upper(), str(value))
+        get_settings.cache_clear()
+        return tmp_path
+
+    yield configure
+    get_settings.cache_clear()
+
+
+class CollectingSpool:
+    """싱글턴과 별개인 EventSpool 인스턴스. 적재한 event_id 와 세그먼트 이름을 모읍니다."""
+
+    def __init__(self, flush_delay: float = 0.0):
+        self.flush_delay = flush_delay
+        self.spool = object.__new__(EventSpool)
+        self.spool.__init__()
+        self.flushed_ids: list[str] = []
+        self.flushed_segments: list[str] = []
+        self._lock = threading.Lock()
+        self.spool._flush_segment = self._flush_segment
+
+    def _flush_segment(self, path: Path) -> None:
+        event_logs = self.spool._load_segment(path)
+        # DB 적재 시간을 흉내 내, stop() 이 진행 중인 적재와 겹치도록 합니다.
+        time.sleep(self.flush_delay)
+        with self._lock:
+            self.flushed_ids.extend(event_log.event_id for event_log in event_logs)
+            self.flushed_segments.append(f"{path.parent.name}/{path.name}")
+        path.unlink(missing_ok=True)
+
+
+def _row(event_id: str) -> dict:
+    return {
+        "event_id": event_id,
+        "session_id": "s-1",
+        "user_id": None,
+        "anon_id": "anon-1",
+        "event_name": "record_screen_view",
+        "occurred_at": "2026-03-01T12:00:00",
+        "extra_data": {"padding": "x" * 40},
+    }
+
+
+def _write_segment(slot_dir: Path, seq: int, event_ids: list[str], trailing: bytes = b"") -> None:
+    slot_dir.mkdir(parents=True, exist_ok=True)
+    lines = "".join(json.dumps(_row(event_id)) + "\n" for event_id in event_ids).encode("utf-8")
+    _segment_path(slot_dir, seq, time.time()).write_bytes(lines + trailing)
+
+
+def _start_thread(target, *args) -> threading.Thread:
+    # asyncio.to_thread 의 기본 실행기는 작업자 수가 적어 append 끼리 동시에 돌지 않을 수 있으므로 스레드를 직접 띄웁니다.
+    thread = threading.Thread(target=target, args=args, daemon=True)
+    thread.start()
+    return thread
+
+
+async def _join(threads: list[threading.Thread]) -> None:
+    while any(thread.is_alive() for thread in threads):
+        await asyncio.sleep(0.005)
+
+
+def test_concurrent_appends_are_flushed_exactly_once_across_rotations(spool_settings):
+    root = spool_settings(event_spool_segment_max_bytes=2048, event_spool_segment_max_age_seconds=60)
+    collector = CollectingSpool(flush_delay=0.01)
+    threads, batches, batch_size = 8, 60, 3
+
+    def producer(t: int) -> None:
+        for b in range(batches):
+            collector.spool.append([_row(f"t{t}-b{b}-r{r}") for r in range(batch_size)])
+
+    async def scenario() -> None:
+        collector.spool.start()
+        await _join([_start_thread(producer, t) for t in range(threads)])
+        await collector.spool.stop()
+
+    asyncio.run(scenario())
+
+    expected = sorted(f"t{t}-b{b}-r{r}" for t in range(threads) for b in range(batches) for r in range(batch_size))
+    assert sorted(collector.flushed_ids) == expected
+    assert len(collector.flushed_segments) > 5
+    assert len(set(collector.flushed_segments)) == len(collector.flushed_segments)
+    assert not list(root.glob("slot-*/*.seg"))
+
+
+def test_appends_during_fsync_share_the_next_fsync(spool_settings, monkeypatch):
+    spool_settings(event_spool_segment_max_bytes=1 << 20, event_spool_segment_max_age_seconds=60)
+    collector = CollectingSpool()
+    real_fsync = os.fsync
+    release = threading.Event()
+    fsync_calls = []
+    returned: list[str] = []
+
+    def append(event_id: str) -> None:
+        collector.spool.append([_row(event_id)])
+        returned.append(event_id)
+
+    def blocking_fsync(fd: int) -> None:
+        fsync_calls.append(fd)
+        if len(fsync_calls) == 1:
+            release.wait(timeout=5)
+        real_fsync(fd)
+
+    async def scenario() -> None:
+        collector.spool.start()
+        monkeypatch.setattr(os, "fsync", blocking_fsync)
+        appenders = [_start_thread(append, "first")]
+        while not fsync_calls:
+            await asyncio.sleep(0.001)
+        appenders += [_start_thread(append, f"rest-{i}") for i in range(5)]
+        while collector.spool._appended_seq < 6:
+            await asyncio.sleep(0.001)
+        await asyncio.sleep(0.05)
+        # 첫 fsync 가 끝나지 않았으므로 아무 append 도 반환하지 않았습니다.
+        assert returned == []
+        release.set()
+        await _join(appenders)
+        assert len(returned) == 6
+        # 첫 fsync 한 번 + 그동안 쌓인 다섯 건을 함께 확정하는 fsync 한 번
+        assert len(fsync_calls) == 2
+        monkeypatch.setattr(os, "fsync", real_fsync)
+        await collector.spool.stop()
+
+    asyncio.run(scenario())
+    assert sorted(collector.flushed_ids) == sorted(["first"] + [f"rest-{i}" for i in range(5)])
+
+
+def test_start_replays_leftover_and_orphaned_segments(spool_settings):
+    root = spool_settings(event_spool_segment_max_bytes=1 << 20, event_spool_segment_max_age_seconds=60)
+    # 이전 프로세스가 남긴 자기 슬롯 세그먼트 (마지막 줄은 쓰다 중단되어 잘림)
+    _write_segment(root / "slot-0", 7, ["own-1", "own-2"])
+    _write_segment(root / "slot-0", 8, ["own-3"], trailing=b'{"event_id": "cut')
+    # 종료된 다른 프로세스의 슬롯 (잠금 없음)
+    _write_segment(root / "slot-3", 2, ["orphan-1", "orphan-2"])
+    collector = CollectingSpool()
+
+    async def scenario() -> None:
+        collector.spool.start()
+        assert collector.spool._slot_dir == root / "slot-0"
+        # 남은 세그먼트 뒤 번호로 새 세그먼트를 열어 덮어쓰지 않습니다.
+        assert collector.spool._writer.seq == 9
+        deadline = time.monotonic() + 5
+        while len(collector.flushed_ids) < 5 and time.monotonic() < deadline:
+            await asyncio.sleep(0.01)
+        collector.spool.append([_row("new-1")])
+        await collector.spool.stop()
+
+    asyncio.run(scenario())
+
+    assert sorted(collector.flushed_ids) == ["new-1", "orphan-1", "orphan-2", "own-1", "own-2", "own-3"]
+    own_segments = [name for name in collector.flushed_segments if name.startswith("slot-0/")]
+    assert [_segment_seq(Path(name)) for name in own_segments] == sorted(_segment_seq(Path(name)) for name in own_segments)
+    assert not _list_segments(root / "slot-0") and not _list_segments(root / "slot-3")
@@ -0,0 +1,256 @@
+"""
+퍼널 지표 회귀 테스트: 새 계산(EventLogRepositoryImpl.get_funnels 의 RANGE 윈도우, session_summary 의 짝 컬럼)이
+이전 self-join 쿼리(get_record_funnel / get_analysis_funnel / get_step_funnel)와 같은 값을 내는지 확인합니다.
+
+- 순수 Python 모델: 이전 조인 조건(TIMESTAMPDIFF(MINUTE, s, c) BETWEEN 0 AND threshold)과 새 윈도우 프레임
+  (c 기준 threshold분 59초 PRECEDING ~ 59초 FOLLOWING)을 그대로 옮겨 경계 사례에서 비교합니다. 항상 실행됩니다.
+- MySQL: MOODPING_TEST_DATABASE_URL(비어 있는 테스트 전용 DB)이 있으면 같은 이벤트를 적재 경로대로 넣고
+  이전 SQL 과 실제 쿼리 결과 dict 를 비교합니다. event_log / session_summary 테이블을 지우고 다시 만듭니다.
+"""
+import os
+import random
+from collections import defaultdict
+from datetime import datetime, timedelta
+
+import pytest
+
+from moodping.event_log.domain.entity.session_summary import FUNNEL_PAIR_THRESHOLD_MINUTES, FUNNEL_STEPS
+
+THRESHOLD = FUNNEL_PAIR_THRESHOLD_MINUTES
+BASE_TIME = datetime(2026, 3, 1, 12, 0, 0)
+
+SCREEN_VIEW = "record_screen_view"
+COMPLETE = "record_complete"
+ANALYSIS_VIEW = "analysis_view"
+
+# (session_id, [(event_name, 기준 시각으로부터의 초)]) — 목록 순서가 곧 적재 순서입니다.
+FIXTURE_SESSIONS = [
+    # 같은 단계 반복: 두 번째 진입 뒤 1분 만에 완료 → 이전 쿼리는 완료로 셉니다 (첫 진입만 보면 미완료).
+    ("repeated-screen-view", [(SCREEN_VIEW, 0), (SCREEN_VIEW, 30 * 60), (COMPLETE, 31 * 60), (COMPLETE, 32 * 60)]),
+    # 첫 완료가 첫 진입보다 앞섬
+    ("complete-before-screen-view", [(COMPLETE, 0), (SCREEN_VIEW, 5 * 60), (COMPLETE, 8 * 60)]),
+    # 시간 순서와 다른 적재 순서, 완료 이전의 분석 조회
+    ("out-of-order", [(COMPLETE, 9 * 60), (ANALYSIS_VIEW, 9 * 60 + 30), (SCREEN_VIEW, 0), (ANALYSIS_VIEW, 2 * 60)]),
+    # 임계값 경계: 정확히 10분, 10분 59초(분 단위 차이 10), 11분(11)
+    ("gap-exactly-threshold", [(SCREEN_VIEW, 0), (COMPLETE, THRESHOLD * 60)]),
+    ("gap-threshold-59s", [(SCREEN_VIEW, 0), (COMPLETE, THRESHOLD * 60 + 59)]),
+    ("gap-threshold-plus-1m", [(SCREEN_VIEW, 0), (COMPLETE, THRESHOLD * 60 + 60)]),
+    # FOLLOWING 59 경계: 완료가 진입보다 59초 앞서면 분 단위 차이 0 → 짝, 60초 앞서면 -1 → 짝 아님
+    ("following-59s", [(SCREEN_VIEW, 59), (COMPLETE, 0)]),
+    ("following-60s", [(SCREEN_VIEW, 60), (COMPLETE, 0)]),
+    ("same-second", [(SCREEN_VIEW, 0), (COMPLETE, 0), (ANALYSIS_VIEW, 0)]),
+    # 분석 퍼널 쪽 PRECEDING / FOLLOWING 경계를 한 세션에서
+    ("analysis-edges", [
+        (COMPLETE, 120), (ANALYSIS_VIEW, 120 + THRESHOLD * 60), (ANALYSIS_VIEW, 120 + THRESHOLD * 60 + 59),
+        (ANALYSIS_VIEW, 120 + THRESHOLD * 60 + 60), (ANALYSIS_VIEW, 120 - 59), (ANALYSIS_VIEW, 120 - 60),
+    ]),
+    # 여러 진입 × 여러 완료 (짝마다 평균에 들어감)
+    ("many-pairs", [(SCREEN_VIEW, 0), (SCREEN_VIEW, 60), (COMPLETE, 120), (COMPLETE, 300), (SCREEN_VIEW, 400)]),
+    ("complete-only", [(COMPLETE, 0), (COMPLETE, 30)]),
+    ("other-steps", [(SCREEN_VIEW, 0), ("emoji_selected", 10), ("intensity_selected", 20), ("feedback_confirmed", 40)]),
+]
+
+_EDGE_OFFSETS = [0, 1, 58, 59, 60, 61, THRESHOLD * 60 - 1, THRESHOLD * 60, THRESHOLD * 60 + 59, THRESHOLD * 60 + 60]
+
+
+def _random_sessions(count: int, seed: int = 7) -> list[tuple[str, list[tuple[str, int]]]]:
+    rng = random.Random(seed)
+    names = [SCREEN_VIEW, COMPLETE, ANALYSIS_VIEW, "emoji_selected", "feedback_confirmed"]
+    sessions = []
+    for i in range(count):
+        anchor = rng.randint(0, 3600)
+        events = []
+        for _ in range(rng.randint(1, 8)):
+            offset = rng.choice(_EDGE_OFFSETS) * rng.choice([1, -1]) if rng.random() < 0.7 else rng.randint(-1800, 1800)
+            events.append((rng.choice(names), anchor + offset))
+        sessions.append((f"random-{i:04d}", events))
+    return sessions
+
+
+def _events(sessions) -> list[tuple[str, str, datetime]]:
+    return [
+        (session_id, event_name, BASE_TIME + timedelta(seconds=offset))
+        for session_id, session_events in sessions
+        for event_name, offset in session_events
+    ]
+
+
+# ── 순수 Python 모델 ────────────────────────────────────────────────
+
+def _timestampdiff_minutes(start: datetime, end: datetime) -> int:
+    """MySQL TIMESTAMPDIFF(MINUTE, start, end): 0 쪽으로 잘린 분 단위 차이."""
+    return int((end - start).total_seconds() / 60)
+
+
+def _funnel(start_sessions: set, completed_sessions: set, pair_seconds: list[float]) -> tuple:
+    drop_rate = 0.0 if not start_sessions else 1.0 - len(completed_sessions) / len(start_sessions)
+    avg_minutes = sum(pair_seconds) / len(pair_seconds) / 60.0 if pair_seconds else 0.0
+    return len(start_sessions), len(completed_sessions), round(drop_rate, 4), round(avg_minutes, 2)
+
+
+def baseline_model(events, threshold: int) -> dict:
+    """이전 self-join 쿼리: 시작 행 s 마다 같은 세션의 도착 행 c 를 조인 조건으로 붙입니다."""
+    def pair_funnel(start_name: str, arrival_name: str) -> tuple:
+        starts = [(sid, at) for sid, name, at in events if name == start_name]
+        arrivals = [(sid, at) for sid, name, at in events if name == arrival_name]
+        joined = [
+            (s_sid, (c_at - s_at).total_seconds())
+            for s_sid, s_at in starts
+            for c_sid, c_at in arrivals
+            if s_sid == c_sid and 0 <= _timestampdiff_minutes(s_at, c_at) <= threshold
+        ]
+        return _funnel({sid for sid, _ in starts}, {sid for sid, _ in joined}, [seconds for _, seconds in joined])
+
+    steps = {step: len({sid for sid, name, _ in events if name == step}) for step in FUNNEL_STEPS}
+    return {
+        "record_funnel": pair_funnel(SCREEN_VIEW, COMPLETE),
+        "analysis_funnel": pair_funnel(COMPLETE, ANALYSIS_VIEW),
+        "steps": steps,
+    }
+
+
+def windowed_model(events, threshold: int) -> dict:
+    """
+    새 쿼리: 세션별 시각순 RANGE 윈도우 (도착 행 ts 기준 ts - (threshold*60+59) ~ ts + 59) 안의 시작 행 수와 시각 합으로
+    짝 수·소요 초 합을 구하고, 짝이 하나라도 있는 세션을 완료로 셉니다.
+    """
+    preceding = threshold * 60 + 59
+    by_session = defaultdict(list)
+    for sid, name, at in events:
+        by_session[sid].append((name, int((at - BASE_TIME).total_seconds())))
+
+    def pair_funnel(start_name: str, arrival_name: str) -> tuple:
+        start_sessions, completed_sessions, pair_seconds = set(), set(), []
+        for sid, rows in by_session.items():
+            if any(name == start_name for name, _ in rows):
+                start_sessions.add(sid)
+            for name, ts in rows:
+                if name != arrival_name:
+                    continue
+                frame = [s_ts for s_name, s_ts in rows if s_name == start_name and ts - preceding <= s_ts <= ts + 59]
+                if frame:
+                    completed_sessions.add(sid)
+                    pair_seconds.extend(ts - s_ts for s_ts in frame)
+        return _funnel(start_sessions, completed_sessions, pair_seconds)
+
+    steps = {step: sum(1 for rows in by_session.values() if any(name == step for name, _ in rows)) for step in FUNNEL_STEPS}
+    return {
+        "record_funnel": pair_funnel(SCREEN_VIEW, COMPLETE),
+        "analysis_funnel": pair_funnel(COMPLETE, ANALYSIS_VIEW),
+        "steps": steps,
+    }
+
+
+@pytest.mark.parametrize("session_id, session_events", FIXTURE_SESSIONS, ids=[s[0] for s in FIXTURE_SESSIONS])
+def test_window_model_matches_self_join_per_session(session_id, session_events):
+    events = _events([(session_id, session_events)])
+    assert windowed_model(events, THRESHOLD) == baseline_model(events, THRESHOLD)
+
+
+@pytest.mark.parametrize("threshold", [0, 1, THRESHOLD])
+def test_window_model_matches_self_join_on_mixed_sessions(threshold):
+    events = _events(FIXTURE_SESSIONS + _random_sessions(400))
+    assert windowed_model(events, threshold) == baseline_model(events, threshold)
+
+
+def test_repeated_step_session_counts_as_completed():
+    events = _events([FIXTURE_SESSIONS[0]])
+    assert baseline_model(events, THRESHOLD)["record_funnel"][:2] == (1, 1)
+
+
+# ── MySQL: 실제 쿼리끼리 비교 ────────────────────────────────────────
+
+MYSQL_URL = os.environ.get("MOODPING_TEST_DATABASE_URL")
+
+# 변경 전 EventLogRepositoryImpl 의 쿼리 그대로
+BASELINE_RECORD_FUNNEL_SQL = """
+    SELECT
+        COUNT(DISTINCT s.session_id) AS record_start_count,
+        COUNT(DISTINCT c.session_id) AS record_complete_count,
+        ROUND(CASE WHEN COUNT(DISTINCT s.session_id) = 0 THEN 0
+             ELSE 1.0 - COUNT(DISTINCT c.session_id) * 1.0 / COUNT(DISTINCT s.session_id) END, 4) AS record_drop_rate,
+        ROUND(COALESCE(AVG(CASE WHEN c.session_id IS NOT NULL
+             THEN TIMESTAMPDIFF(SECOND, s.occurred_at, c.occurred_at) END) / 60.0, 0), 2) AS avg_record_duration_minutes
+    FROM event_log s
+    LEFT JOIN event_log c ON s.session_id = c.session_id AND c.event_name = 'record_complete'
+        AND TIMESTAMPDIFF(MINUTE, s.occurred_at, c.occurred_at) BETWEEN 0 AND :threshold
+    WHERE s.event_name = 'record_screen_view'
+"""
+
+BASELINE_ANALYSIS_FUNNEL_SQL = """
+    SELECT
+        COUNT(DISTINCT rc.session_id) AS record_complete_count,
+        COUNT(DISTINCT av.session_id) AS analysis_view_count,
+        ROUND(CASE WHEN COUNT(DISTINCT rc.session_id) = 0 THEN 0
+             ELSE 1.0 - COUNT(DISTINCT av.session_id) * 1.0 / COUNT(DISTINCT rc.session_id) END, 4) AS analysis_drop_rate,
+        ROUND(COALESCE(AVG(CASE WHEN av.session_id IS NOT NULL
+             THEN TIMESTAMPDIFF(SECOND, rc.occurred_at, av.occurred_at) END) / 60.0, 0), 2) AS avg_analysis_duration_minutes
+    FROM event_log rc
+    LEFT JOIN event_log av ON rc.session_id = av.session_id AND av.event_name = 'analysis_view'
+        AND TIMESTAMPDIFF(MINUTE, rc.occurred_at, av.occurred_at) BETWEEN 0 AND :threshold
+    WHERE rc.event_name = 'record_complete'
+"""
+
+BASELINE_STEP_FUNNEL_SQL = """
+    SELECT event_name, COUNT(DISTINCT session_id) AS sessions
+    FROM event_log WHERE event_name IN :step_names GROUP BY event_name
+"""
+
+
+def _baseline_funnels(session, threshold: int) -> dict:
+    from sqlalchemy import bindparam, text
+    from moodping.event_log.repository.event_log_repository_impl import build_step_funnel, safe_funnel_row
+
+    record_row = session.execute(text(BASELINE_RECORD_FUNNEL_SQL), {"threshold": threshold}).mappings().first()
+    analysis_row = session.execute(text(BASELINE_ANALYSIS_FUNNEL_SQL), {"threshold": threshold}).mappings().first()
+    step_rows = session.execute(
+        text(BASELINE_STEP_FUNNEL_SQL).bindparams(bindparam("step_names", expanding=True)),
+        {"step_names": FUNNEL_STEPS},
+    ).mappings().all()
+    return {
+        "record_funnel": safe_funnel_row(
+            record_row, "record_start_count", "record_complete_count", "record_drop_rate", "avg_record_duration_minutes",
+        ),
+        "analysis_funnel": safe_funnel_row(
+            analysis_row, "record_complete_count", "analysis_view_count", "analysis_drop_rate", "avg_analysis_duration_minutes",
+        ),
+        "step_funnel": build_step_funnel(FUNNEL_STEPS, {row["event_name"]: int(row["sessions"]) for row in step_rows}),
+    }
+
+
+@pytest.mark.skipif(not MYSQL_URL, reason="MOODPING_TEST_DATABASE_URL 이 없으면 MySQL 비교를 건너뜁니다.")
+def test_mysql_funnels_match_baseline_queries():
+    from sqlalchemy import create_engine
+    from sqlalchemy.orm import Session
+
+    from moodping.config.mysql_config import Base
+    from moodping.event_log.domain.entity.event_log import EventLog
+    from moodping.event_log.domain.entity.session_summary import SessionSummary
+    from moodping.event_log.repository.event_log_repository_impl import EventLogRepositoryImpl
+    from moodping.event_log.repository.session_summary_repository_impl import SessionSummaryRepositoryImpl
+
+    engine = create_engine(MYSQL_URL)
+    tables = [EventLog.__table__, SessionSummary.__table__]
+    Base.metadata.drop_all(engine, tables=tables)
+    Base.metadata.create_all(engine, tables=tables)
+    try:
+        event_logs = [
+            EventLog.create(event_id=f"e-{i}", session_id=session_id, event_name=event_name, occurred_at=occurred_at)
+            for i, (session_id, event_name, occurred_at) in enumerate(_events(FIXTURE_SESSIONS + _random_sessions(300)))
+        ]
+        summary_repository = SessionSummaryRepositoryImpl.get_instance()
+        with Session(engine) as session:
+            # 적재 경로처럼 청크마다 event_log 저장 후 같은 트랜잭션에서 요약을 갱신합니다 (세션이 여러 청크에 걸침).
+            for start in range(0, len(event_logs), 37):
+                chunk = event_logs[start:start + 37]
+                session.add_all(chunk)
+                session.flush()
+                summary_repository.upsert_from_events(session, chunk)
+            session.commit()
+
+            expected = _baseline_funnels(session, THRESHOLD)
+            assert EventLogRepositoryImpl.get_instance().get_funnels(session, THRESHOLD, FUNNEL_STEPS) == expected
+            assert summary_repository.get_funnels(session, THRESHOLD, FUNNEL_STEPS) == expected
+    finally:
+        Base.metadata.drop_all(engine, tables=tables)
+        engine.dispose()
@@ -0,0 +1,108 @@
+"""
+AnalysisTextExtractor 표 테스트. 같은 LLM 출력을 1/2/3/7글자 청크와 통째로 나눠 넣어도 결과가 같아야 합니다.
+키를 찾지 못한 출력은 MoodAnalysisServiceImpl._finish_extraction 이 기존 파서(_parse_analysis_text)로 넘깁니다.
+"""
+import pytest
+
+from moodping.mood_analysis.parser.analysis_text_extractor import AnalysisTextExtractor
+from moodping.mood_analysis.service.mood_analysis_service_impl import MoodAnalysisServiceImpl
+
+CHUNK_SIZES = [1, 2, 3, 7, None]  # None: 한 번에
+
+# (이름, LLM 출력, max_chars, 기대 본문, 잘림 여부)
+CASES = [
+    ("plain", '{"analysis_text": "오늘 하루 고생했어요."}', 100, "오늘 하루 고생했어요.", False),
+    ("whitespace_around_colon", '{"analysis_text"  :\n  "hi"}', 100, "hi", False),
+    ("code_fence_and_preamble", '분석입니다.\n```json\n{"analysis_text": "ok"}\n```', 100, "ok", False),
+    ("newline_escape", '{"analysis_text": "첫 줄\\n둘째 줄"}', 100, "첫 줄\n둘째 줄", False),
+    ("quote_escape", '{"analysis_text": "그는 \\"괜찮아\\"라고 했다"}', 100, '그는 "괜찮아"라고 했다', False),
+    ("backslash_and_simple_escapes", '{"analysis_text": "a\\\\b\\/c\\td\\re"}', 100, "a\\b/c\td\re", False),
+    ("unicode_escape", '{"analysis_text": "\\uc548\\ub155"}', 100, "안녕", False),
+    ("unknown_escape_kept_as_char", '{"analysis_text": "\\x"}', 100, "x", False),
+    ("invalid_unicode_escape_kept_raw", '{"analysis_text": "\\uZZZZ!"}', 100, "\\uZZZZ!", False),
+    ("surrogate_pair", '{"analysis_text": "웃음 \\ud83d\\ude00 끝"}', 100, "웃음 😀 끝", False),
+    ("raw_emoji", '{"analysis_text": "😀"}', 100, "😀", False),
+    ("text_after_closing_quote_ignored", '{"analysis_text": "done", "extra": "무시"}', 100, "done", False),
+    ("cap_exact", '{"analysis_text": "abcde"}', 5, "abcde", True),
+    ("cap_truncates", '{"analysis_text": "abcdefgh"}', 5, "abcde", True),
+    ("cap_counts_escape_as_one_char", '{"analysis_text": "ab\\ncdef"}', 4, "ab\nc", True),
+    ("cap_counts_surrogate_pair_as_one_char", '{"analysis_text": "abcd\\ud83d\\ude00e"}', 5, "abcd😀", True),
+    ("unterminated", '{"analysis_text": "생성 중 끊김', 100, "생성 중 끊김", False),
+    # 짝이 맞지 않는 서로게이트는 버립니다 (UTF-8 로 저장할 수 없음).
+    ("lone_high_surrogate_dropped", '{"analysis_text": "a\\ud83db"}', 100, "ab", False),
+    ("lone_high_surrogate_at_end_dropped", '{"analysis_text": "a\\ud83d"}', 100, "a", False),
+    ("lone_low_surrogate_dropped", '{"analysis_text": "a\\ude00b"}', 100, "ab", False),
+    ("high_not_paired_across_chars", '{"analysis_text": "\\ud83dab\\ude00"}', 100, "ab", False),
+    ("high_then_unicode_escape", '{"analysis_text": "\\ud83d\\u0041"}', 100, "A", False),
+]
+
+
+def _chunks(text: str, size: int | None) -> list[str]:
+    if size is None:
+        return [text]
+    return [text[i:i + size] for i in range(0, len(text), size)]
+
+
+def _run(output: str, max_chars: int, size: int | None) -> tuple[AnalysisTextExtractor, str]:
+    extractor = AnalysisTextExtractor(max_chars=max_chars)
+    deltas = []
+    for chunk in _chunks(output, size):
+        deltas.append(extractor.feed(chunk))
+        if extractor.done:
+            break
+    return extractor, "".join(deltas)
+
+
+@pytest.mark.parametrize("size", CHUNK_SIZES, ids=lambda size: f"chunk{size or 'all'}")
+@pytest.mark.parametrize("name, output, max_chars, expected, truncated", CASES, ids=[case[0] for case in CASES])
+def test_extracts_analysis_text(name, output, max_chars, expected, truncated, size):
+    extractor, streamed = _run(output, max_chars, size)
+    assert extractor.found
+    assert streamed == expected
+    assert extractor.text == expected
+    assert extractor.truncated is truncated
+    assert extractor.result() == expected
+
+
+@pytest.mark.parametrize("size", CHUNK_SIZES, ids=lambda size: f"chunk{size or 'all'}")
+def test_done_after_closing_quote_ignores_further_chunks(size):
+    extractor, _ = _run('{"analysis_text": "ok"}', 100, size)
+    assert extractor.done
+    assert extractor.feed('{"analysis_text": "again"}') == ""
+    assert extractor.text == "ok"
+
+
+def test_done_at_cap_before_closing_quote():
+    extractor = AnalysisTextExtractor(max_chars=3)
+    assert extractor.feed('{"analysis_text": "abcdef') == "abc"
+    assert extractor.done and extractor.truncated
+    assert extractor.feed('ghi"}') == ""
+
+
+@pytest.mark.parametrize("output", ['{"analysis_text": ""}', '{"analysis_text": "   "}'])
+def test_blank_text_is_no_result(output):
+    extractor, _ = _run(output, 100, None)
+    assert extractor.found
+    assert extractor.result() is None
+
+
+# (이름, LLM 출력, _parse_analysis_text 결과)
+FALLBACK_CASES = [
+    ("plain_text_answer", "그냥 평문으로 답했어요.", "그냥 평문으로 답했어요."),
+    ("escaped_key", '{\\"analysis_text\\": \\"x\\"}', '{\\"analysis_text\\": \\"x\\"}'),
+    ("other_key_json", '{"text": "다른 키"}', None),
+    ("empty", "", None),
+]
+
+
+@pytest.mark.parametrize("size", CHUNK_SIZES, ids=lambda size: f"chunk{size or 'all'}")
+@pytest.mark.parametrize("name, output, expected", FALLBACK_CASES, ids=[case[0] for case in FALLBACK_CASES])
+def test_falls_back_to_parser_when_key_never_appears(name, output, expected, size):
+    extractor, streamed = _run(output, 100, size)
+    assert not extractor.found
+    assert streamed == ""
+    assert extractor.result() is None
+    assert extractor.raw == output
+    service = MoodAnalysisServiceImpl.get_instance()
+    assert service._finish_extraction(extractor) == expected
+    assert service._finish_extraction(extractor) == MoodAnalysisServiceImpl._parse_analysis_text(output)